@@ -5,6 +5,8 @@ from clients.grpc.gateway.cards.client import CardsGatewayGRPCClient, build_card
 from clients.grpc.gateway.documents.client import DocumentsGatewayGRPCClient, build_documents_gateway_locust_grpc_client
 from clients.grpc.gateway.operations.client import OperationsGatewayGRPCClient, build_operations_gateway_locust_grpc_client
 from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, build_users_gateway_locust_grpc_client
+from seeds.recorder import attach_seeds_recorder
+from tools.rng import get_random
 
 
 class GatewayGRPCTaskSet(TaskSet):
@@ -29,6 +31,21 @@ class GatewayGRPCTaskSet(TaskSet):
         self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
         self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
 
+        # Entities created by the scenario are recorded as seeding data if the scenario has set up a recorder
+        attach_seeds_recorder(
+            self.user.environment,
+            self.users_gateway_client,
+            self.cards_gateway_client,
+            self.accounts_gateway_client,
+            self.operations_gateway_client
+        )
+
+    def get_next_task(self):
+        """
+        Picks the next task from the virtual user random stream, so task selection is reproducible.
+        """
+        return get_random().choice(self.tasks)
+
 
 class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
     """
@@ -50,3 +67,12 @@ class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
         self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
         self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
         self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
+
+        # Entities created by the scenario are recorded as seeding data if the scenario has set up a recorder
+        attach_seeds_recorder(
+            self.user.environment,
+            self.users_gateway_client,
+            self.cards_gateway_client,
+            self.accounts_gateway_client,
+            self.operations_gateway_client
+        )
@@ -3,11 +3,14 @@ import time
 from grpc import UnaryUnaryClientInterceptor, RpcError
 from locust.env import Environment
 
+from tools.locust.tags import get_stats_name
+
 
 class LocustInterceptor(UnaryUnaryClientInterceptor):
     """
     gRPC-interceptor to collect metrics for Locust.
     Used to measure request-response time and register request success/errors.
+    Requests made within a `stats_tag` block are registered under the tagged method name.
     """
 
     def __init__(self, environment: Environment):
@@ -44,7 +47,7 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
 
         # Register request in Locust metrics system
         self.environment.events.request.fire(
-            name=client_call_details.method,  # Method name (i.e. '/users.UsersService/CreateUser')
+            name=get_stats_name(client_call_details.method),  # Method name (i.e. '/users.UsersService/CreateUser')
             request_type='gRPC',
             context=None,  # Used to pass custom data
             response_time=response_time,
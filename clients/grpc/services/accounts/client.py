@@ -0,0 +1,119 @@
+from grpc import Channel
+
+from clients.grpc.client import GRPCClient
+from clients.grpc.services.client import build_service_grpc_client
+from config import settings
+from contracts.services.accounts.account_pb2 import AccountStatus, AccountType
+from contracts.services.accounts.accounts_service_pb2_grpc import AccountsServiceStub
+from contracts.services.accounts.rpc_create_account_pb2 import CreateAccountRequest, CreateAccountResponse
+from contracts.services.accounts.rpc_get_account_pb2 import GetAccountRequest, GetAccountResponse
+from contracts.services.accounts.rpc_get_accounts_pb2 import GetAccountsRequest, GetAccountsResponse
+from contracts.services.accounts.rpc_update_account_balance_pb2 import (
+    UpdateAccountBalanceRequest,
+    UpdateAccountBalanceResponse
+)
+
+
+class AccountsServiceGRPCClient(GRPCClient):
+    """
+    gRPC-client to communicate with internal AccountsService directly, bypassing the gateway.
+    Provides high-level methods to get and create accounts and to update account balance.
+    """
+
+    def __init__(self, channel: Channel):
+        super().__init__(channel)
+        self.stub = AccountsServiceStub(channel)
+
+    def get_account_api(self, request: GetAccountRequest) -> GetAccountResponse:
+        """
+        Low-level GetAccount method call via gRPC.
+
+        :param request: gRPC-request with account ID.
+        :return: Response from the service with the account data.
+        """
+        return self.stub.GetAccount(request)
+
+    def get_accounts_api(self, request: GetAccountsRequest) -> GetAccountsResponse:
+        """
+        Low-level GetAccounts method call via gRPC.
+
+        :param request: gRPC-request with user ID.
+        :return: Response from the service with the user accounts.
+        """
+        return self.stub.GetAccounts(request)
+
+    def create_account_api(self, request: CreateAccountRequest) -> CreateAccountResponse:
+        """
+        Low-level CreateAccount method call via gRPC.
+
+        :param request: gRPC-request with a new account data.
+        :return: Response from the service with created account data.
+        """
+        return self.stub.CreateAccount(request)
+
+    def update_account_balance_api(self, request: UpdateAccountBalanceRequest) -> UpdateAccountBalanceResponse:
+        """
+        Low-level UpdateAccountBalance method call via gRPC.
+
+        :param request: gRPC-request with account ID and a new balance.
+        :return: Response from the service with updated account data.
+        """
+        return self.stub.UpdateAccountBalance(request)
+
+    def get_account(self, account_id: str) -> GetAccountResponse:
+        """
+        Gets the account.
+
+        :param account_id: ID of the account.
+        :return: Response with the account data.
+        """
+        request = GetAccountRequest(id=account_id)
+        return self.get_account_api(request)
+
+    def get_accounts(self, user_id: str) -> GetAccountsResponse:
+        """
+        Gets all the accounts of the user.
+
+        :param user_id: ID of the user.
+        :return: Response with the user accounts.
+        """
+        request = GetAccountsRequest(user_id=user_id)
+        return self.get_accounts_api(request)
+
+    def create_account(self, user_id: str, account_type: AccountType.ValueType) -> CreateAccountResponse:
+        """
+        Creates an active account with zero balance.
+        Unlike the gateway, the service doesn't issue a card for a card account, see CardsServiceGRPCClient.
+
+        :param user_id: ID of the user.
+        :param account_type: Type of the account, i.e. ACCOUNT_TYPE_DEBIT_CARD.
+        :return: Response with newly created account data.
+        """
+        request = CreateAccountRequest(
+            type=account_type,
+            status=AccountStatus.ACCOUNT_STATUS_ACTIVE,
+            user_id=user_id,
+            balance=0.0
+        )
+        return self.create_account_api(request)
+
+    def update_account_balance(self, account_id: str, balance: float) -> UpdateAccountBalanceResponse:
+        """
+        Sets account balance.
+
+        :param account_id: ID of the account.
+        :param balance: New balance of the account.
+        :return: Response with updated account data.
+        """
+        request = UpdateAccountBalanceRequest(balance=balance, account_id=account_id)
+        return self.update_account_balance_api(request)
+
+
+def build_accounts_service_grpc_client() -> AccountsServiceGRPCClient:
+    """
+    A factory method to get an instance of AccountsServiceGRPCClient.
+
+    :return: Initialized client for AccountsService.
+    """
+    channel = build_service_grpc_client('ACCOUNTS_GRPC_CLIENT', settings.accounts_grpc_client)
+    return AccountsServiceGRPCClient(channel=channel)
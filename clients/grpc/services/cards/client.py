@@ -0,0 +1,80 @@
+from grpc import Channel
+
+from clients.grpc.client import GRPCClient
+from clients.grpc.services.client import build_service_grpc_client
+from config import settings
+from contracts.services.cards.card_pb2 import CardPaymentSystem, CardStatus, CardType
+from contracts.services.cards.cards_service_pb2_grpc import CardsServiceStub
+from contracts.services.cards.rpc_create_card_pb2 import CreateCardRequest, CreateCardResponse
+from contracts.services.cards.rpc_get_cards_pb2 import GetCardsRequest, GetCardsResponse
+from tools.fakers import fake
+
+
+class CardsServiceGRPCClient(GRPCClient):
+    """
+    gRPC-client to communicate with internal CardsService directly, bypassing the gateway.
+    Provides high-level methods to get and create cards.
+    """
+
+    def __init__(self, channel: Channel):
+        super().__init__(channel)
+        self.stub = CardsServiceStub(channel)
+
+    def get_cards_api(self, request: GetCardsRequest) -> GetCardsResponse:
+        """
+        Low-level GetCards method call via gRPC.
+
+        :param request: gRPC-request with account ID.
+        :return: Response from the service with the account cards.
+        """
+        return self.stub.GetCards(request)
+
+    def create_card_api(self, request: CreateCardRequest) -> CreateCardResponse:
+        """
+        Low-level CreateCard method call via gRPC.
+
+        :param request: gRPC-request with a new card data.
+        :return: Response from the service with created card data.
+        """
+        return self.stub.CreateCard(request)
+
+    def get_cards(self, account_id: str) -> GetCardsResponse:
+        """
+        Gets all the cards of the account.
+
+        :param account_id: ID of the account.
+        :return: Response with the account cards.
+        """
+        request = GetCardsRequest(account_id=account_id)
+        return self.get_cards_api(request)
+
+    def create_card(self, account_id: str, card_type: CardType.ValueType) -> CreateCardResponse:
+        """
+        Creates an active card with fake data for the account.
+
+        :param account_id: ID of the account.
+        :param card_type: Type of the card, i.e. CARD_TYPE_VIRTUAL.
+        :return: Response with newly created card data.
+        """
+        request = CreateCardRequest(
+            pin=fake.pin(),
+            cvv=fake.cvv(),
+            type=card_type,
+            status=CardStatus.CARD_STATUS_ACTIVE,
+            account_id=account_id,
+            card_number=fake.card_number(),
+            card_holder=fake.full_name(),
+            expiry_date=fake.card_expiry_date(),
+            payment_system=fake.proto_enum(CardPaymentSystem)
+        )
+        return self.create_card_api(request)
+
+
+def build_cards_service_grpc_client() -> CardsServiceGRPCClient:
+    """
+    A factory method to get an instance of CardsServiceGRPCClient.
+
+    :return: Initialized client for CardsService.
+    """
+    channel = build_service_grpc_client('CARDS_GRPC_CLIENT', settings.cards_grpc_client)
+    return CardsServiceGRPCClient(channel=channel)
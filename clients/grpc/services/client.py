@@ -0,0 +1,19 @@
+from grpc import Channel, insecure_channel
+
+from tools.config.grpc import GRPCClientConfig
+
+
+def build_service_grpc_client(name: str, config: GRPCClientConfig | None) -> Channel:
+    """
+    Factory function(builder) to create a gRPC-channel to an internal service bypassing the gateway.
+
+    :param name: Name of the service settings section, i.e. USERS_GRPC_CLIENT. Is used in the error message only.
+    :param config: Connection settings of the service.
+    :return: gRPC-channel to the service.
+    :raises ValueError: If the service connection settings are missing.
+    """
+    if config is None:
+        raise ValueError(f'{name} settings are required to call the internal service directly')
+
+    # Create unsafe (non-TLS) connection with the internal gRPC-server
+    return insecure_channel(config.client_url)
@@ -0,0 +1,67 @@
+from grpc import Channel
+
+from clients.grpc.client import GRPCClient
+from clients.grpc.services.client import build_service_grpc_client
+from config import settings
+from contracts.services.operations.operation_pb2 import OperationStatus, OperationType
+from contracts.services.operations.operations_service_pb2_grpc import OperationsServiceStub
+from contracts.services.operations.rpc_create_operation_pb2 import CreateOperationRequest, CreateOperationResponse
+from tools.fakers import fake
+
+
+class OperationsServiceGRPCClient(GRPCClient):
+    """
+    gRPC-client to communicate with internal OperationsService directly, bypassing the gateway.
+    Provides high-level methods to create operations.
+    """
+
+    def __init__(self, channel: Channel):
+        super().__init__(channel)
+        self.stub = OperationsServiceStub(channel)
+
+    def create_operation_api(self, request: CreateOperationRequest) -> CreateOperationResponse:
+        """
+        Low-level CreateOperation method call via gRPC.
+
+        :param request: gRPC-request with a new operation data.
+        :return: Response from the service with created operation data.
+        """
+        return self.stub.CreateOperation(request)
+
+    def create_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            operation_type: OperationType.ValueType,
+            amount: float
+    ) -> CreateOperationResponse:
+        """
+        Creates a completed operation backdated to a random moment within the last year.
+        Account balance is set separately, see AccountsServiceGRPCClient.update_account_balance.
+
+        :param card_id: ID of the card.
+        :param account_id: ID of the account.
+        :param operation_type: Type of the operation, i.e. OPERATION_TYPE_TOP_UP.
+        :param amount: Amount of the operation.
+        :return: Response with newly created operation data.
+        """
+        request = CreateOperationRequest(
+            type=operation_type,
+            status=OperationStatus.OPERATION_STATUS_COMPLETED,
+            amount=amount,
+            card_id=card_id,
+            category=fake.category(),
+            created_at=fake.past_date_time(),
+            account_id=account_id
+        )
+        return self.create_operation_api(request)
+
+
+def build_operations_service_grpc_client() -> OperationsServiceGRPCClient:
+    """
+    A factory method to get an instance of OperationsServiceGRPCClient.
+
+    :return: Initialized client for OperationsService.
+    """
+    channel = build_service_grpc_client('OPERATIONS_GRPC_CLIENT', settings.operations_grpc_client)
+    return OperationsServiceGRPCClient(channel=channel)
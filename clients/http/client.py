@@ -2,6 +2,8 @@ from typing import Any, TypedDict
 
 from httpx import Client, QueryParams, Response, URL
 
+from clients.http.gevent_session import GeventHTTPSession
+
 
 class HTTPClientExtensions(TypedDict, total=False):
     route: str
@@ -9,12 +11,12 @@ class HTTPClientExtensions(TypedDict, total=False):
 
 class HTTPClient:
     """
-    Base HTTP API client, takes httpx.Client.
+    Base HTTP API client, takes httpx.Client (or its lightweight replacement GeventHTTPSession).
 
     :param client: httpx.Client instance to make HTTP-requests
     """
 
-    def __init__(self, client: Client):
+    def __init__(self, client: Client | GeventHTTPSession):
         self.client = client
 
     def get(
@@ -1,30 +1,118 @@
 import time
+from typing import Any, Callable
 
 from httpx import HTTPError, HTTPStatusError, Request, Response
 from locust.env import Environment
 
+from tools.locust.stats import get_custom_stats
+from tools.locust.tags import get_stats_name
+
+
+# Request phases reported as separate Locust request types: phase name and the trace events it starts and ends with.
+# httpcore resolves the host name while connecting, so DNS lookup is a part of CONNECT;
+# WAIT is time to first byte: from the request being sent till the response headers being received
+HTTP_REQUEST_PHASES = (
+    ('CONNECT', 'connection.connect_tcp.started', 'connection.connect_tcp.complete'),
+    ('TLS', 'connection.start_tls.started', 'connection.start_tls.complete'),
+    ('WRITE', '{protocol}.send_request_headers.started', '{protocol}.send_request_body.complete'),
+    ('WAIT', '{protocol}.send_request_body.complete', '{protocol}.receive_response_headers.complete'),
+    ('DOWNLOAD', '{protocol}.receive_response_body.started', '{protocol}.receive_response_body.complete'),
+)
+
+
+def build_phases_trace(events: dict[str, float]) -> Callable[[str, dict[str, Any]], None]:
+    """
+    Builds httpcore trace extension storing the moment of every traced event of the request in `events`.
+    The first traced event is the moment the request got a connection from the pool:
+    either establishing of a new connection or sending of the request headers over a kept-alive one.
+
+    :param events: Dict the moments are stored in, by the event name (i.e. 'http11.send_request_headers.started').
+    :return: Trace callback to be passed in `extensions['trace']`.
+    """
+
+    def trace(event_name: str, info: dict[str, Any]) -> None:
+        if event_name not in events:
+            events[event_name] = time.perf_counter()
+
+    return trace
+
+
+def get_pool_wait_time(events: dict[str, float], start_time: float) -> float | None:
+    """
+    :param events: Moments of the traced events of the request (see `build_phases_trace`).
+    :param start_time: Moment the request was started.
+    :return: Time (in ms) the request waited for a free connection in the pool, None if nothing was traced.
+    """
+    if not events:
+        return None
+
+    return (next(iter(events.values())) - start_time) * 1000
+
+
+def get_request_phases(events: dict[str, float], protocol: str) -> list[tuple[str, float]]:
+    """
+    :param events: Moments of the traced events of the request (see `build_phases_trace`).
+    :param protocol: Prefix of the protocol trace events, 'http11' or 'http2'.
+    :return: Names and durations (in ms) of the request phases which took place,
+             i.e. CONNECT and TLS are skipped for requests sent over kept-alive connections.
+    """
+    phases = []
+    for phase, started, completed in HTTP_REQUEST_PHASES:
+        started_time = events.get(started.format(protocol=protocol))
+        completed_time = events.get(completed.format(protocol=protocol))
+        if started_time is not None and completed_time is not None:
+            phases.append((phase, (completed_time - started_time) * 1000))
+
+    return phases
+
 
 def locust_request_event_hook(request: Request) -> None:
     """
     httpx event hook; is invoked before sending a request.
 
-    Stores current timestamp in `request.extensions['start_time']`
-    to evaluate response time further.
+    Stores current timestamp in `request.extensions['start_time']` to evaluate response time further.
     """
     request.extensions['start_time'] = time.perf_counter()
 
 
-def locust_response_event_hook(environment: Environment):
+def locust_trace_event_hook(request: Request) -> None:
+    """
+    httpx event hook; is invoked before sending a request after `locust_request_event_hook`.
+
+    Traces the request phases in `request.extensions['trace_events']` (see `build_phases_trace`).
+    """
+    request.extensions['trace_events'] = {}
+    request.extensions['trace'] = build_phases_trace(request.extensions['trace_events'])
+
+
+def locust_response_event_hook(environment: Environment, phases: bool = False):
     """
     Returns a httpx event hook which is invoked after getting a response.
 
     Uses `request.extensions['start_time']` to evaluate response time.
     Extracts route from `request.extensions['route']` if was passed.
+    Appends the stats tag of the current block to the request name (see `stats_tag`).
+    Requests served over HTTP/2 are reported as 'HTTP2' requests, so they don't mix with HTTP/1.1 ones.
     Sends gathered metrics to `environment.events.request` so that Locust can aggregate statistics.
 
+    Time the requests traced by `locust_trace_event_hook` waited for a free connection in the pool is added
+    to the 'http_pool' custom statistics (see `CustomStats`) as 'HTTP_POOL_WAIT' by the request name,
+    so saturation of the client pool isn't mistaken for slowness of the server.
+
+    With `phases` enabled, the other phases of the traced requests are added to the 'http_phases' custom statistics,
+    by the request name and the phase (see `HTTP_REQUEST_PHASES`): 'HTTP_CONNECT' and 'HTTP_TLS'
+    for establishing a new connection, 'HTTP_WRITE' for sending the request,
+    'HTTP_WAIT' for time to first byte and 'HTTP_DOWNLOAD' for reading the response body
+    (the body is read after the response time is taken, so the download is only reported as a phase).
+    So a latency spike can be attributed to the client pool, to connection establishment or to the server.
+    Custom statistics aren't Locust requests, so they don't change request counts and RPS of the test.
+
     :param environment: Locust environment object through which the metrics are sent.
+    :param phases: Report the request phases.
     :return: Hook function for httpx response event hook.
     """
+    pool_stats = get_custom_stats(environment, 'http_pool')
+    phases_stats = get_custom_stats(environment, 'http_phases') if phases else None
 
     def inner(response: Response) -> None:
         exception: HTTPError | HTTPStatusError | None = None
@@ -39,14 +127,28 @@ def locust_response_event_hook(environment: Environment):
         response_time = (time.perf_counter() - start_time) * 1000
         response_length = len(response.read())
 
+        name = get_stats_name(f'{request.method} {route}')
+        request_type = 'HTTP2' if response.http_version == 'HTTP/2' else 'HTTP'
         environment.events.request.fire(
-            name=f'{request.method} {route}',
+            name=name,
             response_time=response_time,
             context=None,
             response=response,
             exception=exception,
-            request_type='HTTP',
+            request_type=request_type,
             response_length=response_length,
         )
 
+        events = request.extensions.get('trace_events')
+        if not events:
+            return
+
+        pool_stats.log(f'{request_type}_POOL_WAIT', name, get_pool_wait_time(events, start_time))
+        if phases_stats is None:
+            return
+
+        protocol = 'http2' if request_type == 'HTTP2' else 'http11'
+        for phase, phase_time in get_request_phases(events, protocol):
+            phases_stats.log(f'{request_type}_{phase}', name, phase_time)
+
     return inner
@@ -3,29 +3,52 @@ import logging
 from httpx import Client
 from locust.env import Environment
 
-from clients.http.event_hooks.locust_event_hook import locust_request_event_hook, locust_response_event_hook
+from clients.http.event_hooks.locust_event_hook import (
+    locust_request_event_hook,
+    locust_response_event_hook,
+    locust_trace_event_hook
+)
+from clients.http.gevent_session import GeventHTTPSession
+from clients.http.registry import HTTPClientsRegistry
+from clients.http.transport import (
+    build_gevent_http_session,
+    build_http_timeout,
+    build_http_transport
+)
 from config import settings
+from tools.config.http import HTTPClientBackend
 
 
-def build_gateway_http_client() -> Client:
+def build_gateway_http_client() -> Client | GeventHTTPSession:
     """
     Creates httpx.Client instance with basic setup for http-gateway service.
+    Pool limits, timeouts and socket options are taken from `GATEWAY_HTTP_CLIENT.*` settings,
+    with `GATEWAY_HTTP_CLIENT.BACKEND=gevent` GeventHTTPSession is created instead.
     :return: ready-to-use httpx.Client object instance.
     """
+    if settings.gateway_http_client.backend == HTTPClientBackend.GEVENT:
+        return build_gevent_http_session(settings.gateway_http_client)
+
     return Client(
         base_url=settings.gateway_http_client.client_url,
-        timeout=settings.gateway_http_client.timeout
+        timeout=build_http_timeout(settings.gateway_http_client),
+        transport=build_http_transport(settings.gateway_http_client)
     )
 
 
-def build_gateway_locust_http_client(environment: Environment) -> Client:
+def build_gateway_locust_http_session(environment: Environment) -> Client | GeventHTTPSession:
     """
     HTTP-client specifically designed for load testing with Locust.
 
     Specifics:
     - adds `locust_request_event_hook` to get and store a request start time,
     - adds `locust_response_event_hook` evaluating metrics
-    (response time, response length, etc.) and sends it to Locust in `environment.events.request.fire()`.
+    (response time, response length, etc.) and sends it to Locust in `environment.events.request.fire()`,
+    time waiting for a free connection in the pool is reported as custom statistics,
+    other request phases (connect, TLS, write, time to first byte, download) are reported as well
+    if `GATEWAY_HTTP_CLIENT.PHASES` is enabled (see `locust_response_event_hook`),
+    - applies pool limits, timeouts and socket options from `GATEWAY_HTTP_CLIENT.*` settings,
+    - is GeventHTTPSession with the same hooks if `GATEWAY_HTTP_CLIENT.BACKEND=gevent`.
 
     Hence, this client automatically reports statistics to Locust with every HTTP-request.
 
@@ -37,11 +60,39 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     # Reduce excessive console output
     logging.getLogger('httpx').setLevel(logging.WARNING)
 
+    event_hooks = {
+        'request': [locust_request_event_hook, locust_trace_event_hook],
+        'response': [locust_response_event_hook(environment, phases=settings.gateway_http_client.phases)]
+    }
+    if settings.gateway_http_client.backend == HTTPClientBackend.GEVENT:
+        return build_gevent_http_session(settings.gateway_http_client, event_hooks=event_hooks)
+
     return Client(
         base_url=settings.gateway_http_client.client_url,
-        timeout=settings.gateway_http_client.timeout,
-        event_hooks={
-            'request': [locust_request_event_hook],
-            'response': [locust_response_event_hook(environment)]
-        }
+        timeout=build_http_timeout(settings.gateway_http_client),
+        transport=build_http_transport(settings.gateway_http_client),
+        event_hooks=event_hooks
     )
+
+
+def build_gateway_locust_http_client(environment: Environment) -> Client | GeventHTTPSession:
+    """
+    Returns Locust HTTP-client (see `build_gateway_locust_http_session`) shared by the current virtual user.
+
+    All the service clients of a virtual user share one connection pool instead of opening a pool each,
+    `GATEWAY_HTTP_CLIENT.USERS_PER_POOL` virtual users share it as well (see `HTTPClientsRegistry`).
+    The registry is created with the first client and kept in `environment.gateway_http_clients`.
+
+    :param environment: Locust environment object through which the metrics are sent.
+    :return: httpx.Client with hooks plugged in specifically for load testing.
+    """
+    registry: HTTPClientsRegistry | None = getattr(environment, 'gateway_http_clients', None)
+    if registry is None:
+        registry = environment.gateway_http_clients = HTTPClientsRegistry(
+            factory=lambda: build_gateway_locust_http_session(environment),
+            users_per_client=settings.gateway_http_client.users_per_pool,
+            name='gateway_http',
+            environment=environment
+        )
+
+    return registry.get_client()
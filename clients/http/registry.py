@@ -0,0 +1,187 @@
+from typing import Callable, NamedTuple
+
+import gevent
+import locust.stats
+from httpx import Client
+from locust.env import Environment
+
+from clients.http.gevent_session import GeventHTTPSession
+from tools.locust.user import current_user_index
+from tools.logger import get_logger
+
+logger = get_logger('HTTP_CLIENTS_REGISTRY')
+
+
+class HTTPConnectionsStats(NamedTuple):
+    """
+    Open connections of HTTP client connection pools.
+
+    Attributes:
+        connections: Number of open connections (sockets).
+        http2_connections: Number of them speaking HTTP/2.
+        streams: Number of requests in flight over the connections.
+        max_streams: Max number of requests in flight over a single connection,
+                     it is never above 1 for HTTP/1.1 connections.
+    """
+    connections: int = 0
+    http2_connections: int = 0
+    streams: int = 0
+    max_streams: int = 0
+
+    def __add__(self, other: 'HTTPConnectionsStats') -> 'HTTPConnectionsStats':
+        return HTTPConnectionsStats(
+            connections=self.connections + other.connections,
+            http2_connections=self.http2_connections + other.http2_connections,
+            streams=self.streams + other.streams,
+            max_streams=max(self.max_streams, other.max_streams)
+        )
+
+
+def get_http_connections_stats(client: Client | GeventHTTPSession) -> HTTPConnectionsStats:
+    """
+    httpx and httpcore have no public API for the pool connections, so they are read from the internals
+    of the versions pinned in requirements.txt; every access is guarded, so with other versions
+    the stats are incomplete (or empty) rather than failing.
+
+    :param client: httpx.Client or GeventHTTPSession instance.
+    :return: Open connections of the client connection pool.
+    """
+    if isinstance(client, GeventHTTPSession):
+        connections, busy = client.get_connections_stats()
+        return HTTPConnectionsStats(connections=connections, streams=busy, max_streams=min(1, busy))
+
+    pool = getattr(getattr(client, '_transport', None), '_pool', None)
+
+    stats = HTTPConnectionsStats()
+    for connection in getattr(pool, 'connections', []):
+        if not hasattr(connection, 'is_closed') or connection.is_closed():
+            continue
+
+        # HTTP/2 connection keeps events of every open stream, HTTP/1.1 one serves a single request at a time
+        protocol_connection = getattr(connection, '_connection', None)
+        is_http2 = type(protocol_connection).__name__ == 'HTTP2Connection'
+        if is_http2:
+            streams = len(getattr(protocol_connection, '_events', {}))
+        else:
+            streams = 0 if connection.is_idle() else 1
+
+        stats += HTTPConnectionsStats(
+            connections=1,
+            http2_connections=int(is_http2),
+            streams=streams,
+            max_streams=streams
+        )
+
+    return stats
+
+
+class HTTPClientsRegistry:
+    """
+    Shares httpx.Client instances, and so their connection pools, between virtual users.
+
+    All the service clients built in a virtual user greenlet get the same httpx.Client,
+    `users_per_client` consecutive virtual users share it as well (0 — one client for all the users of the worker).
+    Clients requested outside virtual users (i.e. by init listeners) share one more client of their own.
+
+    Open connections of the shared clients, and with HTTP/2 the streams multiplexed over them,
+    are logged periodically while the test is running. The clients are closed when the test stops,
+    virtual users of the next test get new ones.
+    """
+
+    def __init__(
+            self,
+            factory: Callable[[], Client | GeventHTTPSession],
+            users_per_client: int = 1,
+            name: str = 'http',
+            environment: Environment | None = None
+    ):
+        """
+        :param factory: Creates a new httpx.Client.
+        :param users_per_client: How many virtual users share one client.
+        :param name: Name of the registry in the logs.
+        :param environment: Locust environment to log the connections with while the test is running.
+        """
+        self.factory = factory
+        self.users_per_client = max(0, users_per_client)
+        self.name = name
+
+        # Shared clients by the index of the user group, None — the client used outside virtual users
+        self.clients: dict[int | None, Client | GeventHTTPSession] = {}
+        self.user_indexes: set[int] = set()
+        self.peak_connections_count = 0
+        self.reporter: gevent.Greenlet | None = None
+
+        # The registry is usually created by the first virtual user, when the test is already started
+        if environment is not None:
+            environment.events.test_start.add_listener(self.on_test_start)
+            environment.events.test_stop.add_listener(self.on_test_stop)
+            self.start_reporter()
+
+    def get_client(self) -> Client | GeventHTTPSession:
+        """
+        :return: httpx.Client shared by the current virtual user with its neighbours.
+        """
+        user_index = current_user_index.get()
+        key = None
+        if user_index is not None:
+            key = user_index // self.users_per_client if self.users_per_client else 0
+            self.user_indexes.add(user_index)
+
+        client = self.clients.get(key)
+        if client is None:
+            client = self.clients[key] = self.factory()
+
+        return client
+
+    def get_connections_stats(self) -> HTTPConnectionsStats:
+        """
+        :return: Open connections of all the shared clients.
+        """
+        stats = sum((get_http_connections_stats(client) for client in self.clients.values()), HTTPConnectionsStats())
+        self.peak_connections_count = max(self.peak_connections_count, stats.connections)
+        return stats
+
+    def log_connections(self) -> None:
+        stats = self.get_connections_stats()
+        streams = ''
+        if stats.http2_connections:
+            streams = (
+                f', {stats.http2_connections} of them HTTP/2, {stats.streams} streams in flight '
+                f'({stats.streams / stats.connections:.1f} per connection, max {stats.max_streams})'
+            )
+
+        logger.info(
+            f'{self.name}: {len(self.clients)} connection pools shared by {len(self.user_indexes)} users, '
+            f'{stats.connections} open connections (peak {self.peak_connections_count}){streams}'
+        )
+
+    def close(self) -> None:
+        """
+        Closes the shared clients and their connections.
+        """
+        clients, self.clients = self.clients, {}
+        self.user_indexes.clear()
+        for client in clients.values():
+            client.close()
+
+    def start_reporter(self) -> None:
+        if self.reporter is not None:
+            return
+
+        def report_connections():
+            while True:
+                gevent.sleep(locust.stats.CONSOLE_STATS_INTERVAL_SEC)
+                self.log_connections()
+
+        self.reporter = gevent.spawn(report_connections)
+
+    def on_test_start(self, **kwargs) -> None:
+        self.start_reporter()
+
+    def on_test_stop(self, **kwargs) -> None:
+        if self.reporter is not None:
+            self.reporter.kill(block=False)
+            self.reporter = None
+
+        self.log_connections()
+        self.close()
@@ -0,0 +1,145 @@
+import socket
+from typing import Any, Callable
+
+from geventhttpclient import HTTPClient as GeventHTTPClient
+from httpx import HTTPTransport, Limits, Timeout
+
+from clients.http.gevent_session import GeventHTTPSession, get_connection_pool
+from tools.config.http import HTTPClientConfig
+
+# Version of geventhttpclient the pool customization is written against (see requirements.txt)
+GEVENT_HTTP_CLIENT_VERSION = '2.5.1'
+
+try:
+    import h2
+except ImportError:  # HTTP/2 support is optional
+    h2 = None
+
+
+def build_http_timeout(config: HTTPClientConfig) -> Timeout:
+    """
+    Creates httpx.Timeout: the phases without their own timeout use the common one.
+
+    :param config: HTTP client settings.
+    :return: httpx.Timeout with connect, read, write and pool timeouts.
+    """
+    timeouts = config.timeouts.model_dump(exclude_none=True)
+    return Timeout(config.timeout, **timeouts)
+
+
+def build_http_limits(config: HTTPClientConfig) -> Limits:
+    """
+    :param config: HTTP client settings.
+    :return: httpx.Limits of the connection pool.
+    """
+    return Limits(
+        max_connections=config.limits.max_connections,
+        max_keepalive_connections=config.limits.max_keepalive_connections,
+        keepalive_expiry=config.limits.keepalive_expiry
+    )
+
+
+def build_http_socket_options(config: HTTPClientConfig) -> list[tuple[int, int, int]]:
+    """
+    :param config: HTTP client settings.
+    :return: Options set on every connection socket, in `socket.setsockopt` arguments format.
+    """
+    options = []
+    if config.socket.keepalive:
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    if config.socket.receive_buffer_size:
+        options.append((socket.SOL_SOCKET, socket.SO_RCVBUF, config.socket.receive_buffer_size))
+    if config.socket.send_buffer_size:
+        options.append((socket.SOL_SOCKET, socket.SO_SNDBUF, config.socket.send_buffer_size))
+
+    return options
+
+
+def get_http_versions(config: HTTPClientConfig) -> dict[str, bool]:
+    """
+    :param config: HTTP client settings.
+    :return: `http1` and `http2` arguments of the transport. HTTP/2 over plain TCP can't be negotiated,
+             so HTTP/1.1 is disabled there for the connections to start with HTTP/2 right away (h2c).
+    """
+    if not config.http2:
+        return {'http1': True, 'http2': False}
+
+    if h2 is None:
+        raise ImportError('HTTP/2 requires `h2` package to be installed, i.e. `pip install httpx[http2]`')
+
+    return {'http1': config.url.scheme == 'https', 'http2': True}
+
+
+def build_http_transport(config: HTTPClientConfig, limits: Limits | None = None) -> HTTPTransport:
+    """
+    Creates httpx.HTTPTransport, i.e. a connection pool, configured with the pool limits, socket options
+    and HTTP versions.
+
+    :param config: HTTP client settings.
+    :param limits: Pool limits overriding the configured ones.
+    :return: httpx.HTTPTransport to be passed to httpx.Client.
+    """
+    return HTTPTransport(
+        limits=limits or build_http_limits(config),
+        local_address=config.socket.local_address,
+        socket_options=build_http_socket_options(config),
+        **get_http_versions(config)
+    )
+
+
+def build_gevent_http_session(
+        config: HTTPClientConfig,
+        event_hooks: dict[str, list[Callable[[Any], None]]] | None = None
+) -> GeventHTTPSession:
+    """
+    Creates GeventHTTPSession, a geventhttpclient-based replacement of httpx.Client,
+    configured with the pool size, connect and read timeouts and socket options.
+
+    :param config: HTTP client settings.
+    :param event_hooks: httpx-like 'request' and 'response' event hooks.
+    :return: GeventHTTPSession to be passed to HTTPClient.
+    :raises ValueError: If HTTP/2 is enabled, geventhttpclient speaks HTTP/1.1 only.
+    :raises RuntimeError: If socket options are set and geventhttpclient internals differ from the pinned version.
+    """
+    if config.http2:
+        raise ValueError('HTTP/2 is not supported by gevent HTTP client backend')
+
+    client = GeventHTTPClient.from_url(
+        config.client_url,
+        concurrency=config.limits.max_connections or 1000,
+        connection_timeout=config.timeouts.connect or config.timeout,
+        network_timeout=config.timeouts.read or config.timeout
+    )
+
+    # Socket options are applied by the pool internals of the pinned geventhttpclient version
+    pool = get_connection_pool(client)
+    socket_options = build_http_socket_options(config)
+    if pool is None and (socket_options or config.socket.local_address):
+        raise RuntimeError(
+            f'Socket options are not supported by this geventhttpclient version, '
+            f'{GEVENT_HTTP_CLIENT_VERSION} is expected'
+        )
+
+    if socket_options:
+        def after_connect(sock: socket.socket) -> None:
+            for option in socket_options:
+                sock.setsockopt(*option)
+
+        pool.after_connect = after_connect
+
+    if config.socket.local_address:
+        create_tcp_socket = getattr(pool, '_create_tcp_socket', None)
+        if create_tcp_socket is None:
+            raise RuntimeError(
+                f'Local address is not supported by this geventhttpclient version, '
+                f'{GEVENT_HTTP_CLIENT_VERSION} is expected'
+            )
+
+        def create_bound_tcp_socket(*args) -> socket.socket:
+            sock = create_tcp_socket(*args)
+            sock.bind((config.socket.local_address, 0))
+            return sock
+
+        pool._create_tcp_socket = create_bound_tcp_socket
+
+    return GeventHTTPSession(base_url=config.client_url, client=client, event_hooks=event_hooks)
@@ -1,10 +1,15 @@
 import locust.stats  # Locust module responsible for gathering and storing statistics
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Import nested models
+from tools.config.contention import ContentionConfig
+from tools.config.fakers import FakerConfig
 from tools.config.grpc import GRPCClientConfig
 from tools.config.http import HTTPClientConfig
 from tools.config.locust import LocustUserConfig
+from tools.config.seeds import SeedsConfig
+from tools.config.sweep import SweepConfig
 
 # Which percentiles will be shown in Locust reports
 locust.stats.PERCENTILES_TO_REPORT = [0.50, 0.60, 0.70, 0.80, 0.90, 0.95, 0.99, 1.0]
@@ -27,10 +32,22 @@ class Settings(BaseSettings):
         env_nested_delimiter='.'  # Allows to use nested variables, for instance: LOCUST_USER.WAIT_TIME_MIN
     )
 
+    # Run seed making generated data and users behaviour reproducible; None — a new random run every time
+    seed: int | None = None
+
     # Nested settings sections
     locust_user: LocustUserConfig
     gateway_http_client: HTTPClientConfig
     gateway_grpc_client: GRPCClientConfig
+    # Internal services are only called directly by seeding with `SEEDS.BACKEND=internal_grpc`
+    users_grpc_client: GRPCClientConfig | None = None
+    accounts_grpc_client: GRPCClientConfig | None = None
+    cards_grpc_client: GRPCClientConfig | None = None
+    operations_grpc_client: GRPCClientConfig | None = None
+    seeds: SeedsConfig = Field(default_factory=SeedsConfig)
+    fakers: FakerConfig = Field(default_factory=FakerConfig)
+    contention: ContentionConfig = Field(default_factory=ContentionConfig)
+    sweep: SweepConfig = Field(default_factory=SweepConfig)
 
 
 # Global Settings object
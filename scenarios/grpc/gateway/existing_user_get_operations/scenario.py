@@ -2,17 +2,22 @@ from locust import events, task
 from locust.env import Environment
 
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
+from seeds.locust import setup_seeds
 from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
 from seeds.schema.result import SeedUserResult
+from seeds.selector import build_seed_users_selector
 from tools.locust.user import LocustBaseUser
 
 
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
     seeds_scenario = ExistingUserGetOperationsSeedsScenario()
-    seeds_scenario.build()
 
-    environment.seed_result = seeds_scenario.load()
+    def on_seeds_loaded(result):
+        # Seed users are picked with the distribution configured with SEEDS.SELECTION
+        environment.seed_result = build_seed_users_selector(result, environment)
+
+    setup_seeds(environment, seeds_scenario, on_seeds_loaded)
 
 
 class GetOperationsTaskSet(GatewayGRPCTaskSet):
@@ -2,17 +2,25 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
+from seeds.contention import build_hot_accounts_router
+from seeds.locust import setup_seeds
 from seeds.scenarios.existing_user_make_purchase_operation import ExistingUserMakePurchaseOperationSeedsScenario
 from seeds.schema.result import SeedUserResult
+from seeds.selector import build_seed_users_selector
+from tools.locust.tags import stats_tag
 from tools.locust.user import LocustBaseUser
 
 
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
     seeds_scenario = ExistingUserMakePurchaseOperationSeedsScenario()
-    seeds_scenario.build()
 
-    environment.seeds = seeds_scenario.load()
+    def on_seeds_loaded(result):
+        environment.seeds = build_seed_users_selector(result, environment)
+        # With `CONTENTION.HOT_FRACTION` set a share of the purchases goes to a few hot accounts
+        environment.contention = build_hot_accounts_router(result)
+
+    setup_seeds(environment, seeds_scenario, on_seeds_loaded)
 
 
 class MakePurchaseOperationSequentialTaskSet(GatewayGRPCTaskSet):
@@ -24,10 +32,12 @@ class MakePurchaseOperationSequentialTaskSet(GatewayGRPCTaskSet):
 
     @task(1)
     def make_purchase_operation(self):
-        self.operations_gateway_client.make_purchase_operation(
-            card_id=self.seed_user.credit_card_accounts[0].physical_cards[0].card_id,
-            account_id=self.seed_user.credit_card_accounts[0].account_id
-        )
+        seed_user, tag = self.user.environment.contention.route(self.seed_user)
+        with stats_tag(tag):
+            self.operations_gateway_client.make_purchase_operation(
+                card_id=seed_user.credit_card_accounts[0].physical_cards[0].card_id,
+                account_id=seed_user.credit_card_accounts[0].account_id
+            )
 
     @task(2)
     def get_accounts(self):
@@ -1,15 +1,49 @@
-from locust import task
+from functools import cache
+
+from locust import events, task
+from locust.env import Environment
 
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
+from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, build_users_gateway_grpc_client
+from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserResponse
+from seeds.recorder import build_seeds_recorder, get_seeds_recorder
+from seeds.replenisher import build_seeds_replenisher
 from tools.locust.user import LocustBaseUser
 
 
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    # Entities created by virtual users are recorded as seeding data if `SEEDS.RECORD_SCENARIO` is set
+    build_seeds_recorder(environment)
+
+    # Non-Locust client: with SEEDS.REPLENISH background creation of users is not a part of the measured journey.
+    # It is built by the first background call, so nothing is built when replenishment is off or on master
+    @cache
+    def build_gateway_client() -> UsersGatewayGRPCClient:
+        return build_users_gateway_grpc_client()
+
+    def create_user() -> CreateUserResponse:
+        return build_gateway_client().create_user()
+
+    environment.seeds = build_seeds_replenisher(create_user, 'users', environment)
+
+
 class GetAccountsTaskSet(GatewayGRPCTaskSet):
     user_id: str | None = None
 
     @task(2)
     def create_user(self):
-        create_user_response = self.users_gateway_client.create_user()
+        if self.user.environment.seeds is not None:
+            # The user is created in the background, so only opening and getting accounts are measured
+            create_user_response = self.user.environment.seeds.get()
+
+            # Only the background users the test takes are recorded, not the ones left in the pool
+            recorder = get_seeds_recorder(self.user.environment)
+            if recorder is not None:
+                recorder.record_response('create_user', create_user_response, {})
+        else:
+            create_user_response = self.users_gateway_client.create_user()
+
         self.user_id = create_user_response.user.id
 
     @task(2)
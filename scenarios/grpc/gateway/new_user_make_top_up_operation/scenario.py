@@ -1,12 +1,42 @@
-from locust import task
+from functools import cache
 
+from locust import events, task
+from locust.env import Environment
+
+from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient, build_accounts_gateway_grpc_client
 from clients.grpc.gateway.locust import GatewayGRPCSequentialTaskSet
+from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, build_users_gateway_grpc_client
 from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import OpenDebitCardAccountResponse
 from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import MakeTopUpOperationResponse
 from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserResponse
+from seeds.recorder import build_seeds_recorder, get_seeds_recorder
+from seeds.replenisher import build_seeds_replenisher
 from tools.locust.user import LocustBaseUser
 
 
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    # Entities created by virtual users are recorded as seeding data if `SEEDS.RECORD_SCENARIO` is set
+    build_seeds_recorder(environment)
+
+    # Non-Locust clients: with SEEDS.REPLENISH background creation of users and accounts
+    # is not a part of the measured journey. They are built by the first background call,
+    # so nothing is built when replenishment is off or on master
+    @cache
+    def build_gateway_clients() -> tuple[UsersGatewayGRPCClient, AccountsGatewayGRPCClient]:
+        return build_users_gateway_grpc_client(), build_accounts_gateway_grpc_client()
+
+    def create_debit_card_account() -> tuple[CreateUserResponse, OpenDebitCardAccountResponse]:
+        users_gateway_client, accounts_gateway_client = build_gateway_clients()
+        create_user_response = users_gateway_client.create_user()
+        open_debit_card_account_response = accounts_gateway_client.open_debit_card_account(
+            user_id=create_user_response.user.id
+        )
+        return create_user_response, open_debit_card_account_response
+
+    environment.seeds = build_seeds_replenisher(create_debit_card_account, 'debit_card_accounts', environment)
+
+
 class MakeTopUpOperationSequentialTaskSet(GatewayGRPCSequentialTaskSet):
     create_user_response: CreateUserResponse | None = None
     make_top_up_operation_response: MakeTopUpOperationResponse | None = None
@@ -14,11 +44,27 @@ class MakeTopUpOperationSequentialTaskSet(GatewayGRPCSequentialTaskSet):
 
     @task
     def create_user(self):
+        self.create_user_response = self.open_open_debit_card_account_response = None
+        if self.user.environment.seeds is not None:
+            # The user and the account are created in the background, so only the following steps are measured
+            self.create_user_response, self.open_open_debit_card_account_response = self.user.environment.seeds.get()
+
+            # Only the background users the test takes are recorded, not the ones left in the pool
+            recorder = get_seeds_recorder(self.user.environment)
+            if recorder is not None:
+                recorder.record_response('create_user', self.create_user_response, {})
+                recorder.record_response(
+                    'open_debit_card_account',
+                    self.open_open_debit_card_account_response,
+                    {'user_id': self.create_user_response.user.id}
+                )
+            return
+
         self.create_user_response = self.users_gateway_client.create_user()
 
     @task
     def open_debit_card_account(self):
-        if not self.create_user_response:
+        if not self.create_user_response or self.open_open_debit_card_account_response:
             return
 
         self.open_open_debit_card_account_response = self.accounts_gateway_client.open_debit_card_account(
@@ -0,0 +1,56 @@
+from locust import events, task
+from locust.env import Environment
+
+from clients.grpc.gateway.locust import GatewayGRPCTaskSet
+from seeds.selector import SeedUsersSelector, build_seed_users_selector
+from seeds.sweep import VolumeSweepCohort, build_volume_sweep_cohorts, setup_volume_sweep
+from tools.locust.tags import stats_tag
+from tools.locust.user import LocustBaseUser
+from tools.rng import get_random
+
+
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    # Every cohort has its own number of accounts per user and operations per account
+    environment.sweep_cohorts = {}
+
+    def on_cohort_loaded(cohort: VolumeSweepCohort, result):
+        environment.sweep_cohorts[cohort.tag] = build_seed_users_selector(result, environment, name=cohort.tag)
+
+    # Latency-vs-result-size curves are saved to ./dumps/grpc_volume_sweep_get_operations_sweep.json
+    setup_volume_sweep(environment, build_volume_sweep_cohorts(), 'grpc_volume_sweep_get_operations', on_cohort_loaded)
+
+
+class VolumeSweepGetOperationsTaskSet(GatewayGRPCTaskSet):
+    """
+    Reads the list endpoints against a random cohort of the data-volume sweep on every task,
+    requests are reported separately for every cohort.
+    """
+
+    def pick_cohort(self) -> tuple[str, SeedUsersSelector]:
+        return get_random().choice(list(self.user.environment.sweep_cohorts.items()))
+
+    @task(1)
+    def get_accounts(self):
+        tag, users = self.pick_cohort()
+        seed_user = users.get_random_user()
+        with stats_tag(tag):
+            self.accounts_gateway_client.get_accounts(user_id=seed_user.user_id)
+
+    @task(2)
+    def get_operations(self):
+        tag, users = self.pick_cohort()
+        account = get_random().choice(users.get_random_user().debit_card_accounts)
+        with stats_tag(tag):
+            self.operations_gateway_client.get_operations(account_id=account.account_id)
+
+    @task(2)
+    def get_operations_summary(self):
+        tag, users = self.pick_cohort()
+        account = get_random().choice(users.get_random_user().debit_card_accounts)
+        with stats_tag(tag):
+            self.operations_gateway_client.get_operations_summary(account_id=account.account_id)
+
+
+class VolumeSweepGetOperationsScenarioUser(LocustBaseUser):
+    tasks = [VolumeSweepGetOperationsTaskSet]
@@ -2,6 +2,8 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.http.gateway.locust import GatewayHTTPTaskSet
+from seeds.locust import setup_seeds
+from seeds.pool import SeedUserLease, build_seed_users_pool
 from seeds.scenarios.existing_user_get_documents import ExistingUserGetDocumentsSeedsScenario
 from seeds.schema.result import SeedUserResult
 from tools.locust.user import LocustBaseUser
@@ -11,18 +13,26 @@ from tools.locust.user import LocustBaseUser
 def init(environment: Environment, **kwargs):
     seeds_scenario = ExistingUserGetDocumentsSeedsScenario()
 
-    seeds_scenario.build()
+    # Each virtual user leases its own seed user and returns it to the pool when stopped
+    def on_seeds_loaded(result):
+        environment.seeds = build_seed_users_pool(result, environment)
 
-    environment.seeds = seeds_scenario.load()
+    setup_seeds(environment, seeds_scenario, on_seeds_loaded)
 
 
 class GetDocumentsTaskSet(GatewayHTTPTaskSet):
     seed_user: SeedUserResult
+    seed_user_lease: SeedUserLease | None = None
 
     def on_start(self) -> None:
         super().on_start()
 
-        self.seed_user = self.user.environment.seeds.get_next_user()
+        self.seed_user_lease = self.user.environment.seeds.acquire()
+        self.seed_user = self.seed_user_lease.user
+
+    def on_stop(self) -> None:
+        if self.seed_user_lease:
+            self.user.environment.seeds.release(self.seed_user_lease)
 
     @task(1)
     def get_accounts(self):
@@ -2,17 +2,21 @@ from locust import events, task
 from locust.env import Environment
 
 from clients.http.gateway.locust import GatewayHTTPTaskSet
+from seeds.locust import setup_seeds
 from seeds.scenarios.existing_user_issue_virtual_card import ExistingUserIssueVirtualCardSeedsScenario
 from seeds.schema.result import SeedUserResult
+from seeds.selector import build_seed_users_selector
 from tools.locust.user import LocustBaseUser
 
 
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
     seeds_scenario = ExistingUserIssueVirtualCardSeedsScenario()
-    seeds_scenario.build()
 
-    environment.seed_result = seeds_scenario.load()
+    def on_seeds_loaded(result):
+        environment.seed_result = build_seed_users_selector(result, environment)
+
+    setup_seeds(environment, seeds_scenario, on_seeds_loaded)
 
 
 class IssueVirtualCardTaskSet(GatewayHTTPTaskSet):
@@ -2,8 +2,12 @@ from locust import events, task
 from locust.env import Environment
 
 from clients.http.gateway.locust import GatewayHTTPTaskSet
+from seeds.contention import build_hot_accounts_router
+from seeds.locust import setup_seeds
 from seeds.scenarios.existing_user_make_purchase_operation import ExistingUserMakePurchaseOperationSeedsScenario
 from seeds.schema.result import SeedUserResult
+from seeds.selector import build_seed_users_selector
+from tools.locust.tags import stats_tag
 from tools.locust.user import LocustBaseUser
 
 
@@ -12,10 +16,13 @@ from tools.locust.user import LocustBaseUser
 def init(environment: Environment, **kwargs):
     # Execute seeding scenario
     seeds_scenario = ExistingUserMakePurchaseOperationSeedsScenario()
-    seeds_scenario.build()  # create users, accounts, cards, and operations
 
-    # Load seeding result from the saved JSON-file
-    environment.seed_result = seeds_scenario.load()
+    def on_seeds_loaded(result):
+        environment.seed_result = build_seed_users_selector(result, environment)
+        # With `CONTENTION.HOT_FRACTION` set a share of the purchases goes to a few hot accounts
+        environment.contention = build_hot_accounts_router(result)
+
+    setup_seeds(environment, seeds_scenario, on_seeds_loaded)
 
 
 # TaskSet — user scenario. Each virtual user executes these tasks
@@ -28,10 +35,12 @@ class MakePurchaseOperationTaskSet(GatewayHTTPTaskSet):
 
     @task(1)
     def make_purchase_operation(self):
-        self.operations_gateway_client.make_purchase_operation(
-            card_id=self.seed_user.credit_card_accounts[0].physical_cards[0].card_id,
-            account_id=self.seed_user.credit_card_accounts[0].account_id
-        )
+        seed_user, tag = self.user.environment.contention.route(self.seed_user)
+        with stats_tag(tag):
+            self.operations_gateway_client.make_purchase_operation(
+                card_id=seed_user.credit_card_accounts[0].physical_cards[0].card_id,
+                account_id=seed_user.credit_card_accounts[0].account_id
+            )
 
     @task(2)
     def get_accounts(self):
@@ -1,37 +1,64 @@
-from locust import TaskSet, task
+from functools import cache
 
-from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_locust_http_client
-from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
+from locust import events, task
+from locust.env import Environment
+
+from clients.http.gateway.locust import GatewayHTTPTaskSet
+from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_http_client
 from clients.http.gateway.users.schema import CreateUserResponseSchema
+from seeds.recorder import build_seeds_recorder, get_seeds_recorder
+from seeds.replenisher import build_seeds_replenisher
 from tools.locust.user import LocustBaseUser
 
 
-class GetAccountsTaskSet(TaskSet):
-    create_user_response: CreateUserResponseSchema | None = None
-    users_gateway_client: UsersGatewayHTTPClient
-    accounts_gateway_client: AccountsGatewayHTTPClient
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    # Entities created by virtual users are recorded as seeding data if `SEEDS.RECORD_SCENARIO` is set
+    build_seeds_recorder(environment)
+
+    # Non-Locust client: with SEEDS.REPLENISH background creation of users is not a part of the measured journey.
+    # It is built by the first background call, so nothing is built when replenishment is off or on master
+    @cache
+    def build_gateway_client() -> UsersGatewayHTTPClient:
+        return build_users_gateway_http_client()
+
+    def create_user() -> CreateUserResponseSchema:
+        return build_gateway_client().create_user()
+
+    environment.seeds = build_seeds_replenisher(create_user, 'users', environment)
 
-    def on_start(self) -> None:
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
+
+class GetAccountsTaskSet(GatewayHTTPTaskSet):
+    user_id: str | None = None
 
     @task(2)
     def create_user(self):
-        self.create_user_response = self.users_gateway_client.create_user()
+        if self.user.environment.seeds is not None:
+            # The user is created in the background, so only opening and getting accounts are measured
+            create_user_response = self.user.environment.seeds.get()
+
+            # Only the background users the test takes are recorded, not the ones left in the pool
+            recorder = get_seeds_recorder(self.user.environment)
+            if recorder is not None:
+                recorder.record_response('create_user', create_user_response, {})
+        else:
+            create_user_response = self.users_gateway_client.create_user()
+
+        self.user_id = create_user_response.user.id
 
     @task(2)
     def open_deposit_account(self):
-        if not self.create_user_response:
+        if not self.user_id:
             return
 
-        self.accounts_gateway_client.open_deposit_account(user_id=self.create_user_response.user.id)
+        self.accounts_gateway_client.open_deposit_account(user_id=self.user_id)
 
     @task(6)
     def get_accounts(self):
-        if not self.create_user_response:
+        if not self.user_id:
             return
 
-        self.accounts_gateway_client.get_accounts(user_id=self.create_user_response.user.id)
+        self.accounts_gateway_client.get_accounts(user_id=self.user_id)
 
 
 class GetAccountsScenarioUser(LocustBaseUser):
@@ -1,15 +1,45 @@
-from locust import task
+from functools import cache
 
+from locust import events, task
+from locust.env import Environment
+
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_http_client
 from clients.http.gateway.accounts.schema import OpenSavingsAccountResponseSchema
 from clients.http.gateway.locust import GatewayHTTPSequentialTaskSet
+from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_http_client
 from clients.http.gateway.users.schema import CreateUserResponseSchema
+from seeds.recorder import build_seeds_recorder, get_seeds_recorder
+from seeds.replenisher import build_seeds_replenisher
 from tools.locust.user import LocustBaseUser
 
 
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    # Entities created by virtual users are recorded as seeding data if `SEEDS.RECORD_SCENARIO` is set
+    build_seeds_recorder(environment)
+
+    # Non-Locust clients: with SEEDS.REPLENISH background creation of users and accounts
+    # is not a part of the measured journey. They are built by the first background call,
+    # so nothing is built when replenishment is off or on master
+    @cache
+    def build_gateway_clients() -> tuple[UsersGatewayHTTPClient, AccountsGatewayHTTPClient]:
+        return build_users_gateway_http_client(), build_accounts_gateway_http_client()
+
+    def create_savings_account() -> tuple[CreateUserResponseSchema, OpenSavingsAccountResponseSchema]:
+        users_gateway_client, accounts_gateway_client = build_gateway_clients()
+        create_user_response = users_gateway_client.create_user()
+        open_savings_account_response = accounts_gateway_client.open_savings_account(
+            user_id=create_user_response.user.id
+        )
+        return create_user_response, open_savings_account_response
+
+    environment.seeds = build_seeds_replenisher(create_savings_account, 'savings_accounts', environment)
+
+
 class GetDocumentsSequentialTaskSet(GatewayHTTPSequentialTaskSet):
     """
     Load test scenario which sequentially does the following:
-    1. Creates a new user.
+    1. Creates a new user (takes a ready-made one with the account if `SEEDS.REPLENISH` is set).
     2. Opens a savings account.
     3. Get account documents (tariff and contract).
 
@@ -24,15 +54,31 @@ class GetDocumentsSequentialTaskSet(GatewayHTTPSequentialTaskSet):
         """
         Create a new user and save request result for its using in the next steps.
         """
+        self.create_user_response = self.open_savings_account_response = None
+        if self.user.environment.seeds is not None:
+            # The user and the account are created in the background, so only getting documents is measured
+            self.create_user_response, self.open_savings_account_response = self.user.environment.seeds.get()
+
+            # Only the background users the test takes are recorded, not the ones left in the pool
+            recorder = get_seeds_recorder(self.user.environment)
+            if recorder is not None:
+                recorder.record_response('create_user', self.create_user_response, {})
+                recorder.record_response(
+                    'open_savings_account',
+                    self.open_savings_account_response,
+                    {'user_id': self.create_user_response.user.id}
+                )
+            return
+
         self.create_user_response = self.users_gateway_client.create_user()
 
     @task
     def open_savings_account(self):
         """
         Open a savings account for previously created user.
-        Check that the previous step was successful.
+        Check that the previous step was successful and the account isn't taken ready-made.
         """
-        if not self.create_user_response:
+        if not self.create_user_response or self.open_savings_account_response:
             return
 
         self.open_savings_account_response = self.accounts_gateway_client.open_savings_account(
@@ -1,12 +1,42 @@
-from locust import task
+from functools import cache
 
+from locust import events, task
+from locust.env import Environment
+
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_http_client
 from clients.http.gateway.accounts.schema import OpenDebitCardAccountResponseSchema
 from clients.http.gateway.locust import GatewayHTTPSequentialTaskSet
 from clients.http.gateway.operations.schema import MakeOperationResponseSchema
+from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_http_client
 from clients.http.gateway.users.schema import CreateUserResponseSchema
+from seeds.recorder import build_seeds_recorder, get_seeds_recorder
+from seeds.replenisher import build_seeds_replenisher
 from tools.locust.user import LocustBaseUser
 
 
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    # Entities created by virtual users are recorded as seeding data if `SEEDS.RECORD_SCENARIO` is set
+    build_seeds_recorder(environment)
+
+    # Non-Locust clients: with SEEDS.REPLENISH background creation of users and accounts
+    # is not a part of the measured journey. They are built by the first background call,
+    # so nothing is built when replenishment is off or on master
+    @cache
+    def build_gateway_clients() -> tuple[UsersGatewayHTTPClient, AccountsGatewayHTTPClient]:
+        return build_users_gateway_http_client(), build_accounts_gateway_http_client()
+
+    def create_debit_card_account() -> tuple[CreateUserResponseSchema, OpenDebitCardAccountResponseSchema]:
+        users_gateway_client, accounts_gateway_client = build_gateway_clients()
+        create_user_response = users_gateway_client.create_user()
+        open_debit_card_account_response = accounts_gateway_client.open_debit_card_account(
+            user_id=create_user_response.user.id
+        )
+        return create_user_response, open_debit_card_account_response
+
+    environment.seeds = build_seeds_replenisher(create_debit_card_account, 'debit_card_accounts', environment)
+
+
 class MakeTopUpOperationSequentialTaskSet(GatewayHTTPSequentialTaskSet):
     create_user_response: CreateUserResponseSchema | None = None
     make_top_up_operation_response: MakeOperationResponseSchema | None = None
@@ -14,11 +44,27 @@ class MakeTopUpOperationSequentialTaskSet(GatewayHTTPSequentialTaskSet):
 
     @task
     def create_user(self):
+        self.create_user_response = self.open_open_debit_card_account_response = None
+        if self.user.environment.seeds is not None:
+            # The user and the account are created in the background, so only the following steps are measured
+            self.create_user_response, self.open_open_debit_card_account_response = self.user.environment.seeds.get()
+
+            # Only the background users the test takes are recorded, not the ones left in the pool
+            recorder = get_seeds_recorder(self.user.environment)
+            if recorder is not None:
+                recorder.record_response('create_user', self.create_user_response, {})
+                recorder.record_response(
+                    'open_debit_card_account',
+                    self.open_open_debit_card_account_response,
+                    {'user_id': self.create_user_response.user.id}
+                )
+            return
+
         self.create_user_response = self.users_gateway_client.create_user()
 
     @task
     def open_debit_card_account(self):
-        if not self.create_user_response:
+        if not self.create_user_response or self.open_open_debit_card_account_response:
             return
 
         self.open_open_debit_card_account_response = self.accounts_gateway_client.open_debit_card_account(
@@ -1,3 +1,12 @@
+import time
+from typing import Callable, Iterator, TypeVar
+
+import gevent
+import grpc
+import httpx
+from gevent.pool import Pool
+from pydantic import ValidationError
+
 from clients.grpc.gateway.accounts.client import build_accounts_gateway_grpc_client, AccountsGatewayGRPCClient
 from clients.grpc.gateway.cards.client import build_cards_gateway_grpc_client, CardsGatewayGRPCClient
 from clients.grpc.gateway.operations.client import build_operations_gateway_grpc_client, OperationsGatewayGRPCClient
@@ -6,6 +15,10 @@ from clients.http.gateway.accounts.client import build_accounts_gateway_http_cli
 from clients.http.gateway.cards.client import build_cards_gateway_http_client, CardsGatewayHTTPClient
 from clients.http.gateway.operations.client import build_operations_gateway_http_client, OperationsGatewayHTTPClient
 from clients.http.gateway.users.client import build_users_gateway_http_client, UsersGatewayHTTPClient
+from config import settings
+from seeds.metrics import SeedsMetrics
+from seeds.progress import SeedsProgress
+from seeds.schema.metrics import SeedsMetricsReport
 from seeds.schema.plan import (
     SeedsPlan,
     SeedUsersPlan,
@@ -18,6 +31,46 @@ from seeds.schema.result import (
     SeedAccountResult,
     SeedOperationResult
 )
+from tools.logger import get_logger
+
+T = TypeVar('T')
+
+# Errors of a single gateway call: gRPC status errors, HTTP transport errors
+# and HTTP error responses which can't be parsed into the response schema
+CALL_ERRORS = (grpc.RpcError, httpx.HTTPError, ValidationError)
+
+# Client methods creating entities: retrying them after the server has processed the request creates a duplicate
+CREATE_METHOD_PREFIXES = ('create_', 'open_', 'issue_', 'make_')
+
+# HTTP errors raised before the request has reached the server, so even a creating call is safe to retry
+HTTP_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+logger = get_logger('SEEDS_BUILDER')
+
+
+class DryRunResponse:
+    """
+    Stands in for any gateway response in dry-run mode.
+    Every attribute of the response is the response itself and every collection holds the response alone,
+    so `response.account.cards[0].id` works and iterating over `response.accounts` ends after one item.
+    """
+    id = 'dry-run'
+    balance = 0.0
+
+    def __getattr__(self, name: str) -> 'DryRunResponse':
+        return self
+
+    def __len__(self) -> int:
+        return 1
+
+    def __getitem__(self, index: int) -> 'DryRunResponse':
+        if index not in (0, -1):
+            raise IndexError(index)
+
+        return self
+
+
+DRY_RUN_RESPONSE = DryRunResponse()
 
 
 class SeedsBuilder:
@@ -25,11 +78,20 @@ class SeedsBuilder:
     SeedsBuilder — generator (seeder) creating test data based on passed Seeds Plan.
     Works with both HTTP and gRPC clients.
 
+    Users are independent of each other, so they are built in parallel by a bounded pool of greenlets.
+    Entities of a single user are still created sequentially: user → accounts → cards/operations.
+
     Attributes:
         users_gateway_client: Users client (HTTP or gPRC).
         cards_gateway_client: Cards client.
         accounts_gateway_client: Accounts client.
         operations_gateway_client: Operations client (top-up, purchases, etc.).
+        concurrency: Max number of users built at the same time.
+        retries: How many times a failed gateway call is retried before the error is raised (see `is_retryable`).
+        retry_backoff: Delay (in seconds) before the first retry, doubled with every next retry.
+        dry_run: Only count gateway calls instead of making them.
+        metrics: Call times of the gateway calls made by the latest build.
+        report: Summary of the latest completed build.
     """
 
     def __init__(
@@ -37,12 +99,99 @@ class SeedsBuilder:
             users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient,
             cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient,
             accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient,
-            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient
+            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient,
+            concurrency: int = 1,
+            retries: int = 0,
+            retry_backoff: float = 0.5,
+            dry_run: bool = False
     ):
         self.users_gateway_client = users_gateway_client
         self.cards_gateway_client = cards_gateway_client
         self.accounts_gateway_client = accounts_gateway_client
         self.operations_gateway_client = operations_gateway_client
+        self.init_options(concurrency=concurrency, retries=retries, retry_backoff=retry_backoff, dry_run=dry_run)
+
+    def init_options(self, concurrency: int, retries: int, retry_backoff: float, dry_run: bool) -> None:
+        """
+        Initialises everything but the clients, shared by the builders working with other clients.
+
+        Args:
+            concurrency: Number of users built at the same time.
+            retries: Number of retries of a failed call.
+            retry_backoff: Delay before the first retry in seconds, doubled for every next one.
+            dry_run: Only record the calls without making them.
+        """
+        self.concurrency = max(1, concurrency)
+        self.retries = max(0, retries)
+        self.retry_backoff = retry_backoff
+        self.dry_run = dry_run
+        self.metrics = SeedsMetrics()
+        self.report: SeedsMetricsReport | None = None
+
+    @staticmethod
+    def is_retryable(name: str, error: Exception) -> bool:
+        """
+        Checks whether a failed call may be retried:
+        - a response not matching the response schema will not change on retry, so it is never retried;
+        - a call creating an entity (`create_*`, `open_*`, `issue_*`, `make_*`) is retried only if the request
+          surely hasn't reached the server (gRPC UNAVAILABLE, HTTP connect errors), otherwise a timeout after
+          the server has committed the entity would create a duplicate;
+        - other calls (getting entities, setting the balance) are idempotent and are retried on any call error.
+
+        Args:
+            name: Client method name.
+            error: Error the call failed with.
+
+        Returns:
+            bool: True if the call may be retried.
+        """
+        if isinstance(error, ValidationError):
+            return False
+
+        if not name.startswith(CREATE_METHOD_PREFIXES):
+            return True
+
+        if isinstance(error, grpc.RpcError):
+            code = getattr(error, 'code', None)
+            return callable(code) and code() == grpc.StatusCode.UNAVAILABLE
+
+        return isinstance(error, HTTP_CONNECT_ERRORS)
+
+    def call(self, func: Callable[..., T], **kwargs) -> T:
+        """
+        Calls the gateway client method retrying it with exponential backoff on a retryable failure
+        (see `is_retryable`).
+        Time of every attempt is recorded to `metrics` under the method name.
+        In dry-run mode the call is only recorded and DryRunResponse is returned.
+
+        Args:
+            func: Client method to call.
+            **kwargs: Arguments of the method.
+
+        Returns:
+            T: Result of the method.
+        """
+        if self.dry_run:
+            self.metrics.record(func.__name__, 0.0)
+            return DRY_RUN_RESPONSE
+
+        for attempt in range(self.retries + 1):
+            started = time.perf_counter()
+            try:
+                response = func(**kwargs)
+                self.metrics.record(func.__name__, (time.perf_counter() - started) * 1000)
+                return response
+            except CALL_ERRORS as error:
+                self.metrics.record(func.__name__, (time.perf_counter() - started) * 1000, failed=True)
+                if attempt == self.retries or not self.is_retryable(func.__name__, error):
+                    raise
+
+                delay = self.retry_backoff * 2 ** attempt
+                logger.warning(
+                    f'{func.__name__} failed ({type(error).__name__}), '
+                    f'retry {attempt + 1}/{self.retries} in {delay:.1f}s'
+                )
+                gevent.sleep(delay)
 
     def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
         """
@@ -55,7 +204,8 @@ class SeedsBuilder:
         Returns:
             SeedCardResult: Result with the ID of the issued physical card.
         """
-        response = self.cards_gateway_client.issue_physical_card(
+        response = self.call(
+            self.cards_gateway_client.issue_physical_card,
             user_id=user_id,
             account_id=account_id
         )
@@ -72,7 +222,8 @@ class SeedsBuilder:
         Returns:
             SeedCardResult: Result with the ID of the issued virtual card.
         """
-        response = self.cards_gateway_client.issue_virtual_card(
+        response = self.call(
+            self.cards_gateway_client.issue_virtual_card,
             user_id=user_id,
             account_id=account_id
         )
@@ -89,7 +240,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Result with the ID of the performed top-up operation.
         """
-        response = self.operations_gateway_client.make_top_up_operation(
+        response = self.call(
+            self.operations_gateway_client.make_top_up_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -106,7 +258,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Result with the ID of the performed purchase operation.
         """
-        response = self.operations_gateway_client.make_purchase_operation(
+        response = self.call(
+            self.operations_gateway_client.make_purchase_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -123,7 +276,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Result with the ID of the performed transfer operation.
         """
-        response = self.operations_gateway_client.make_transfer_operation(
+        response = self.call(
+            self.operations_gateway_client.make_transfer_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -140,7 +294,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Result with the ID of the performed cash withdrawal operation.
         """
-        response = self.operations_gateway_client.make_cash_withdrawal_operation(
+        response = self.call(
+            self.operations_gateway_client.make_cash_withdrawal_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -156,7 +311,7 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Result with the ID of the created account.
         """
-        response = self.accounts_gateway_client.open_savings_account(user_id=user_id)
+        response = self.call(self.accounts_gateway_client.open_savings_account, user_id=user_id)
         return SeedAccountResult(account_id=response.account.id)
 
     def build_deposit_account_result(self, user_id: str) -> SeedAccountResult:
@@ -169,12 +324,56 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Result with the ID of the created account.
         """
-        response = self.accounts_gateway_client.open_deposit_account(user_id=user_id)
+        response = self.call(self.accounts_gateway_client.open_deposit_account, user_id=user_id)
         return SeedAccountResult(account_id=response.account.id)
 
-    def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+    def get_card_account_card_id(self, user_id: str, account_id: str) -> str:
+        """
+        Gets ID of the card the account was opened with.
+        Needed to make operations on accounts loaded from an existing seeding result.
+
+        Args:
+            user_id: User ID.
+            account_id: Account ID.
+
+        Returns:
+            str: ID of the account card.
+        """
+        response = self.call(self.accounts_gateway_client.get_accounts, user_id=user_id)
+        account = next(account for account in response.accounts if account.id == account_id)
+        return account.cards[0].id
+
+    @staticmethod
+    def count_missing_operations(plan: SeedAccountsPlan, account: SeedAccountResult) -> dict[str, int]:
         """
-        Opens a debit account for the user and optionally:
+        Counts operations missing in the card account according to the passed Plan.
+        Transfer and cash withdrawal operations are made as many as purchase operations.
+
+        Args:
+            plan: Card account Seed Plan.
+            account: Card account result.
+
+        Returns:
+            dict[str, int]: Number of missing operations by the account result field, never negative.
+        """
+        return {
+            'top_up_operations': max(0, plan.top_up_operations.count - len(account.top_up_operations)),
+            'purchase_operations': max(0, plan.purchase_operations.count - len(account.purchase_operations)),
+            'transfer_operations': max(0, plan.purchase_operations.count - len(account.transfer_operations)),
+            'cash_withdrawal_operations': max(
+                0, plan.purchase_operations.count - len(account.cash_withdrawal_operations)
+            ),
+        }
+
+    def complete_card_account_result(
+            self,
+            plan: SeedAccountsPlan,
+            user_id: str,
+            account: SeedAccountResult,
+            card_id: str | None = None
+    ) -> SeedAccountResult:
+        """
+        Issues cards and makes operations missing in the card account according to the passed Plan:
         - issues physical cards
         - issues virtual cards
         - makes top-up operations
@@ -182,6 +381,55 @@ class SeedsBuilder:
         - makes transfer operations
         - makes cash withdrawal operations
 
+        Args:
+            plan: Card account Seed Plan.
+            user_id: User ID.
+            account: Card account result to complete.
+            card_id: ID of the account card. Is requested from the gateway if not passed and operations are missing.
+
+        Returns:
+            SeedAccountResult: The same account result with all the missing cards and operations added.
+        """
+        account_id = account.account_id
+
+        account.physical_cards.extend(
+            self.build_physical_card_result(user_id=user_id, account_id=account_id)
+            for _ in range(plan.physical_cards.count - len(account.physical_cards))
+        )
+        account.virtual_cards.extend(
+            self.build_virtual_card_result(user_id=user_id, account_id=account_id)
+            for _ in range(plan.virtual_cards.count - len(account.virtual_cards))
+        )
+
+        missing_operations = self.count_missing_operations(plan=plan, account=account)
+        if not any(count > 0 for count in missing_operations.values()):
+            return account
+
+        card_id = card_id or self.get_card_account_card_id(user_id=user_id, account_id=account_id)
+
+        account.top_up_operations.extend(
+            self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
+            for _ in range(missing_operations['top_up_operations'])
+        )
+        account.purchase_operations.extend(
+            self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
+            for _ in range(missing_operations['purchase_operations'])
+        )
+        account.transfer_operations.extend(
+            self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
+            for _ in range(missing_operations['transfer_operations'])
+        )
+        account.cash_withdrawal_operations.extend(
+            self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
+            for _ in range(missing_operations['cash_withdrawal_operations'])
+        )
+        return account
+
+    def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+        """
+        Opens a debit account for the user and optionally issues cards and makes operations
+        (see `complete_card_account_result`).
+
         Args:
             plan: Debit account Seed Plan.
             user_id: User ID.
@@ -189,47 +437,19 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Result with the ID of the created account and additional options (cards, operations)
         """
-        response = self.accounts_gateway_client.open_debit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
-
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
+        response = self.call(self.accounts_gateway_client.open_debit_card_account, user_id=user_id)
+
+        return self.complete_card_account_result(
+            plan=plan,
+            user_id=user_id,
+            account=SeedAccountResult(account_id=response.account.id),
+            card_id=response.account.cards[0].id
         )
 
     def build_credit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
         """
-        Opens a credit account for the user and optionally:
-        - issues physical cards
-        - issues virtual cards
-        - makes top-up operations
-        - makes purchase operations
-        - makes transfer operations
-        - makes cash withdrawal operations
+        Opens a credit account for the user and optionally issues cards and makes operations
+        (see `complete_card_account_result`).
 
         Args:
             plan: Credit account Seed Plan.
@@ -238,38 +458,55 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Result with the ID of the created account and its operation details.
         """
-        response = self.accounts_gateway_client.open_credit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
-
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
+        response = self.call(self.accounts_gateway_client.open_credit_card_account, user_id=user_id)
+
+        return self.complete_card_account_result(
+            plan=plan,
+            user_id=user_id,
+            account=SeedAccountResult(account_id=response.account.id),
+            card_id=response.account.cards[0].id
         )
 
+    def complete_user(self, plan: SeedUsersPlan, user: SeedUserResult) -> SeedUserResult:
+        """
+        Adds everything the user is missing according to the passed Plan:
+        - opens missing savings and deposit accounts.
+        - completes existing debit and credit accounts with missing cards and operations.
+        - creates missing debit and credit accounts with cards and operations.
+
+        Args:
+            plan: Seed User plan
+            user: User result to complete.
+
+        Returns:
+            SeedUserResult: The same user result with all the missing entities added.
+        """
+        user_id = user.user_id
+
+        user.savings_accounts.extend(
+            self.build_savings_account_result(user_id=user_id)
+            for _ in range(plan.savings_accounts.count - len(user.savings_accounts))
+        )
+        user.deposit_accounts.extend(
+            self.build_deposit_account_result(user_id=user_id)
+            for _ in range(plan.deposit_accounts.count - len(user.deposit_accounts))
+        )
+
+        for account in user.debit_card_accounts:
+            self.complete_card_account_result(plan=plan.debit_card_accounts, user_id=user_id, account=account)
+        user.debit_card_accounts.extend(
+            self.build_debit_card_account_result(plan=plan.debit_card_accounts, user_id=user_id)
+            for _ in range(plan.debit_card_accounts.count - len(user.debit_card_accounts))
+        )
+
+        for account in user.credit_card_accounts:
+            self.complete_card_account_result(plan=plan.credit_card_accounts, user_id=user_id, account=account)
+        user.credit_card_accounts.extend(
+            self.build_credit_card_account_result(plan=plan.credit_card_accounts, user_id=user_id)
+            for _ in range(plan.credit_card_accounts.count - len(user.credit_card_accounts))
+        )
+        return user
+
     def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
         """
         Create user and does the following according to the passed Plan:
@@ -282,41 +519,132 @@ class SeedsBuilder:
         Returns:
             SeedUserResult: Result with user ID and all the created entities.
         """
-        response = self.users_gateway_client.create_user()
-
-        return SeedUserResult(
-            user_id=response.user.id,
-            savings_accounts=[
-                self.build_savings_account_result(user_id=response.user.id)
-                for _ in range(plan.savings_accounts.count)
-            ],
-            deposit_accounts=[
-                self.build_deposit_account_result(user_id=response.user.id)
-                for _ in range(plan.deposit_accounts.count)
-            ],
-            debit_card_accounts=[
-                self.build_debit_card_account_result(plan=plan.debit_card_accounts, user_id=response.user.id)
-                for _ in range(plan.debit_card_accounts.count)
-            ],
-            credit_card_accounts=[
-                self.build_credit_card_account_result(plan=plan.credit_card_accounts, user_id=response.user.id)
-                for _ in range(plan.credit_card_accounts.count)
-            ]
+        response = self.call(self.users_gateway_client.create_user)
+
+        return self.complete_user(plan=plan, user=SeedUserResult(user_id=response.user.id))
+
+    def iter_build(self, plan: SeedsPlan, result: SeedsResult | None = None) -> Iterator[SeedUserResult]:
+        """
+        Builds users based on the passed Plan, up to `concurrency` users at a time,
+        and yields every user as soon as it is completed.
+
+        If an existing result is passed, only the difference against the Plan is built
+        (missing users and missing accounts, cards and operations of existing users);
+        existing users are yielded as well.
+
+        Once all the users are built, the run summary is available in `report`.
+
+        Args:
+            plan: Global test data generation plan.
+            result: Previously generated result to top up.
+
+        Returns:
+            Iterator[SeedUserResult]: Built users in order of completion.
+        """
+        existing_users = result.users if result else []
+        missing_users_count = max(0, plan.users.count - len(existing_users))
+
+        self.metrics = SeedsMetrics()
+        pool = Pool(size=self.concurrency)
+        progress = SeedsProgress(
+            total=len(existing_users) + missing_users_count,
+            metrics=self.metrics,
+            concurrency=self.concurrency
         )
 
-    def build(self, plan: SeedsPlan) -> SeedsResult:
+        def build_user(user: SeedUserResult | None) -> tuple[SeedUserResult, int]:
+            if user is None:
+                user = self.build_user(plan=plan.users)
+                return user, user.entities_count
+
+            entities_count = user.entities_count
+            user = self.complete_user(plan=plan.users, user=user)
+            return user, user.entities_count - entities_count
+
+        for user, created_entities_count in pool.imap_unordered(
+                build_user, [*existing_users, *[None] * missing_users_count]
+        ):
+            # Nothing is really created in dry-run mode, so there is no progress to log
+            if not self.dry_run:
+                progress.update(created_entities_count)
+            yield user
+
+        if not self.dry_run:
+            self.report = progress.finish()
+
+    def verify_user(self, user: SeedUserResult) -> bool:
+        """
+        Checks that the user and all its accounts still exist in the gateway.
+        Calls are not retried: a missing entity is an expected outcome here.
+
+        Args:
+            user: Seeded user to check.
+
+        Returns:
+            bool: True if the user and all its accounts are found.
+        """
+        try:
+            self.users_gateway_client.get_user(user_id=user.user_id)
+            response = self.accounts_gateway_client.get_accounts(user_id=user.user_id)
+        except CALL_ERRORS:
+            return False
+
+        account_ids = {account.id for account in response.accounts}
+        return all(account.account_id in account_ids for account in user.accounts)
+
+    def find_invalid_users(self, users: list[SeedUserResult]) -> set[str]:
+        """
+        Checks the passed users, up to `concurrency` users at a time (see `verify_user`).
+
+        Args:
+            users: Seeded users to check.
+
+        Returns:
+            set[str]: IDs of the users missing in the gateway or having missing accounts.
+        """
+        pool = Pool(size=self.concurrency)
+        return {
+            user.user_id
+            for user, is_valid in pool.imap_unordered(lambda user: (user, self.verify_user(user)), users)
+            if not is_valid
+        }
+
+    def count_calls(self, plan: SeedsPlan) -> dict[str, int]:
+        """
+        Counts gateway calls needed to build the data from scratch according to the passed Plan.
+        The Plan is traversed exactly as `build` does it, but in dry-run mode, so nothing is called.
+
+        Args:
+            plan: Global test data generation plan.
+
+        Returns:
+            dict[str, int]: Number of calls by the client method name.
+        """
+        dry_run, self.dry_run = self.dry_run, True
+        try:
+            for _ in self.iter_build(plan=plan):
+                pass
+        finally:
+            self.dry_run = dry_run
+
+        return self.metrics.counts()
+
+    def build(self, plan: SeedsPlan, result: SeedsResult | None = None) -> SeedsResult:
         """
         Generates a final full test data structure based on the passed Plan:
-        - creates a desired amount of users.
+        - creates a desired amount of users, up to `concurrency` users at a time.
         - each user get theirs accounts, cards and operations.
 
+        If an existing result is passed, it is topped up with the missing data (see `iter_build`).
+
         Args:
             plan: Global test data generation plan.
+            result: Previously generated result to top up.
 
         Returns:
             SeedsResult: Result with all the generated users' data.
         """
-        return SeedsResult(users=[self.build_user(plan=plan.users) for _ in range(plan.users.count)])
+        return SeedsResult(users=list(self.iter_build(plan=plan, result=result)))
 
 
 def build_grpc_seeds_builder() -> SeedsBuilder:
@@ -330,7 +658,10 @@ def build_grpc_seeds_builder() -> SeedsBuilder:
         users_gateway_client=build_users_gateway_grpc_client(),
         cards_gateway_client=build_cards_gateway_grpc_client(),
         accounts_gateway_client=build_accounts_gateway_grpc_client(),
-        operations_gateway_client=build_operations_gateway_grpc_client()
+        operations_gateway_client=build_operations_gateway_grpc_client(),
+        concurrency=settings.seeds.concurrency,
+        retries=settings.seeds.retries,
+        retry_backoff=settings.seeds.retry_backoff
     )
 
 
@@ -345,5 +676,8 @@ def build_http_seeds_builder():
         users_gateway_client=build_users_gateway_http_client(),
         cards_gateway_client=build_cards_gateway_http_client(),
         accounts_gateway_client=build_accounts_gateway_http_client(),
-        operations_gateway_client=build_operations_gateway_http_client()
+        operations_gateway_client=build_operations_gateway_http_client(),
+        concurrency=settings.seeds.concurrency,
+        retries=settings.seeds.retries,
+        retry_backoff=settings.seeds.retry_backoff
     )
@@ -0,0 +1,274 @@
+from array import array
+from typing import Iterable
+
+from seeds.schema.result import SeedUserResult, SeedAccountResult
+from tools.rng import get_random
+
+
+class CompactIds:
+    """
+    Column of entity IDs grouped by their parent entity.
+
+    IDs of all the children are stored in a single flat list,
+    children of the parent with index `i` are `ids[offsets[i]:offsets[i + 1]]`.
+    """
+
+    __slots__ = ('ids', 'offsets')
+
+    def __init__(self):
+        self.ids: list[str] = []
+        self.offsets = array('L', [0])
+
+    def append(self, ids: Iterable[str]) -> None:
+        """
+        Adds IDs of the next parent's children.
+
+        :param ids: Children IDs.
+        """
+        self.ids.extend(ids)
+        self.offsets.append(len(self.ids))
+
+    def get(self, parent: int) -> list[str]:
+        """
+        Returns IDs of the parent's children.
+
+        :param parent: Index of the parent.
+        :return: Children IDs.
+        """
+        return self.ids[self.offsets[parent]:self.offsets[parent + 1]]
+
+    def range(self, parent: int) -> range:
+        """
+        Returns indexes of the parent's children in the column.
+
+        :param parent: Index of the parent.
+        :return: Children indexes.
+        """
+        return range(self.offsets[parent], self.offsets[parent + 1])
+
+
+class CompactAccounts:
+    """
+    Columns of accounts of a single type (i.e., credit card accounts) and their cards and operations.
+
+    Accounts are grouped by user, cards and operations are grouped by account.
+    """
+
+    __slots__ = (
+        'accounts',
+        'physical_cards',
+        'virtual_cards',
+        'top_up_operations',
+        'purchase_operations',
+        'transfer_operations',
+        'cash_withdrawal_operations',
+    )
+
+    def __init__(self):
+        self.accounts = CompactIds()
+        self.physical_cards = CompactIds()
+        self.virtual_cards = CompactIds()
+        self.top_up_operations = CompactIds()
+        self.purchase_operations = CompactIds()
+        self.transfer_operations = CompactIds()
+        self.cash_withdrawal_operations = CompactIds()
+
+    def append(self, accounts: list[SeedAccountResult]) -> None:
+        """
+        Adds accounts of the next user.
+
+        :param accounts: User accounts of this type.
+        """
+        self.accounts.append(account.account_id for account in accounts)
+
+        for account in accounts:
+            self.physical_cards.append(card.card_id for card in account.physical_cards)
+            self.virtual_cards.append(card.card_id for card in account.virtual_cards)
+            self.top_up_operations.append(operation.operation_id for operation in account.top_up_operations)
+            self.purchase_operations.append(operation.operation_id for operation in account.purchase_operations)
+            self.transfer_operations.append(operation.operation_id for operation in account.transfer_operations)
+            self.cash_withdrawal_operations.append(
+                operation.operation_id for operation in account.cash_withdrawal_operations
+            )
+
+
+class SeedCardView:
+    """
+    Lightweight read-only analogue of SeedCardResult.
+    """
+
+    __slots__ = ('card_id',)
+
+    def __init__(self, card_id: str):
+        self.card_id = card_id
+
+
+class SeedOperationView:
+    """
+    Lightweight read-only analogue of SeedOperationResult.
+    """
+
+    __slots__ = ('operation_id',)
+
+    def __init__(self, operation_id: str):
+        self.operation_id = operation_id
+
+
+class SeedAccountView:
+    """
+    Lightweight read-only analogue of SeedAccountResult backed by CompactAccounts columns.
+    """
+
+    __slots__ = ('columns', 'index')
+
+    def __init__(self, columns: CompactAccounts, index: int):
+        self.columns = columns
+        self.index = index
+
+    @property
+    def account_id(self) -> str:
+        return self.columns.accounts.ids[self.index]
+
+    @property
+    def physical_cards(self) -> list[SeedCardView]:
+        return [SeedCardView(card_id) for card_id in self.columns.physical_cards.get(self.index)]
+
+    @property
+    def virtual_cards(self) -> list[SeedCardView]:
+        return [SeedCardView(card_id) for card_id in self.columns.virtual_cards.get(self.index)]
+
+    @property
+    def top_up_operations(self) -> list[SeedOperationView]:
+        return [SeedOperationView(operation_id) for operation_id in self.columns.top_up_operations.get(self.index)]
+
+    @property
+    def purchase_operations(self) -> list[SeedOperationView]:
+        return [SeedOperationView(operation_id) for operation_id in self.columns.purchase_operations.get(self.index)]
+
+    @property
+    def transfer_operations(self) -> list[SeedOperationView]:
+        return [SeedOperationView(operation_id) for operation_id in self.columns.transfer_operations.get(self.index)]
+
+    @property
+    def cash_withdrawal_operations(self) -> list[SeedOperationView]:
+        return [
+            SeedOperationView(operation_id)
+            for operation_id in self.columns.cash_withdrawal_operations.get(self.index)
+        ]
+
+
+class SeedUserView:
+    """
+    Lightweight read-only analogue of SeedUserResult backed by CompactSeedsResult columns.
+    """
+
+    __slots__ = ('result', 'index')
+
+    def __init__(self, result: 'CompactSeedsResult', index: int):
+        self.result = result
+        self.index = index
+
+    @property
+    def user_id(self) -> str:
+        return self.result.user_ids[self.index]
+
+    def get_accounts(self, columns: CompactAccounts) -> list[SeedAccountView]:
+        return [SeedAccountView(columns, index) for index in columns.accounts.range(self.index)]
+
+    @property
+    def deposit_accounts(self) -> list[SeedAccountView]:
+        return self.get_accounts(self.result.deposit_accounts)
+
+    @property
+    def savings_accounts(self) -> list[SeedAccountView]:
+        return self.get_accounts(self.result.savings_accounts)
+
+    @property
+    def debit_card_accounts(self) -> list[SeedAccountView]:
+        return self.get_accounts(self.result.debit_card_accounts)
+
+    @property
+    def credit_card_accounts(self) -> list[SeedAccountView]:
+        return self.get_accounts(self.result.credit_card_accounts)
+
+
+class CompactSeedsResult:
+    """
+    Memory-efficient read-only analogue of SeedsResult for large user pools.
+
+    Instead of nested pydantic models all the IDs are kept in flat columns with offset tables,
+    users are accessed through lightweight views with the same attributes as SeedUserResult.
+    Exposes the same `get_next_user`/`get_random_user` API, so can be used by scenarios as is.
+    """
+
+    def __init__(self):
+        self.user_ids: list[str] = []
+        self.deposit_accounts = CompactAccounts()
+        self.savings_accounts = CompactAccounts()
+        self.debit_card_accounts = CompactAccounts()
+        self.credit_card_accounts = CompactAccounts()
+        self.cursor = 0
+
+    @classmethod
+    def from_users(cls, users: Iterable[SeedUserResult]) -> 'CompactSeedsResult':
+        """
+        Builds compact result from users, i.e. from users lazily read from a dump.
+
+        :param users: Seeding result users.
+        :return: CompactSeedsResult with all the users' data.
+        """
+        result = cls()
+        for user in users:
+            result.append(user)
+        return result
+
+    def __len__(self) -> int:
+        return len(self.user_ids)
+
+    def append(self, user: SeedUserResult) -> None:
+        """
+        Adds the user with all the nested entities.
+
+        :param user: Seeding result user.
+        """
+        self.user_ids.append(user.user_id)
+        self.deposit_accounts.append(user.deposit_accounts)
+        self.savings_accounts.append(user.savings_accounts)
+        self.debit_card_accounts.append(user.debit_card_accounts)
+        self.credit_card_accounts.append(user.credit_card_accounts)
+
+    def get_user(self, index: int) -> SeedUserView:
+        """
+        Returns the user by its index.
+
+        :param index: Index of the user.
+        :return: SeedUserView of the user.
+        """
+        if not 0 <= index < len(self):
+            raise IndexError('Seeds user index out of range')
+
+        return SeedUserView(self, index)
+
+    def get_next_user(self) -> SeedUserView:
+        """
+        Returns the next user. Each user is returned only once.
+
+        Used when for each Virtual User a new test user is required.
+
+        Returns:
+            SeedUserView: The next user.
+        """
+        user = self.get_user(self.cursor)
+        self.cursor += 1
+        return user
+
+    def get_random_user(self) -> SeedUserView:
+        """
+        Returns a random user.
+
+        Used when the order is not important and the user is chosen randomly.
+
+        Returns:
+            SeedUserView: A random user.
+        """
+        return self.get_user(get_random().randrange(len(self)))
@@ -0,0 +1,65 @@
+from config import settings
+from seeds.compact import SeedUserView
+from seeds.pool import SeedUsersSource
+from seeds.schema.result import SeedUserResult
+from tools.rng import get_random
+
+HOT_STATS_TAG = 'hot'
+COLD_STATS_TAG = 'cold'
+
+
+class HotAccountsRouter:
+    """
+    Routes a share of the writes of a scenario to a small set of hot seed users, so that concurrent writes
+    hit the same accounts and exercise row-level lock contention in the backend services.
+
+    The hot users are the first `hot_count` users of the seeding result (of the worker shard in distributed runs).
+    Writes are tagged 'hot' or 'cold', so their latency and error rates are reported separately
+    (see `tools.locust.tags.stats_tag`).
+    """
+
+    def __init__(self, users: SeedUsersSource, hot_fraction: float = 0.0, hot_count: int = 1):
+        """
+        :param users: Seeding result to take the hot users from.
+        :param hot_fraction: Share of the writes routed to the hot users; 0 — routing is disabled.
+        :param hot_count: Number of the hot users.
+        """
+        self.hot_fraction = hot_fraction
+        self.hot_users = [users.get_user(index) for index in range(min(len(users), max(1, hot_count)))]
+
+    @property
+    def enabled(self) -> bool:
+        return self.hot_fraction > 0 and bool(self.hot_users)
+
+    def route(
+            self,
+            user: SeedUserResult | SeedUserView
+    ) -> tuple[SeedUserResult | SeedUserView, str | None]:
+        """
+        Picks the seed user to write to instead of the virtual user own seed user.
+
+        :param user: Seed user of the virtual user.
+        :return: Seed user to write to and the stats tag of the write; no tag if routing is disabled.
+        """
+        if not self.enabled:
+            return user, None
+
+        random = get_random()
+        if random.random() < self.hot_fraction:
+            return random.choice(self.hot_users), HOT_STATS_TAG
+
+        return user, COLD_STATS_TAG
+
+
+def build_hot_accounts_router(users: SeedUsersSource) -> HotAccountsRouter:
+    """
+    Creates hot accounts router configured with `CONTENTION.*` settings.
+
+    :param users: Seeding result to take the hot users from.
+    :return: Ready-to-use HotAccountsRouter.
+    """
+    return HotAccountsRouter(
+        users=users,
+        hot_fraction=settings.contention.hot_fraction,
+        hot_count=settings.contention.hot_accounts
+    )
@@ -1,38 +1,407 @@
+import gzip
 import os
+from array import array
+from typing import IO, Iterable, Iterator
 
-from seeds.schema.result import SeedsResult
+from config import settings
+from seeds.schema.meta import SeedsMeta
+from seeds.schema.metrics import SeedsMetricsReport
+from seeds.schema.recording import SeedsRecord
+from seeds.schema.result import SeedsResult, SeedUserResult
+from seeds.schema.sweep import VolumeSweepReport
+from tools.config.seeds import SeedsDumpFormat, SeedsDumpCompression
 from tools.logger import get_logger
+from tools.rng import get_random
 
-SEEDS_FILE = './dumps/{}_seeds.json'
+try:
+    import zstandard
+except ImportError:  # zstd compression of dumps is optional
+    zstandard = None
+
+SEEDS_FILE = './dumps/{}_seeds.{}'
+SEEDS_META_FILE = './dumps/{}_seeds.meta.json'
+SEEDS_CHECKPOINT_FILE = './dumps/{}_seeds.checkpoint.jsonl'
+SEEDS_METRICS_FILE = './dumps/{}_seeds.metrics.json'
+SEEDS_SWEEP_FILE = './dumps/{}_sweep.json'
+SEEDS_RECORDING_FILE = './dumps/{}_seeds.recording.jsonl'
+
+SEEDS_FILE_EXTENSIONS = {
+    SeedsDumpCompression.NONE: '',
+    SeedsDumpCompression.GZIP: '.gz',
+    SeedsDumpCompression.ZSTD: '.zst',
+}
 
 logger = get_logger('SEEDS_DUMPS')
 
 
-def save_seeds_result(result: SeedsResult, scenario: str):
+def get_seeds_file(scenario: str) -> str:
     """
-    Saves SeedsResult into a JSON-file.
+    Builds seeding result file path according to the dump format and compression settings.
 
-    :param result: Seeding result generated by seeding builder.
+    :param scenario: Load test scenario name (i.e., 'credit_card_test').
+    :return: File path, i.e. './dumps/credit_card_test_seeds.jsonl.gz'.
+    """
+    extension = settings.seeds.dump_format + SEEDS_FILE_EXTENSIONS[settings.seeds.dump_compression]
+    return SEEDS_FILE.format(scenario, extension)
+
+
+def open_seeds_file(file: str, mode: str) -> IO[str]:
+    """
+    Opens seeding result file as a text stream, transparently (de)compressing it.
+
+    :param file: Seeding result file path.
+    :param mode: 'r' to read or 'w' to write.
+    :return: Text stream of the file.
+    """
+    match settings.seeds.dump_compression:
+        case SeedsDumpCompression.GZIP:
+            return gzip.open(file, f'{mode}t', encoding='utf-8')
+        case SeedsDumpCompression.ZSTD:
+            if zstandard is None:
+                raise ImportError('zstd compression of seeds dumps requires `zstandard` package to be installed')
+            return zstandard.open(file, f'{mode}t', encoding='utf-8')
+        case _:
+            return open(file, mode, encoding='utf-8')
+
+
+def save_seeds_users(users: Iterable[SeedUserResult], scenario: str) -> int:
+    """
+    Saves seeding result users into a file as soon as they are produced.
+
+    In JSONL format every user is appended to the file right after it is built,
+    in JSON format the users are collected into SeedsResult first.
+    The data is written to a temporary file which replaces the previous dump only when all the users are saved.
+
+    :param users: Seeding result users, i.e. a generator yielding users built by seeding builder.
     :param scenario: Load test scenario name for which the data is generated.
-                     Used to generate JSON-file name (i.e., 'credit_card_test').
+    :return: Number of saved users.
     """
     # Make sure that `dumps` directory exists
     if not os.path.exists('dumps'):
         os.mkdir('dumps')
 
-    with open(SEEDS_FILE.format(scenario), 'w+', encoding='utf-8') as file:
-        file.write(result.model_dump_json())
-    logger.debug(f'Seeding result saved to file: {SEEDS_FILE.format(scenario)}')
+    file = get_seeds_file(scenario)
+    with open_seeds_file(f'{file}.tmp', 'w') as stream:
+        if settings.seeds.dump_format == SeedsDumpFormat.JSONL:
+            count = 0
+            for user in users:
+                stream.write(user.model_dump_json() + '\n')
+                count += 1
+        else:
+            result = SeedsResult(users=list(users))
+            stream.write(result.model_dump_json())
+            count = len(result.users)
+
+    os.replace(f'{file}.tmp', file)
+    logger.debug(f'Seeding result saved to file: {file}')
+    return count
+
+
+def save_seeds_result(result: SeedsResult, scenario: str):
+    """
+    Saves SeedsResult into a file.
+
+    :param result: Seeding result generated by seeding builder.
+    :param scenario: Load test scenario name for which the data is generated.
+                     Used to generate file name (i.e., 'credit_card_test').
+    """
+    save_seeds_users(users=result.users, scenario=scenario)
+
+
+def iter_seeds_users(scenario: str) -> Iterator[SeedUserResult]:
+    """
+    Lazily reads seeding result users from a file.
+
+    Only JSONL dumps are read user by user, JSON dump has to be loaded as a whole.
+
+    :param scenario: Load test scenario name for which the data needs to be loaded.
+    :return: Iterator over the saved users.
+    """
+    with open_seeds_file(get_seeds_file(scenario), 'r') as stream:
+        if settings.seeds.dump_format == SeedsDumpFormat.JSONL:
+            for line in stream:
+                if line.strip():
+                    yield SeedUserResult.model_validate_json(line)
+        else:
+            yield from SeedsResult.model_validate_json(stream.read()).users
 
 
 def load_seeds_result(scenario: str) -> SeedsResult:
     """
-    Loads seeding result from a JSON-file.
+    Loads seeding result from a file.
 
     :param scenario: Load test scenario name for which the data needs to be loaded.
     :return: SeedsResult object restored from the file.
     """
-    with open(SEEDS_FILE.format(scenario), 'r', encoding="utf-8") as file:
-        result = SeedsResult.model_validate_json(file.read())
-    logger.debug(f'Seeding result loaded from file: {SEEDS_FILE.format(scenario)}')
+    result = SeedsResult(users=list(iter_seeds_users(scenario)))
+    logger.debug(f'Seeding result loaded from file: {get_seeds_file(scenario)}')
     return result
+
+
+class SeedsDumpReader:
+    """
+    Random access reader of an uncompressed JSONL seeding result dump.
+
+    Only byte offsets of the lines are kept in memory, users are parsed on demand.
+    Exposes the same `get_next_user`/`get_random_user` API as SeedsResult,
+    so can be used by scenarios instead of a fully loaded result.
+    """
+
+    def __init__(self, scenario: str):
+        """
+        :param scenario: Load test scenario name for which the data needs to be read.
+        """
+        if settings.seeds.dump_format != SeedsDumpFormat.JSONL:
+            raise ValueError('Random access is supported for JSONL seeds dumps only')
+        if settings.seeds.dump_compression != SeedsDumpCompression.NONE:
+            raise ValueError('Random access is supported for uncompressed seeds dumps only')
+
+        self.file = get_seeds_file(scenario)
+        self.offsets = array('Q')
+        self.cursor = 0
+
+        with open(self.file, 'rb') as stream:
+            offset = 0
+            for line in stream:
+                if line.strip():
+                    self.offsets.append(offset)
+                offset += len(line)
+
+        self.stream = open(self.file, 'rb')
+        logger.debug(f'Seeding result indexed: {len(self.offsets)} users in {self.file}')
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __iter__(self) -> Iterator[SeedUserResult]:
+        return (self.get_user(index) for index in range(len(self)))
+
+    def get_user(self, index: int) -> SeedUserResult:
+        """
+        Reads the user by its index in the dump.
+
+        :param index: Index of the user.
+        :return: SeedUserResult parsed from the dump line.
+        """
+        self.stream.seek(self.offsets[index])
+        return SeedUserResult.model_validate_json(self.stream.readline())
+
+    def get_next_user(self) -> SeedUserResult:
+        """
+        Returns the next user from the dump. Each user is returned only once.
+
+        :return: The next user from the dump.
+        """
+        if self.cursor >= len(self):
+            raise IndexError('All the users from the seeds dump have already been taken')
+
+        user = self.get_user(self.cursor)
+        self.cursor += 1
+        return user
+
+    def get_random_user(self) -> SeedUserResult:
+        """
+        Returns a random user from the dump.
+
+        :return: A random user.
+        """
+        return self.get_user(get_random().randrange(len(self)))
+
+    def close(self) -> None:
+        self.stream.close()
+
+
+def save_seeds_meta(meta: SeedsMeta, scenario: str):
+    """
+    Saves seeding result metadata into a JSON-file next to the seeding result.
+
+    :param meta: Metadata describing the seeding result.
+    :param scenario: Load test scenario name for which the data is generated.
+    """
+    if not os.path.exists('dumps'):
+        os.mkdir('dumps')
+
+    with open(SEEDS_META_FILE.format(scenario), 'w+', encoding='utf-8') as file:
+        file.write(meta.model_dump_json())
+    logger.debug(f'Seeding metadata saved to file: {SEEDS_META_FILE.format(scenario)}')
+
+
+def load_seeds_meta(scenario: str) -> SeedsMeta | None:
+    """
+    Loads seeding result metadata from a JSON-file.
+
+    :param scenario: Load test scenario name for which the metadata needs to be loaded.
+    :return: SeedsMeta object or None if either the seeding result or its metadata doesn't exist.
+    """
+    if not (os.path.exists(get_seeds_file(scenario)) and os.path.exists(SEEDS_META_FILE.format(scenario))):
+        return None
+
+    with open(SEEDS_META_FILE.format(scenario), 'r', encoding='utf-8') as file:
+        return SeedsMeta.model_validate_json(file.read())
+
+
+def checkpoint_seeds_users(
+        users: Iterable[SeedUserResult],
+        meta: SeedsMeta,
+        scenario: str
+) -> Iterator[SeedUserResult]:
+    """
+    Appends every user to the checkpoint file as soon as it is produced and passes it on.
+    Keeps the users already built if seeding is interrupted, so the next run can resume from them.
+
+    The first line of the checkpoint file is the metadata of the run that started it,
+    the following lines are users in JSONL format. A user checkpointed several times is restored
+    from its latest line (see `load_seeds_checkpoint`).
+
+    :param users: Seeding result users, i.e. a generator yielding users built by seeding builder.
+    :param meta: Metadata of the seeding run, written only when a new checkpoint file is started.
+    :param scenario: Load test scenario name for which the data is generated.
+    :return: Iterator over the passed users.
+    """
+    if not os.path.exists('dumps'):
+        os.mkdir('dumps')
+
+    file = SEEDS_CHECKPOINT_FILE.format(scenario)
+    is_new = not os.path.exists(file)
+    with open(file, 'a', encoding='utf-8') as stream:
+        if is_new:
+            stream.write(meta.model_dump_json() + '\n')
+
+        for user in users:
+            stream.write(user.model_dump_json() + '\n')
+            stream.flush()
+            yield user
+
+
+def load_seeds_checkpoint(scenario: str) -> tuple[SeedsMeta, SeedsResult] | None:
+    """
+    Loads users saved to the checkpoint file by an interrupted seeding run.
+    A line left incomplete by the interruption is skipped.
+
+    :param scenario: Load test scenario name for which the checkpoint needs to be loaded.
+    :return: Metadata of the interrupted run and the checkpointed users or None if there is no checkpoint.
+    """
+    file = SEEDS_CHECKPOINT_FILE.format(scenario)
+    if not os.path.exists(file):
+        return None
+
+    with open(file, 'r', encoding='utf-8') as stream:
+        try:
+            meta = SeedsMeta.model_validate_json(stream.readline())
+        except ValueError:
+            logger.warning(f'Seeding checkpoint is corrupted and ignored: {file}')
+            return None
+
+        users: dict[str, SeedUserResult] = {}
+        for line in stream:
+            try:
+                user = SeedUserResult.model_validate_json(line)
+            except ValueError:
+                logger.warning(f'Incomplete line in seeding checkpoint skipped: {file}')
+                continue
+            users[user.user_id] = user
+
+    logger.debug(f'Seeding checkpoint loaded from file: {file}')
+    return meta, SeedsResult(users=list(users.values()))
+
+
+def remove_seeds_checkpoint(scenario: str):
+    """
+    Removes the checkpoint file once the seeding result is saved completely.
+
+    :param scenario: Load test scenario name for which the data is generated.
+    """
+    file = SEEDS_CHECKPOINT_FILE.format(scenario)
+    if os.path.exists(file):
+        os.remove(file)
+        logger.debug(f'Seeding checkpoint removed: {file}')
+
+
+def save_seeds_metrics(report: SeedsMetricsReport, scenario: str):
+    """
+    Saves seeding run summary into a JSON-file next to the seeding result.
+
+    :param report: Seeding run summary with timing of the gateway calls.
+    :param scenario: Load test scenario name for which the data is generated.
+    """
+    if not os.path.exists('dumps'):
+        os.mkdir('dumps')
+
+    with open(SEEDS_METRICS_FILE.format(scenario), 'w+', encoding='utf-8') as file:
+        file.write(report.model_dump_json(indent=2))
+    logger.debug(f'Seeding metrics saved to file: {SEEDS_METRICS_FILE.format(scenario)}')
+
+
+def load_seeds_metrics(scenario: str) -> SeedsMetricsReport | None:
+    """
+    Loads seeding run summary from a JSON-file.
+
+    :param scenario: Load test scenario name for which the summary needs to be loaded.
+    :return: SeedsMetricsReport object or None if no seeding run has been completed yet.
+    """
+    if not os.path.exists(SEEDS_METRICS_FILE.format(scenario)):
+        return None
+
+    with open(SEEDS_METRICS_FILE.format(scenario), 'r', encoding='utf-8') as file:
+        return SeedsMetricsReport.model_validate_json(file.read())
+
+
+def save_volume_sweep_report(report: VolumeSweepReport, scenario: str):
+    """
+    Saves data-volume sweep report into a JSON-file.
+
+    :param report: Latency-vs-result-size curves of the list endpoints.
+    :param scenario: Load test scenario name the sweep was run by.
+    """
+    if not os.path.exists('dumps'):
+        os.mkdir('dumps')
+
+    with open(SEEDS_SWEEP_FILE.format(scenario), 'w+', encoding='utf-8') as file:
+        file.write(report.model_dump_json(indent=2))
+    logger.debug(f'Volume sweep report saved to file: {SEEDS_SWEEP_FILE.format(scenario)}')
+
+
+def open_seeds_recording(scenario: str) -> IO[str]:
+    """
+    Opens the recording file for appending entities created by load test scenarios.
+    The file is line-buffered, so every record is on disk as soon as it is written
+    and the records survive an interrupted test.
+
+    :param scenario: Seeding scenario name the entities are recorded for.
+    :return: Text stream of the file, one SeedsRecord per line is expected.
+    """
+    if not os.path.exists('dumps'):
+        os.mkdir('dumps')
+
+    return open(SEEDS_RECORDING_FILE.format(scenario), 'a', buffering=1, encoding='utf-8')
+
+
+def iter_seeds_records(scenario: str) -> Iterator[SeedsRecord]:
+    """
+    Lazily reads recorded entities. A line left incomplete by an interrupted test is skipped.
+
+    :param scenario: Seeding scenario name the entities are recorded for.
+    :return: Iterator over the records in order they were written.
+    """
+    file = SEEDS_RECORDING_FILE.format(scenario)
+    if not os.path.exists(file):
+        return
+
+    with open(file, 'r', encoding='utf-8') as stream:
+        for line in stream:
+            try:
+                yield SeedsRecord.model_validate_json(line)
+            except ValueError:
+                logger.warning(f'Incomplete line in seeding recording skipped: {file}')
+
+
+def remove_seeds_recording(scenario: str):
+    """
+    Removes the recording file once the recorded entities are merged into the seeding result.
+
+    :param scenario: Seeding scenario name the entities are recorded for.
+    """
+    file = SEEDS_RECORDING_FILE.format(scenario)
+    if os.path.exists(file):
+        os.remove(file)
+        logger.debug(f'Seeding recording removed: {file}')
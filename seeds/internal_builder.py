@@ -0,0 +1,357 @@
+from clients.grpc.services.accounts.client import build_accounts_service_grpc_client, AccountsServiceGRPCClient
+from clients.grpc.services.cards.client import build_cards_service_grpc_client, CardsServiceGRPCClient
+from clients.grpc.services.operations.client import (
+    build_operations_service_grpc_client,
+    OperationsServiceGRPCClient
+)
+from clients.grpc.services.users.client import build_users_service_grpc_client, UsersServiceGRPCClient
+from config import settings
+from contracts.services.accounts.account_pb2 import AccountType
+from contracts.services.cards.card_pb2 import CardType
+from contracts.services.operations.operation_pb2 import OperationType
+from seeds.builder import CALL_ERRORS, SeedsBuilder
+from seeds.schema.plan import SeedAccountsPlan, SeedUsersPlan
+from seeds.schema.result import SeedAccountResult, SeedCardResult, SeedOperationResult, SeedUserResult
+from tools.fakers import fake
+
+
+class SeedsBalanceError(Exception):
+    pass
+
+
+class InternalSeedsBuilder(SeedsBuilder):
+    """
+    SeedsBuilder creating test data directly in the internal services, bypassing the gateway.
+
+    The gateway fans every call out to several services and validates it, here every entity
+    is a single internal call instead, which makes seeding of large data volumes (i.e. millions of
+    historical operations for read-heavy tests) practical. Concurrency, retries, dry run and metrics
+    work exactly as in SeedsBuilder, metrics are grouped by the internal client method names.
+
+    Differences from the gateway:
+    - a card account is created with a single card issued right after it, like the gateway does;
+    - operations are created completed and backdated to a random moment within the last year;
+    - account balance is updated once per account, by the net amount of the operations created by the run,
+      instead of being updated by every operation; amounts of the operations are drawn before any
+      of them is created and the first top-up is raised to cover the outgoing ones, so the balance
+      never goes negative, a plan with outgoing operations and no top-ups to cover them is rejected.
+
+    Attributes:
+        users_service_client: UsersService client.
+        cards_service_client: CardsService client.
+        accounts_service_client: AccountsService client.
+        operations_service_client: OperationsService client.
+        balances: Balance of every account created by the run which operations aren't created yet.
+        amounts: Drawn amounts of the operations to create for every account, by the account result field.
+    """
+
+    def __init__(
+            self,
+            users_service_client: UsersServiceGRPCClient,
+            cards_service_client: CardsServiceGRPCClient,
+            accounts_service_client: AccountsServiceGRPCClient,
+            operations_service_client: OperationsServiceGRPCClient,
+            concurrency: int = 1,
+            retries: int = 0,
+            retry_backoff: float = 0.5,
+            dry_run: bool = False
+    ):
+        self.users_service_client = users_service_client
+        self.cards_service_client = cards_service_client
+        self.accounts_service_client = accounts_service_client
+        self.operations_service_client = operations_service_client
+        self.init_options(concurrency=concurrency, retries=retries, retry_backoff=retry_backoff, dry_run=dry_run)
+        self.balances: dict[str, float] = {}
+        self.amounts: dict[str, dict[str, list[float]]] = {}
+
+    def build_card_result(self, account_id: str, card_type: CardType.ValueType) -> SeedCardResult:
+        """
+        Creates a card for the account.
+
+        Args:
+            account_id: Account ID.
+            card_type: Type of the card.
+
+        Returns:
+            SeedCardResult: Result with the ID of the created card.
+        """
+        response = self.call(self.cards_service_client.create_card, account_id=account_id, card_type=card_type)
+        return SeedCardResult(card_id=response.card.id)
+
+    def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        return self.build_card_result(account_id=account_id, card_type=CardType.CARD_TYPE_PHYSICAL)
+
+    def build_virtual_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        return self.build_card_result(account_id=account_id, card_type=CardType.CARD_TYPE_VIRTUAL)
+
+    def build_operation_result(
+            self,
+            card_id: str,
+            account_id: str,
+            operation_type: OperationType.ValueType,
+            amount: float
+    ) -> SeedOperationResult:
+        """
+        Creates a completed operation on the card.
+
+        Args:
+            card_id: Card ID.
+            account_id: Account ID.
+            operation_type: Type of the operation.
+            amount: Amount of the operation.
+
+        Returns:
+            SeedOperationResult: Result with the ID of the created operation.
+        """
+        response = self.call(
+            self.operations_service_client.create_operation,
+            card_id=card_id,
+            account_id=account_id,
+            operation_type=operation_type,
+            amount=amount
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    def pop_operation_amount(self, account_id: str, operations: str) -> float:
+        """
+        Takes the next drawn amount of the account operations (see `draw_operation_amounts`).
+
+        Args:
+            account_id: Account ID.
+            operations: Account result field of the operations, i.e. "top_up_operations".
+
+        Returns:
+            float: Amount of the operation.
+        """
+        return self.amounts[account_id][operations].pop()
+
+    def build_top_up_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        return self.build_operation_result(
+            card_id=card_id,
+            account_id=account_id,
+            operation_type=OperationType.OPERATION_TYPE_TOP_UP,
+            amount=self.pop_operation_amount(account_id=account_id, operations='top_up_operations')
+        )
+
+    def build_purchase_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        return self.build_operation_result(
+            card_id=card_id,
+            account_id=account_id,
+            operation_type=OperationType.OPERATION_TYPE_PURCHASE,
+            amount=self.pop_operation_amount(account_id=account_id, operations='purchase_operations')
+        )
+
+    def build_transfer_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        return self.build_operation_result(
+            card_id=card_id,
+            account_id=account_id,
+            operation_type=OperationType.OPERATION_TYPE_TRANSFER,
+            amount=self.pop_operation_amount(account_id=account_id, operations='transfer_operations')
+        )
+
+    def build_cash_withdrawal_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        return self.build_operation_result(
+            card_id=card_id,
+            account_id=account_id,
+            operation_type=OperationType.OPERATION_TYPE_CASH_WITHDRAWAL,
+            amount=self.pop_operation_amount(account_id=account_id, operations='cash_withdrawal_operations')
+        )
+
+    def build_account_result(self, user_id: str, account_type: AccountType.ValueType) -> SeedAccountResult:
+        """
+        Creates an account for the user.
+
+        Args:
+            user_id: User ID.
+            account_type: Type of the account.
+
+        Returns:
+            SeedAccountResult: Result with the ID of the created account.
+        """
+        response = self.call(
+            self.accounts_service_client.create_account,
+            user_id=user_id,
+            account_type=account_type
+        )
+        return SeedAccountResult(account_id=response.account.id)
+
+    def build_savings_account_result(self, user_id: str) -> SeedAccountResult:
+        return self.build_account_result(user_id=user_id, account_type=AccountType.ACCOUNT_TYPE_SAVINGS)
+
+    def build_deposit_account_result(self, user_id: str) -> SeedAccountResult:
+        return self.build_account_result(user_id=user_id, account_type=AccountType.ACCOUNT_TYPE_DEPOSIT)
+
+    def get_card_account_card_id(self, user_id: str, account_id: str) -> str:
+        response = self.call(self.cards_service_client.get_cards, account_id=account_id)
+        return response.cards[0].id
+
+    def draw_operation_amounts(self, account_id: str, balance: float, missing_operations: dict[str, int]) -> float:
+        """
+        Draws amounts of the operations missing in the account before any of them is created.
+        Outgoing amounts are drawn first, then the first top-up is raised by their excess over
+        the current balance plus a random margin, so the account balance never goes negative.
+
+        Args:
+            account_id: Account ID.
+            balance: Current balance of the account.
+            missing_operations: Number of missing operations by the account result field.
+
+        Returns:
+            float: Balance of the account after all the operations are created.
+
+        Raises:
+            SeedsBalanceError: If outgoing operations exceed the balance and there are no top-ups to cover them.
+        """
+        amounts = {
+            operations: [fake.float() for _ in range(count)]
+            for operations, count in missing_operations.items()
+            if operations != 'top_up_operations'
+        }
+        amounts['top_up_operations'] = [fake.amount() for _ in range(missing_operations['top_up_operations'])]
+
+        balance = round(balance + sum(amounts['top_up_operations']) - sum(
+            sum(values) for operations, values in amounts.items() if operations != 'top_up_operations'
+        ), 2)
+        if balance < 0 and amounts['top_up_operations']:
+            margin = fake.amount()
+            amounts['top_up_operations'][0] = round(amounts['top_up_operations'][0] - balance + margin, 2)
+            balance = round(margin, 2)
+        elif not self.dry_run and balance < 0:
+            raise SeedsBalanceError(
+                f'Operations seeded for account {account_id} make its balance negative ({balance}): '
+                f'the plan has outgoing operations but no top-up operations to cover them'
+            )
+
+        self.amounts[account_id] = amounts
+        return balance
+
+    def complete_card_account_result(
+            self,
+            plan: SeedAccountsPlan,
+            user_id: str,
+            account: SeedAccountResult,
+            card_id: str | None = None
+    ) -> SeedAccountResult:
+        """
+        Creates cards and operations missing in the card account (see `SeedsBuilder.complete_card_account_result`)
+        and updates the account balance by the net amount of the created operations, so the balance
+        of an account topped up by an incremental or resumed run is kept.
+
+        Args:
+            plan: Card account Seed Plan.
+            user_id: User ID.
+            account: Card account result to complete.
+            card_id: ID of the account card. Is requested from the service if not passed and operations are missing.
+
+        Returns:
+            SeedAccountResult: The same account result with all the missing cards and operations added.
+        """
+        account_id = account.account_id
+        balance = self.balances.pop(account_id, None)
+
+        missing_operations = self.count_missing_operations(plan=plan, account=account)
+        if not any(count > 0 for count in missing_operations.values()):
+            return super().complete_card_account_result(plan=plan, user_id=user_id, account=account, card_id=card_id)
+
+        if balance is None:
+            response = self.call(self.accounts_service_client.get_account, account_id=account_id)
+            balance = response.account.balance
+
+        balance = self.draw_operation_amounts(
+            account_id=account_id,
+            balance=balance,
+            missing_operations=missing_operations
+        )
+        try:
+            account = super().complete_card_account_result(
+                plan=plan,
+                user_id=user_id,
+                account=account,
+                card_id=card_id
+            )
+        finally:
+            self.amounts.pop(account_id, None)
+
+        response = self.call(
+            self.accounts_service_client.update_account_balance,
+            account_id=account_id,
+            balance=balance
+        )
+        if not self.dry_run and round(response.account.balance, 2) != balance:
+            raise SeedsBalanceError(
+                f'Balance of account {account_id} is {response.account.balance} after the update, '
+                f'expected {balance}'
+            )
+
+        return account
+
+    def build_card_account_result(
+            self,
+            plan: SeedAccountsPlan,
+            user_id: str,
+            account_type: AccountType.ValueType
+    ) -> SeedAccountResult:
+        """
+        Creates a card account for the user with a physical card the account is opened with
+        and optionally creates cards and operations (see `complete_card_account_result`).
+
+        Args:
+            plan: Card account Seed Plan.
+            user_id: User ID.
+            account_type: Type of the account.
+
+        Returns:
+            SeedAccountResult: Result with the ID of the created account and additional options (cards, operations)
+        """
+        account = self.build_account_result(user_id=user_id, account_type=account_type)
+        card = self.build_card_result(account_id=account.account_id, card_type=CardType.CARD_TYPE_PHYSICAL)
+        self.balances[account.account_id] = 0.0
+
+        return self.complete_card_account_result(plan=plan, user_id=user_id, account=account, card_id=card.card_id)
+
+    def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+        return self.build_card_account_result(
+            plan=plan,
+            user_id=user_id,
+            account_type=AccountType.ACCOUNT_TYPE_DEBIT_CARD
+        )
+
+    def build_credit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+        return self.build_card_account_result(
+            plan=plan,
+            user_id=user_id,
+            account_type=AccountType.ACCOUNT_TYPE_CREDIT_CARD
+        )
+
+    def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
+        response = self.call(self.users_service_client.create_user)
+
+        return self.complete_user(plan=plan, user=SeedUserResult(user_id=response.user.id))
+
+    def verify_user(self, user: SeedUserResult) -> bool:
+        try:
+            self.users_service_client.get_user(user_id=user.user_id)
+            response = self.accounts_service_client.get_accounts(user_id=user.user_id)
+        except CALL_ERRORS:
+            return False
+
+        account_ids = {account.id for account in response.accounts}
+        return all(account.account_id in account_ids for account in user.accounts)
+
+
+def build_internal_grpc_seeds_builder() -> InternalSeedsBuilder:
+    """
+    Seeder-generating factory with gRPC clients of the internal services.
+
+    Returns:
+        InternalSeedsBuilder: Initialized seeder calling the internal services directly.
+    """
+    return InternalSeedsBuilder(
+        users_service_client=build_users_service_grpc_client(),
+        cards_service_client=build_cards_service_grpc_client(),
+        accounts_service_client=build_accounts_service_grpc_client(),
+        operations_service_client=build_operations_service_grpc_client(),
+        concurrency=settings.seeds.concurrency,
+        retries=settings.seeds.retries,
+        retry_backoff=settings.seeds.retry_backoff
+    )
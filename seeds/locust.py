@@ -0,0 +1,201 @@
+from typing import Any, Callable
+
+import gevent
+from locust.env import Environment
+from locust.rpc import Message
+from locust.runners import STATE_RUNNING, STATE_SPAWNING, MasterRunner, WorkerRunner
+
+from config import settings
+from seeds.compact import CompactSeedsResult
+from seeds.dumps import SeedsDumpReader, load_seeds_result
+from seeds.scenario import SeedsScenario
+from seeds.schema.result import SeedsResult, SeedUserResult
+from tools.logger import get_logger
+
+# Shards of every seeding scenario are sent as a separate message type, so one run can use several scenarios
+SEEDS_SHARD_MESSAGE = 'seeds_shard.{}'
+# Sent by a worker once it is ready to receive its shard, answered if the test is already running
+SEEDS_SHARD_REQUEST_MESSAGE = 'seeds_shard_request.{}'
+# Sent by a worker started the test without a shard, master stops the test
+SEEDS_SHARD_MISSING_MESSAGE = 'seeds_shard_missing.{}'
+
+logger = get_logger('SEEDS_LOCUST')
+
+
+def build_seeds_shard(users: list[dict[str, Any]]) -> SeedsResult | CompactSeedsResult:
+    """
+    Restores seeding result from the shard received from master.
+
+    :param users: Serialized users of the shard.
+    :return: SeedsResult (or CompactSeedsResult with `SEEDS.COMPACT` enabled) with the shard users.
+    """
+    shard_users = (SeedUserResult.model_validate(user) for user in users)
+    if settings.seeds.compact:
+        return CompactSeedsResult.from_users(shard_users)
+
+    return SeedsResult(users=list(shard_users))
+
+
+def get_connected_worker_ids(runner: MasterRunner) -> list[str]:
+    """
+    :param runner: Locust master runner.
+    :return: IDs of the connected workers ordered by the worker index.
+    """
+    workers = runner.clients.ready + runner.clients.spawning + runner.clients.running
+    return sorted((worker.id for worker in workers), key=runner.get_worker_index)
+
+
+def send_seeds_shard(
+        runner: MasterRunner,
+        users: SeedsResult | SeedsDumpReader,
+        scenario: str,
+        worker_id: str,
+        index: int,
+        count: int
+) -> None:
+    """
+    Sends the worker every `count`-th user of seeding result starting from `index`.
+
+    :param runner: Locust master runner.
+    :param users: Full seeding result, loaded or read from the dump on demand.
+    :param scenario: Seeding scenario name the result is built by.
+    :param worker_id: ID of the worker the shard is sent to.
+    :param index: Index of the shard.
+    :param count: Number of the shards the result is split into.
+    """
+    shard = [users.get_user(user_index) for user_index in range(index, len(users), count)]
+    runner.send_message(
+        SEEDS_SHARD_MESSAGE.format(scenario),
+        [user.model_dump(mode='json') for user in shard],
+        client_id=worker_id
+    )
+    logger.info(f'[{scenario}] Sent seeds shard of {len(shard)} users to worker {worker_id}')
+
+
+def send_seeds_shards(runner: MasterRunner, users: SeedsResult | SeedsDumpReader, scenario: str) -> list[str]:
+    """
+    Splits seeding result into disjoint shards and sends each connected worker its own shard.
+
+    :param runner: Locust master runner.
+    :param users: Full seeding result, loaded or read from the dump on demand.
+    :param scenario: Seeding scenario name the result is built by.
+    :return: IDs of the workers the shards are sent to, ordered by the shard index.
+    """
+    worker_ids = get_connected_worker_ids(runner)
+    if len(worker_ids) > len(users):
+        logger.warning(f'{len(worker_ids)} workers share only {len(users)} seed users, some shards are empty')
+
+    for index, worker_id in enumerate(worker_ids):
+        send_seeds_shard(runner, users, scenario, worker_id=worker_id, index=index, count=len(worker_ids))
+
+    return worker_ids
+
+
+def setup_seeds(
+        environment: Environment,
+        seeds_scenario: SeedsScenario,
+        on_load: Callable[[SeedsResult | CompactSeedsResult | SeedsDumpReader], None]
+) -> None:
+    """
+    Prepares seeding data for the load test depending on the Locust run mode:
+    - local run: builds the data and passes the loaded result to `on_load`.
+    - master: builds the data once and on test start sends each worker a disjoint shard of the users,
+      with `SEEDS.LAZY` enabled the users of the shards are read from the dump on demand. The shards are sent
+      again on a test restart only if the connected workers have changed.
+    - worker: builds nothing and passes the shard received from master to `on_load`,
+      it is called again with the new shard if master re-shards the users.
+
+    Hence, seeding cost doesn't depend on the number of workers and seed users are unique across workers.
+    A worker connecting to a running test requests its shard once it is initialised and gets the shard it would
+    have got at test start, so its users overlap with the shards of the other workers until the test is restarted.
+    A worker starting the test without a shard reports it to master, which stops the test with exit code 1.
+
+    :param environment: Locust environment.
+    :param seeds_scenario: Seeding scenario to build the data with.
+    :param on_load: Callback receiving the seeding result to be used by virtual users.
+    """
+    runner = environment.runner
+
+    if isinstance(runner, WorkerRunner):
+        is_shard_received = False
+
+        def on_seeds_shard(msg: Message, **kwargs) -> None:
+            nonlocal is_shard_received
+            shard = build_seeds_shard(msg.data)
+            logger.info(f'[{seeds_scenario.scenario}] Received seeds shard of {len(shard)} users.')
+            on_load(shard)
+            is_shard_received = True
+
+        def on_worker_test_start(**kwargs) -> None:
+            if not is_shard_received:
+                logger.error(
+                    f'[{seeds_scenario.scenario}] Worker {runner.client_id} started the test '
+                    f'without a seeds shard, master has not sent it yet'
+                )
+                environment.process_exit_code = 1
+                runner.send_message(SEEDS_SHARD_MISSING_MESSAGE.format(seeds_scenario.scenario))
+
+        runner.register_message(SEEDS_SHARD_MESSAGE.format(seeds_scenario.scenario), on_seeds_shard)
+        environment.events.test_start.add_listener(on_worker_test_start)
+        runner.send_message(SEEDS_SHARD_REQUEST_MESSAGE.format(seeds_scenario.scenario))
+        return
+
+    seeds_scenario.build()
+
+    if isinstance(runner, MasterRunner):
+        if settings.seeds.lazy:
+            users = seeds_scenario.open()
+        else:
+            users = load_seeds_result(scenario=seeds_scenario.scenario)
+
+        # Workers got their shards at the latest test start and workers connected to the running test since then
+        sharded_worker_ids: list[str] = []
+        late_worker_ids: set[str] = set()
+
+        def on_test_start(**kwargs) -> None:
+            if not late_worker_ids and sharded_worker_ids == get_connected_worker_ids(runner):
+                logger.info(f'[{seeds_scenario.scenario}] Workers have not changed, seeds shards are kept')
+                return
+
+            sharded_worker_ids[:] = send_seeds_shards(runner, users, scenario=seeds_scenario.scenario)
+            late_worker_ids.clear()
+
+        def on_seeds_shard_request(msg: Message, **kwargs) -> None:
+            # Workers connected before the test start get their shards with the others
+            if (
+                    runner.state not in (STATE_SPAWNING, STATE_RUNNING) or
+                    msg.node_id in sharded_worker_ids or
+                    msg.node_id in late_worker_ids
+            ):
+                return
+
+            worker_ids = get_connected_worker_ids(runner)
+            if msg.node_id not in worker_ids:
+                return
+
+            logger.warning(
+                f'[{seeds_scenario.scenario}] Worker {msg.node_id} connected to the running test, '
+                f'its seeds shard overlaps with the shards of the other workers'
+            )
+            send_seeds_shard(
+                runner,
+                users,
+                scenario=seeds_scenario.scenario,
+                worker_id=msg.node_id,
+                index=worker_ids.index(msg.node_id),
+                count=len(worker_ids)
+            )
+            late_worker_ids.add(msg.node_id)
+
+        def on_seeds_shard_missing(msg: Message, **kwargs) -> None:
+            logger.error(f'[{seeds_scenario.scenario}] Worker {msg.node_id} has no seeds shard, stopping the test')
+            environment.process_exit_code = 1
+            # Quitting kills the greenlet handling the message, so it is done in a separate one
+            gevent.spawn(runner.quit)
+
+        environment.events.test_start.add_listener(on_test_start)
+        runner.register_message(SEEDS_SHARD_REQUEST_MESSAGE.format(seeds_scenario.scenario), on_seeds_shard_request)
+        runner.register_message(SEEDS_SHARD_MISSING_MESSAGE.format(seeds_scenario.scenario), on_seeds_shard_missing)
+        return
+
+    on_load(seeds_scenario.load())
@@ -0,0 +1,88 @@
+import math
+from array import array
+from bisect import bisect_left
+
+from seeds.schema.metrics import SeedRPCMetrics
+
+# Upper bounds (in milliseconds) of the call time histogram buckets
+SEEDS_RPC_HISTOGRAM_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, math.inf)
+SEEDS_RPC_PERCENTILES = (50, 90, 95, 99)
+
+
+class SeedRPCTimings:
+    """
+    Call times of the gateway calls of one type.
+    Times are kept in a compact array, so exact percentiles can be calculated for the whole run.
+    """
+
+    def __init__(self):
+        self.timings = array('d')
+        self.failures = 0
+
+    def add(self, elapsed: float, failed: bool = False) -> None:
+        """
+        :param elapsed: Call time in milliseconds.
+        :param failed: Whether the call has failed.
+        """
+        self.timings.append(elapsed)
+        self.failures += failed
+
+    def get_percentile(self, timings: list[float], percentile: float) -> float:
+        index = max(0, math.ceil(len(timings) * percentile / 100) - 1)
+        return timings[index]
+
+    def get_histogram(self) -> dict[str, int]:
+        histogram = [0] * len(SEEDS_RPC_HISTOGRAM_BUCKETS)
+        for elapsed in self.timings:
+            histogram[bisect_left(SEEDS_RPC_HISTOGRAM_BUCKETS, elapsed)] += 1
+
+        return {
+            ('+Inf' if bound == math.inf else str(bound)): count
+            for bound, count in zip(SEEDS_RPC_HISTOGRAM_BUCKETS, histogram)
+        }
+
+    def report(self) -> SeedRPCMetrics:
+        timings = sorted(self.timings)
+        return SeedRPCMetrics(
+            count=len(timings),
+            failures=self.failures,
+            mean=round(sum(timings) / len(timings), 3),
+            min=round(timings[0], 3),
+            max=round(timings[-1], 3),
+            percentiles={
+                f'p{percentile}': round(self.get_percentile(timings, percentile), 3)
+                for percentile in SEEDS_RPC_PERCENTILES
+            },
+            histogram=self.get_histogram()
+        )
+
+
+class SeedsMetrics:
+    """
+    Collects call times of the gateway calls made by seeding builder, grouped by the client method name.
+    """
+
+    def __init__(self):
+        self.rpcs: dict[str, SeedRPCTimings] = {}
+
+    def record(self, name: str, elapsed: float, failed: bool = False) -> None:
+        """
+        Registers a gateway call.
+
+        :param name: Client method name, i.e. 'create_user'.
+        :param elapsed: Call time in milliseconds.
+        :param failed: Whether the call has failed.
+        """
+        self.rpcs.setdefault(name, SeedRPCTimings()).add(elapsed, failed)
+
+    def counts(self) -> dict[str, int]:
+        """
+        :return: Number of calls of every called client method.
+        """
+        return {name: len(timings.timings) for name, timings in sorted(self.rpcs.items())}
+
+    def report(self) -> dict[str, SeedRPCMetrics]:
+        """
+        :return: Timing summary of every called client method.
+        """
+        return {name: timings.report() for name, timings in sorted(self.rpcs.items())}
@@ -0,0 +1,212 @@
+import time
+from collections import deque
+from itertools import count
+from typing import NamedTuple, Protocol
+
+import gevent
+import locust.stats
+from gevent.lock import Semaphore
+from locust.env import Environment
+
+from config import settings
+from seeds.compact import SeedUserView
+from seeds.schema.result import SeedUserResult
+from tools.config.seeds import SeedUsersPoolPolicy
+from tools.locust.stats import CustomStats, get_custom_stats
+from tools.logger import get_logger
+
+logger = get_logger('SEEDS_POOL')
+
+
+class SeedUsersSource(Protocol):
+    """
+    Seeding result providing access to the users by index: SeedsResult, CompactSeedsResult or SeedsDumpReader.
+    """
+
+    def __len__(self) -> int: ...
+
+    def get_user(self, index: int) -> SeedUserResult | SeedUserView: ...
+
+
+class SeedUsersPoolExhaustedError(Exception):
+    pass
+
+
+class SeedUserLease(NamedTuple):
+    """
+    Seed user handed out by the pool.
+
+    Attributes:
+        user: Seed user data.
+        index: Index of the user in the seeding result.
+        recycled: Whether the user is shared with another virtual user (is not returned to the pool on release).
+    """
+    user: SeedUserResult | SeedUserView
+    index: int
+    recycled: bool = False
+
+
+class SeedUsersPool:
+    """
+    Pool of seed users leased to virtual users.
+
+    Indexes of free users are kept in a deque, so acquiring and releasing a user is O(1).
+    A user is leased when TaskSet starts and is returned to the pool when it stops,
+    what happens when the pool is exhausted is defined by the policy.
+
+    Acquire waiting time and pool occupancy are exported as 'seeds_pool' custom statistics (see `CustomStats`),
+    so they don't count as requests; occupancy is also logged periodically while the test is running.
+    """
+
+    def __init__(
+            self,
+            users: SeedUsersSource,
+            policy: SeedUsersPoolPolicy = SeedUsersPoolPolicy.BLOCK,
+            timeout: float | None = None,
+            environment: Environment | None = None
+    ):
+        """
+        :param users: Seeding result to lease users from.
+        :param policy: What to do when all the users are leased.
+        :param timeout: Max time to wait for a free user with BLOCK policy; None — wait forever.
+        :param environment: Locust environment to export the metrics with.
+        """
+        self.policy = policy
+        self.timeout = timeout
+        self.environment = environment
+        self.reporter: gevent.Greenlet | None = None
+        self.replace(users)
+
+        self.stats: CustomStats | None = None
+        if environment is not None:
+            self.stats = get_custom_stats(environment, 'seeds_pool')
+            self.stats.add_gauges(self.get_occupancy)
+            environment.events.test_start.add_listener(self.on_test_start)
+            environment.events.test_stop.add_listener(self.on_test_stop)
+
+    def replace(self, users: SeedUsersSource) -> None:
+        """
+        Replaces the users of the pool in place (i.e. with a new shard received on a test restart),
+        so the listeners and gauges registered by the pool are kept. All the users must be released.
+
+        :param users: Seeding result to lease users from.
+        """
+        self.users = users
+        self.free = deque(range(len(users)))
+        self.semaphore = Semaphore(len(users))
+        self.recycle_cursor = count()
+
+        self.peak_leased = 0
+        self.exhausted_count = 0
+        self.recycled_count = 0
+
+    @property
+    def leased_count(self) -> int:
+        return len(self.users) - len(self.free)
+
+    def acquire(self) -> SeedUserLease:
+        """
+        Leases a seed user.
+
+        :return: SeedUserLease with the user data.
+        :raises SeedUsersPoolExhaustedError: If no user can be leased with the pool policy.
+        """
+        start_time = time.perf_counter()
+        exception: SeedUsersPoolExhaustedError | None = None
+        try:
+            return self.lease()
+        except SeedUsersPoolExhaustedError as error:
+            exception = error
+            raise
+        finally:
+            self.report('acquire', start_time=start_time, exception=exception)
+
+    def lease(self) -> SeedUserLease:
+        if not len(self.users):
+            raise SeedUsersPoolExhaustedError('Seed users pool is empty, i.e. there are more workers than seed users')
+
+        blocking = self.policy == SeedUsersPoolPolicy.BLOCK
+        if not self.semaphore.acquire(blocking=blocking, timeout=self.timeout if blocking else None):
+            self.exhausted_count += 1
+            if self.policy == SeedUsersPoolPolicy.RECYCLE:
+                self.recycled_count += 1
+                index = next(self.recycle_cursor) % len(self.users)
+                return SeedUserLease(user=self.users.get_user(index), index=index, recycled=True)
+
+            raise SeedUsersPoolExhaustedError(f'All {len(self.users)} seed users are leased')
+
+        index = self.free.popleft()
+        self.peak_leased = max(self.peak_leased, self.leased_count)
+        return SeedUserLease(user=self.users.get_user(index), index=index)
+
+    def release(self, lease: SeedUserLease) -> None:
+        """
+        Returns the leased user to the pool.
+
+        :param lease: Lease returned by `acquire`.
+        """
+        if lease.recycled:
+            return
+
+        self.free.append(lease.index)
+        self.semaphore.release()
+
+    def report(self, name: str, start_time: float, exception: Exception | None = None) -> None:
+        if self.stats is not None:
+            self.stats.log('SEEDS', f'users_pool.{name}', (time.perf_counter() - start_time) * 1000, error=exception)
+
+    def get_occupancy(self) -> dict[str, float]:
+        """
+        :return: Pool occupancy gauges: pool size, leased and peak leased users, exhausted and recycled counts.
+        """
+        return {
+            'size': len(self.users),
+            'leased': self.leased_count,
+            'peak_leased': self.peak_leased,
+            'exhausted': self.exhausted_count,
+            'recycled': self.recycled_count
+        }
+
+    def log_occupancy(self) -> None:
+        logger.info(
+            f'Seed users pool: {self.leased_count}/{len(self.users)} leased, peak {self.peak_leased}, '
+            f'exhausted {self.exhausted_count} times, recycled {self.recycled_count} users'
+        )
+
+    def on_test_start(self, **kwargs) -> None:
+        def report_occupancy():
+            while True:
+                gevent.sleep(locust.stats.CONSOLE_STATS_INTERVAL_SEC)
+                self.log_occupancy()
+
+        self.reporter = gevent.spawn(report_occupancy)
+
+    def on_test_stop(self, **kwargs) -> None:
+        if self.reporter is not None:
+            self.reporter.kill(block=False)
+            self.reporter = None
+
+        self.log_occupancy()
+
+
+def build_seed_users_pool(users: SeedUsersSource, environment: Environment) -> SeedUsersPool:
+    """
+    Creates seed users pool configured with `SEEDS.POOL_POLICY` and `SEEDS.POOL_TIMEOUT` settings.
+    The pool is kept in `environment.seed_users_pool`, later calls replace the users of the same pool.
+
+    :param users: Seeding result to lease users from.
+    :param environment: Locust environment to report the metrics to.
+    :return: Ready-to-use SeedUsersPool.
+    """
+    pool: SeedUsersPool | None = getattr(environment, 'seed_users_pool', None)
+    if pool is not None:
+        pool.replace(users)
+        return pool
+
+    pool = environment.seed_users_pool = SeedUsersPool(
+        users=users,
+        policy=settings.seeds.pool_policy,
+        timeout=settings.seeds.pool_timeout,
+        environment=environment
+    )
+    return pool
@@ -0,0 +1,117 @@
+import math
+import time
+from datetime import datetime
+
+from seeds.metrics import SeedsMetrics
+from seeds.schema.metrics import SeedsMetricsReport
+from tools.logger import get_logger
+
+logger = get_logger('SEEDS_PROGRESS')
+
+
+class SeedsProgress:
+    """
+    Tracks seeding progress and periodically logs it.
+
+    Every created entity (user, account, card, operation) costs exactly one gateway call,
+    so the number of entities per second is the RPS achieved by the builder.
+
+    Attributes:
+        total: Number of users to be built.
+        log_every: Log progress each time this number of users is built.
+        log_interval: Log progress at least once in this number of seconds.
+        metrics: Call times of the gateway calls made by the builder.
+        concurrency: Max number of users built at the same time, is reported only.
+    """
+
+    def __init__(
+            self,
+            total: int,
+            log_every: int | None = None,
+            log_interval: float = 10.0,
+            metrics: SeedsMetrics | None = None,
+            concurrency: int = 1
+    ):
+        self.total = total
+        self.log_every = log_every or max(1, total // 10)
+        self.log_interval = log_interval
+        self.metrics = metrics or SeedsMetrics()
+        self.concurrency = concurrency
+
+        self.users = 0
+        self.entities = 0
+        self.started_at = datetime.now()
+        self.started = time.perf_counter()
+        self.logged = self.started
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Seconds passed since the progress tracking was started.
+        """
+        return time.perf_counter() - self.started
+
+    @property
+    def rps(self) -> float:
+        """
+        Achieved gateway calls per second.
+        """
+        return self.entities / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def eta(self) -> float:
+        """
+        Estimated number of seconds left till all the users are built.
+        """
+        return (self.total - self.users) * self.elapsed / self.users if self.users else math.inf
+
+    def update(self, entities: int) -> None:
+        """
+        Registers a built user.
+
+        :param entities: Number of entities created while building the user.
+        """
+        self.users += 1
+        self.entities += entities
+
+        if self.users == self.total:
+            return
+
+        now = time.perf_counter()
+        if self.users % self.log_every == 0 or now - self.logged >= self.log_interval:
+            self.logged = now
+            logger.info(
+                f'Seeded {self.users}/{self.total} users ({self.rps:.1f} entities/s), ETA {self.eta:.0f}s'
+            )
+
+    def report(self) -> SeedsMetricsReport:
+        """
+        :return: Seeding run summary with timing of every called client method.
+        """
+        return SeedsMetricsReport(
+            started_at=self.started_at,
+            elapsed=round(self.elapsed, 3),
+            concurrency=self.concurrency,
+            users=self.users,
+            entities=self.entities,
+            entities_per_second=round(self.rps, 3),
+            rpcs=self.metrics.report()
+        )
+
+    def finish(self) -> SeedsMetricsReport:
+        """
+        Logs the final seeding statistics.
+
+        :return: Seeding run summary (see `report`).
+        """
+        report = self.report()
+        logger.info(
+            f'Seeded {self.users}/{self.total} users, {self.entities} entities '
+            f'in {self.elapsed:.2f}s ({self.rps:.1f} entities/s)'
+        )
+        for name, rpc in report.rpcs.items():
+            logger.info(
+                f'{name}: {rpc.count} calls, {rpc.failures} failed, mean {rpc.mean:.1f}ms, '
+                + ', '.join(f'{percentile} {value:.1f}ms' for percentile, value in rpc.percentiles.items())
+            )
+        return report
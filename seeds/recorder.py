@@ -0,0 +1,295 @@
+import functools
+import hashlib
+import inspect
+from datetime import datetime
+from typing import Any, Callable
+
+from locust.env import Environment
+from locust.rpc import Message
+from locust.runners import WorkerRunner
+
+from config import settings
+from seeds.dumps import (
+    iter_seeds_records,
+    iter_seeds_users,
+    load_seeds_meta,
+    open_seeds_recording,
+    remove_seeds_recording,
+    save_seeds_meta,
+    save_seeds_users
+)
+from seeds.scenario import get_seeds_target
+from seeds.schema.meta import SeedsMeta
+from seeds.schema.recording import SeedsRecord
+from seeds.schema.result import SeedAccountResult, SeedCardResult, SeedOperationResult, SeedUserResult
+from tools.logger import get_logger
+
+logger = get_logger('SEEDS_RECORDER')
+
+SEEDS_RECORDS_MESSAGE = 'seeds_records.{}'
+
+# Workers send recorded entities to master in batches of this size (and the rest when the test stops)
+SEEDS_RECORDS_BATCH_SIZE = 100
+
+# High-level client methods creating entities and the seeding result fields the entities go to
+RECORDED_ACCOUNTS = {
+    'open_deposit_account': 'deposit_accounts',
+    'open_savings_account': 'savings_accounts',
+    'open_debit_card_account': 'debit_card_accounts',
+    'open_credit_card_account': 'credit_card_accounts',
+}
+RECORDED_CARDS = {
+    'issue_physical_card': 'physical_cards',
+    'issue_virtual_card': 'virtual_cards',
+}
+RECORDED_OPERATIONS = {
+    'make_top_up_operation': 'top_up_operations',
+    'make_purchase_operation': 'purchase_operations',
+    'make_transfer_operation': 'transfer_operations',
+    'make_cash_withdrawal_operation': 'cash_withdrawal_operations',
+}
+
+
+class SeedsRecorder:
+    """
+    Records IDs of the entities created by load test scenarios, so they can be reused as seeding data.
+
+    High-level gateway client methods (`create_user`, `open_*_account`, `issue_*_card`, `make_*_operation`)
+    are wrapped with `attach`: every successfully created entity is appended to the recording file
+    as soon as it is created (in distributed runs workers send it to master in batches).
+    When Locust quits, the recorded entities are merged into the seeding result dump of the scenario
+    in the SeedsResult shape, next to the users already saved there for the same gateway.
+
+    The merged dump gets its own fingerprint, so an `existing_user_*` run reuses it with `SEEDS.INCREMENTAL`
+    enabled: recorded users are only topped up with the entities their seeding plan lacks.
+    Every recording run adds its users to the dump, so with `SEEDS.RECORD_MAX_USERS` set
+    only that many most recently created users are kept.
+    Operations of the types the seeding result doesn't hold (i.e. fees and cashbacks) are not recorded.
+    """
+
+    def __init__(self, scenario: str, target: str, environment: Environment, max_users: int | None = None):
+        """
+        :param scenario: Seeding scenario name the entities are recorded for (i.e. 'existing_user_get_operations').
+        :param target: Address of the gateway (or the internal users service) the seeding dump is tagged with.
+        :param environment: Locust environment.
+        :param max_users: Max number of users kept in the merged dump, the oldest ones are dropped; None — no limit.
+        """
+        self.scenario = scenario
+        self.target = target
+        self.max_users = max_users
+        self.environment = environment
+        self.records_count = 0
+
+        self.batch: list[dict[str, Any]] = []
+        self.stream = None if isinstance(environment.runner, WorkerRunner) else open_seeds_recording(scenario)
+
+        message = SEEDS_RECORDS_MESSAGE.format(scenario)
+        if isinstance(environment.runner, WorkerRunner):
+            environment.events.test_stop.add_listener(self.on_test_stop)
+        else:
+            if environment.runner is not None:
+                environment.runner.register_message(message, self.on_records)
+            environment.events.quitting.add_listener(self.on_quitting)
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Hash of the recorded dump, it never matches a seeding plan fingerprint.
+        """
+        return hashlib.sha256(f'{self.target}:recorded'.encode('utf-8')).hexdigest()
+
+    def write(self, records: list[SeedsRecord]) -> None:
+        for record in records:
+            self.stream.write(record.model_dump_json() + '\n')
+        self.records_count += len(records)
+
+    def send(self) -> None:
+        """
+        Sends the batch of the entities recorded on worker to master.
+        """
+        if not self.batch:
+            return
+
+        batch, self.batch = self.batch, []
+        self.environment.runner.send_message(SEEDS_RECORDS_MESSAGE.format(self.scenario), batch)
+        self.records_count += len(batch)
+
+    def record(self, field: str, entity_id: str, parent_id: str | None = None) -> None:
+        """
+        Records a created entity.
+
+        :param field: Seeding result field of the entity, i.e. 'debit_card_accounts'.
+        :param entity_id: ID of the created entity.
+        :param parent_id: ID of the user or the account the entity belongs to.
+        """
+        record = SeedsRecord(field=field, parent_id=parent_id, entity_id=entity_id)
+        if self.stream is not None:
+            self.write([record])
+            return
+
+        self.batch.append(record.model_dump())
+        if len(self.batch) >= SEEDS_RECORDS_BATCH_SIZE:
+            self.send()
+
+    def record_response(self, name: str, response: Any, arguments: dict[str, Any]) -> None:
+        """
+        Records the entity created by a high-level client method.
+
+        :param name: Client method name, i.e. 'open_debit_card_account'.
+        :param response: Response of the method.
+        :param arguments: Arguments the method was called with, i.e. {'user_id': ...}.
+        """
+        if name == 'create_user':
+            self.record('users', entity_id=response.user.id)
+        elif name in RECORDED_ACCOUNTS:
+            self.record(RECORDED_ACCOUNTS[name], entity_id=response.account.id, parent_id=arguments['user_id'])
+        elif name in RECORDED_CARDS:
+            self.record(RECORDED_CARDS[name], entity_id=response.card.id, parent_id=arguments['account_id'])
+        else:
+            self.record(RECORDED_OPERATIONS[name], entity_id=response.operation.id, parent_id=arguments['account_id'])
+
+    def wrap(self, name: str, method: Callable) -> Callable:
+        """
+        Wraps a high-level client method to record the entity it creates.
+
+        :param name: Client method name, i.e. 'open_debit_card_account'.
+        :param method: Bound client method.
+        :return: Method with the same signature and result.
+        """
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            response = method(*args, **kwargs)
+            if response is not None:
+                self.record_response(name, response, signature.bind(*args, **kwargs).arguments)
+
+            return response
+
+        return wrapper
+
+    def attach(self, *clients: Any) -> None:
+        """
+        Wraps the entity-creating methods of the passed clients, other methods are left as is.
+
+        :param clients: HTTP or gRPC gateway clients.
+        """
+        for client in clients:
+            for name in ('create_user', *RECORDED_ACCOUNTS, *RECORDED_CARDS, *RECORDED_OPERATIONS):
+                method = getattr(client, name, None)
+                if method is not None:
+                    setattr(client, name, self.wrap(name, method))
+
+    def merge(self) -> int:
+        """
+        Merges the recorded entities into the seeding result dump and removes the recording.
+        The users saved in the dump before are kept if they were created in the same gateway,
+        up to `max_users` most recent users are saved.
+        Accounts of unrecorded users and cards and operations of unrecorded accounts are skipped.
+
+        :return: Number of users in the merged dump.
+        """
+        users: dict[str, SeedUserResult] = {}
+        accounts: dict[str, SeedAccountResult] = {}
+
+        meta = load_seeds_meta(scenario=self.scenario)
+        if meta is not None and meta.target == self.target:
+            for user in iter_seeds_users(scenario=self.scenario):
+                users[user.user_id] = user
+                accounts.update((account.account_id, account) for account in user.accounts)
+
+        recorded_users_count = 0
+        for record in iter_seeds_records(scenario=self.scenario):
+            if record.field == 'users':
+                users.setdefault(record.entity_id, SeedUserResult(user_id=record.entity_id))
+                recorded_users_count += 1
+            elif record.field in RECORDED_ACCOUNTS.values():
+                if record.parent_id in users:
+                    account = SeedAccountResult(account_id=record.entity_id)
+                    getattr(users[record.parent_id], record.field).append(account)
+                    accounts[account.account_id] = account
+            elif record.field in RECORDED_CARDS.values():
+                if record.parent_id in accounts:
+                    getattr(accounts[record.parent_id], record.field).append(SeedCardResult(card_id=record.entity_id))
+            elif record.parent_id in accounts:
+                getattr(accounts[record.parent_id], record.field).append(
+                    SeedOperationResult(operation_id=record.entity_id)
+                )
+
+        if not recorded_users_count:
+            remove_seeds_recording(scenario=self.scenario)
+            return len(users)
+
+        merged_users = list(users.values())
+        if self.max_users is not None and len(merged_users) > self.max_users:
+            logger.info(f'[{self.scenario}] {len(merged_users) - self.max_users} oldest users dropped from the dump.')
+            merged_users = merged_users[-self.max_users:] if self.max_users else []
+
+        save_seeds_users(users=merged_users, scenario=self.scenario)
+        save_seeds_meta(
+            meta=SeedsMeta(fingerprint=self.fingerprint, target=self.target, created_at=datetime.now()),
+            scenario=self.scenario
+        )
+        remove_seeds_recording(scenario=self.scenario)
+        logger.info(
+            f'[{self.scenario}] {recorded_users_count} recorded users merged into seeding result '
+            f'of {len(merged_users)} users.'
+        )
+        return len(merged_users)
+
+    def on_records(self, msg: Message, **kwargs) -> None:
+        self.write([SeedsRecord.model_validate(record) for record in msg.data])
+
+    def on_test_stop(self, **kwargs) -> None:
+        self.send()
+        logger.info(f'[{self.scenario}] {self.records_count} created entities recorded.')
+
+    def on_quitting(self, **kwargs) -> None:
+        self.stream.close()
+        logger.info(f'[{self.scenario}] {self.records_count} created entities recorded.')
+        self.merge()
+
+
+def build_seeds_recorder(environment: Environment) -> SeedsRecorder | None:
+    """
+    Creates seeds recorder for the scenario dump configured with `SEEDS.RECORD_SCENARIO`
+    and stores it in `environment.seeds_recorder`, so the gateway TaskSets attach it to their clients.
+
+    The dump is tagged with the target of `SEEDS.BACKEND`, like the seeding scenario resolves it,
+    so the merged dump is reused whatever clients (HTTP or gRPC) the load test scenario creates the entities with.
+
+    :param environment: Locust environment.
+    :return: SeedsRecorder or None if recording is disabled.
+    """
+    environment.seeds_recorder = None
+    if not settings.seeds.record_scenario:
+        return None
+
+    environment.seeds_recorder = SeedsRecorder(
+        scenario=settings.seeds.record_scenario,
+        target=get_seeds_target(settings.seeds.backend),
+        max_users=settings.seeds.record_max_users,
+        environment=environment
+    )
+    return environment.seeds_recorder
+
+
+def get_seeds_recorder(environment: Environment) -> SeedsRecorder | None:
+    """
+    :param environment: Locust environment.
+    :return: SeedsRecorder set up by the scenario with `build_seeds_recorder`, None if nothing is recorded.
+    """
+    return getattr(environment, 'seeds_recorder', None)
+
+
+def attach_seeds_recorder(environment: Environment, *clients: Any) -> None:
+    """
+    Attaches the seeds recorder of the scenario, if any, to the clients of a virtual user,
+    so the entities they create are recorded as seeding data (see `SeedsRecorder.attach`).
+
+    :param environment: Locust environment.
+    :param clients: HTTP or gRPC gateway clients.
+    """
+    recorder = get_seeds_recorder(environment)
+    if recorder is not None:
+        recorder.attach(*clients)
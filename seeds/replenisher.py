@@ -0,0 +1,221 @@
+import time
+from typing import Callable, Generic, TypeVar
+
+import gevent
+import locust.stats
+from gevent.lock import Semaphore
+from gevent.pool import Pool
+from gevent.queue import Empty, Queue
+from locust.env import Environment
+from locust.runners import MasterRunner
+
+from config import settings
+from tools.locust.stats import CustomStats, get_custom_stats
+from tools.logger import get_logger
+
+T = TypeVar('T')
+
+logger = get_logger('SEEDS_REPLENISHER')
+
+
+class SeedsReplenisherEmptyError(Exception):
+    pass
+
+
+class SeedsReplenisher(Generic[T]):
+    """
+    Producer/consumer pool of entities created in the background while the test is running.
+
+    A producer greenlet calls the factory at the configured rate (up to `concurrency` calls at a time)
+    and puts the created entities into a queue, virtual users take ready-made entities from it.
+    So the calls made by the factory are not a part of the measured user journey.
+    Queued entities together with the ones being created never exceed `capacity`.
+
+    Refill latency, waiting time of the consumers and pool fill level are exported
+    as 'seeds_replenisher' custom statistics (see `CustomStats`), so they don't count as requests;
+    fill level is also logged periodically while the test is running.
+    """
+
+    def __init__(
+            self,
+            factory: Callable[[], T],
+            name: str = 'replenisher',
+            rate: float | None = None,
+            capacity: int = 100,
+            concurrency: int = 1,
+            timeout: float | None = None,
+            environment: Environment | None = None
+    ):
+        """
+        :param factory: Creates an entity, i.e. a user with an account, using non-Locust clients.
+        :param name: Name of the pool in the reported metrics.
+        :param rate: Max number of entities created per second; None — as fast as `concurrency` allows.
+        :param capacity: Max number of entities queued and being created.
+        :param concurrency: Max number of entities being created at the same time.
+        :param timeout: Max time to wait for an entity when the pool is empty; None — wait forever.
+        :param environment: Locust environment to export the metrics with.
+        """
+        self.factory = factory
+        self.name = name
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.timeout = timeout
+        self.environment = environment
+
+        self.queue: Queue[T] = Queue()
+        self.slots = Semaphore(self.capacity)
+        self.workers = Pool(size=max(1, concurrency))
+
+        self.produced_count = 0
+        self.failed_count = 0
+        self.empty_count = 0
+        self.producer: gevent.Greenlet | None = None
+        self.reporter: gevent.Greenlet | None = None
+
+        self.stats: CustomStats | None = None
+        if environment is not None:
+            self.stats = get_custom_stats(environment, 'seeds_replenisher')
+            self.stats.add_gauges(self.get_fill_level)
+            environment.events.test_start.add_listener(self.on_test_start)
+            environment.events.test_stop.add_listener(self.on_test_stop)
+
+    @property
+    def fill_level(self) -> int:
+        return self.queue.qsize()
+
+    def start(self) -> None:
+        """
+        Starts the producer greenlet.
+        """
+        if self.producer is None:
+            self.producer = gevent.spawn(self.produce)
+
+    def stop(self) -> None:
+        """
+        Stops the producer greenlet and cancels entities being created.
+        Slots of the cancelled entities are freed, so the capacity is intact when the test is restarted.
+        """
+        if self.producer is not None:
+            self.producer.kill()
+            self.producer = None
+        self.workers.kill()
+
+        # Queued entities keep their slots until they are taken
+        self.slots = Semaphore(self.capacity - self.queue.qsize())
+
+    def produce(self) -> None:
+        interval = 1 / self.rate if self.rate else 0
+        while True:
+            # Wait for a free slot, then for a free worker
+            self.slots.acquire()
+            self.workers.spawn(self.refill)
+            gevent.sleep(interval)
+
+    def refill(self) -> None:
+        start_time = time.perf_counter()
+        try:
+            entity = self.factory()
+        except Exception as error:
+            self.failed_count += 1
+            self.report('refill', start_time=start_time, exception=error)
+            # Don't hammer the failing gateway, the slot is given back after a pause
+            gevent.sleep(1)
+            self.slots.release()
+            return
+
+        self.produced_count += 1
+        self.report('refill', start_time=start_time)
+        self.queue.put(entity)
+
+    def get(self) -> T:
+        """
+        Takes a ready-made entity from the pool waiting for it if the pool is empty.
+
+        :return: Entity created by the factory.
+        :raises SeedsReplenisherEmptyError: If no entity has been created within the timeout.
+        """
+        start_time = time.perf_counter()
+        exception: SeedsReplenisherEmptyError | None = None
+
+        if self.queue.empty():
+            self.empty_count += 1
+
+        try:
+            entity = self.queue.get(timeout=self.timeout)
+        except Empty:
+            exception = SeedsReplenisherEmptyError(f'No entity replenished in {self.name} within {self.timeout}s')
+            raise exception
+        finally:
+            self.report('get', start_time=start_time, exception=exception)
+
+        self.slots.release()
+        return entity
+
+    def report(self, name: str, start_time: float, exception: Exception | None = None) -> None:
+        if self.stats is not None:
+            self.stats.log('SEEDS', f'{self.name}.{name}', (time.perf_counter() - start_time) * 1000, error=exception)
+
+    def get_fill_level(self) -> dict[str, float]:
+        """
+        :return: Pool gauges: ready-made entities, produced and failed entities, times consumers found it empty.
+        """
+        return {
+            f'{self.name}.ready': self.fill_level,
+            f'{self.name}.produced': self.produced_count,
+            f'{self.name}.failed': self.failed_count,
+            f'{self.name}.empty': self.empty_count
+        }
+
+    def log_fill_level(self) -> None:
+        logger.info(
+            f'{self.name}: {self.fill_level}/{self.capacity} ready, {self.produced_count} produced, '
+            f'{self.failed_count} failed, empty {self.empty_count} times'
+        )
+
+    def on_test_start(self, **kwargs) -> None:
+        self.start()
+
+        def report_fill_level():
+            while True:
+                gevent.sleep(locust.stats.CONSOLE_STATS_INTERVAL_SEC)
+                self.log_fill_level()
+
+        self.reporter = gevent.spawn(report_fill_level)
+
+    def on_test_stop(self, **kwargs) -> None:
+        self.stop()
+        if self.reporter is not None:
+            self.reporter.kill(block=False)
+            self.reporter = None
+
+        self.log_fill_level()
+
+
+def build_seeds_replenisher(
+        factory: Callable[[], T],
+        name: str,
+        environment: Environment
+) -> SeedsReplenisher[T] | None:
+    """
+    Creates seeds replenisher configured with `SEEDS.REPLENISH*` settings.
+    The producer is started when the test starts and stopped when it stops.
+
+    Master runs no virtual users, so it gets no replenisher: nothing would consume the entities it creates.
+
+    :param factory: Creates an entity using non-Locust clients.
+    :param name: Name of the pool in the reported metrics.
+    :param environment: Locust environment to export the metrics with.
+    :return: Ready-to-use SeedsReplenisher or None if replenishment is disabled with `SEEDS.REPLENISH`.
+    """
+    if not settings.seeds.replenish or isinstance(environment.runner, MasterRunner):
+        return None
+
+    return SeedsReplenisher(
+        factory=factory,
+        name=name,
+        rate=settings.seeds.replenish_rate,
+        capacity=settings.seeds.replenish_capacity,
+        concurrency=settings.seeds.concurrency,
+        timeout=settings.seeds.pool_timeout,
+        environment=environment
+    )
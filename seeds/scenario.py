@@ -1,13 +1,55 @@
+import hashlib
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Iterable
 
-from seeds.builder import build_grpc_seeds_builder
-from seeds.dumps import save_seeds_result, load_seeds_result
+from config import settings
+from seeds.builder import build_grpc_seeds_builder, build_http_seeds_builder
+from seeds.compact import CompactSeedsResult
+from seeds.dumps import (
+    SeedsDumpReader,
+    checkpoint_seeds_users,
+    iter_seeds_users,
+    save_seeds_users,
+    load_seeds_result,
+    save_seeds_meta,
+    save_seeds_metrics,
+    load_seeds_meta,
+    load_seeds_checkpoint,
+    load_seeds_metrics,
+    remove_seeds_checkpoint
+)
+from seeds.internal_builder import build_internal_grpc_seeds_builder
+from seeds.schema.meta import SeedsMeta
+from seeds.schema.metrics import SeedsEstimate
 from seeds.schema.plan import SeedsPlan
-from seeds.schema.result import SeedsResult
+from seeds.schema.result import SeedsResult, SeedUserResult
+from tools.config.seeds import SeedsBackend
 from tools.logger import get_logger
+from tools.rng import get_random
 
 logger = get_logger('SEEDS_SCENARIO')
 
+SEEDS_BUILDERS = {
+    SeedsBackend.GRPC: build_grpc_seeds_builder,
+    SeedsBackend.HTTP: build_http_seeds_builder,
+    SeedsBackend.INTERNAL_GRPC: build_internal_grpc_seeds_builder,
+}
+
+
+def get_seeds_target(backend: SeedsBackend) -> str:
+    """
+    :param backend: Clients the seeding data is generated with.
+    :return: Address of the gateway (or the internal users service) the clients call.
+    """
+    if backend == SeedsBackend.GRPC:
+        return settings.gateway_grpc_client.client_url
+
+    if backend == SeedsBackend.INTERNAL_GRPC:
+        return settings.users_grpc_client.client_url
+
+    return settings.gateway_http_client.client_url
+
 
 class SeedsScenario(ABC):
     """
@@ -16,7 +58,7 @@ class SeedsScenario(ABC):
     """
 
     def __init__(self):
-        self.builder = build_grpc_seeds_builder()
+        self.builder = SEEDS_BUILDERS[self.backend]()
 
     @property
     @abstractmethod
@@ -34,32 +76,235 @@ class SeedsScenario(ABC):
         """
         ...
 
-    def save(self, result: SeedsResult) -> None:
+    @property
+    def backend(self) -> SeedsBackend:
         """
-        Saves seeding result in the file.
-        :param result: SeedsResult object containing generated data.
+        Clients the seeding data is generated with, `SEEDS.BACKEND` by default.
+        Scenarios generating large data volumes may override it, i.e. with SeedsBackend.INTERNAL_GRPC
+        to create the data directly in the internal services.
+        """
+        return settings.seeds.backend
+
+    @property
+    def target(self) -> str:
+        """
+        Address of the gateway (or the internal users service) the seeding data is generated in.
+        """
+        return get_seeds_target(self.backend)
+
+    @property
+    def fingerprint(self) -> str:
         """
+        Hash identifying the seeding data: the same plan generated in the same gateway gives the same fingerprint.
+        """
+        payload = f'{self.target}:{self.plan.model_dump_json()}'
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def load_reusable_meta(self) -> SeedsMeta | None:
+        """
+        Loads metadata of the saved seeding result if the result can be reused (as is or as a base to top up).
+        :return: SeedsMeta of the dump generated in the same gateway which hasn't expired yet, otherwise None.
+        """
+        meta = load_seeds_meta(scenario=self.scenario)
+        if meta is None or meta.target != self.target:
+            return None
+
+        age = (datetime.now() - meta.created_at).total_seconds()
+        if settings.seeds.ttl is not None and age > settings.seeds.ttl:
+            return None
+
+        return meta
+
+    def is_actual(self) -> bool:
+        """
+        Checks whether the saved seeding result can be reused instead of generating data again.
+        :return: True if the dump was built for the same fingerprint and hasn't expired yet.
+        """
+        meta = self.load_reusable_meta()
+        return meta is not None and meta.fingerprint == self.fingerprint
+
+    def load_checkpoint(self) -> SeedsResult | None:
+        """
+        Loads users checkpointed by an interrupted seeding run in the same gateway.
+        A checkpoint left after seeding in another gateway is useless and is removed.
+        :return: SeedsResult with the checkpointed users or None if there is nothing to resume.
+        """
+        checkpoint = load_seeds_checkpoint(scenario=self.scenario)
+        if checkpoint is None:
+            return None
+
+        meta, result = checkpoint
+        if meta.target != self.target:
+            remove_seeds_checkpoint(scenario=self.scenario)
+            return None
+
+        return result
+
+    def save_users(self, users: Iterable[SeedUserResult]) -> None:
+        """
+        Saves seeding result users and the result metadata in the files.
+        Users are written as they are produced, so a generator of users being built can be passed.
+        Every user is checkpointed as well, the checkpoint is removed once all the users are saved.
+        :param users: Users containing generated data.
+        """
+        meta = SeedsMeta(fingerprint=self.fingerprint, target=self.target, created_at=datetime.now())
+
         logger.info(f'[{self.scenario}] Saving seeding result to file.')
-        save_seeds_result(result=result, scenario=self.scenario)
+        save_seeds_users(users=checkpoint_seeds_users(users, meta=meta, scenario=self.scenario), scenario=self.scenario)
+        save_seeds_meta(meta=meta.model_copy(update={'created_at': datetime.now()}), scenario=self.scenario)
+        remove_seeds_checkpoint(scenario=self.scenario)
         logger.info(f'[{self.scenario}] Seeding result saved successfully.')
 
-    def load(self) -> SeedsResult:
+    def save(self, result: SeedsResult) -> None:
+        """
+        Saves seeding result and its metadata in the files.
+        :param result: SeedsResult object containing generated data.
+        """
+        self.save_users(result.users)
+
+    def load(self) -> SeedsResult | CompactSeedsResult | SeedsDumpReader:
         """
         Loads seeding results from the file.
-        :return: SeedsResult object containing data loaded from the file.
+        With `SEEDS.COMPACT` enabled users are streamed from the file into memory-efficient CompactSeedsResult,
+        with `SEEDS.LAZY` enabled the file is only indexed and users are read on demand (see `open`).
+        :return: SeedsResult (or CompactSeedsResult, SeedsDumpReader) object containing data loaded from the file.
         """
+        if settings.seeds.lazy:
+            return self.open()
+
         logger.info(f'[{self.scenario}] Loading seeding result from file.')
-        result = load_seeds_result(scenario=self.scenario)
+        if settings.seeds.compact:
+            result = CompactSeedsResult.from_users(iter_seeds_users(scenario=self.scenario))
+        else:
+            result = load_seeds_result(scenario=self.scenario)
         logger.info(f'[{self.scenario}] Seeding result loaded successfully.')
         return result
 
+    def open(self) -> SeedsDumpReader:
+        """
+        Opens seeding result for lazy random access without loading all the users into memory.
+        Requires uncompressed JSONL dump format.
+        :return: SeedsDumpReader providing the same users API as SeedsResult.
+        """
+        logger.info(f'[{self.scenario}] Opening seeding result file.')
+        reader = SeedsDumpReader(scenario=self.scenario)
+        logger.info(f'[{self.scenario}] Seeding result opened successfully, {len(reader)} users indexed.')
+        return reader
+
+    def estimate(self) -> SeedsEstimate:
+        """
+        Calculates the number of gateway calls needed to generate data based on Seeding plan from scratch
+        and estimates the generation duration from the call times measured by the previous generation
+        (see `save_seeds_metrics`) and `SEEDS.CONCURRENCY`. No gateway calls are made.
+        :return: SeedsEstimate with the number of calls by the client method name and the estimated duration.
+        """
+        calls = self.builder.count_calls(self.plan)
+        concurrency = min(self.builder.concurrency, max(1, self.plan.users.count))
+
+        duration = None
+        report = load_seeds_metrics(scenario=self.scenario)
+        if report is not None and all(name in report.rpcs for name in calls):
+            # Calls of a single user are sequential, users are built in parallel
+            duration = sum(count * report.rpcs[name].mean for name, count in calls.items()) / 1000 / concurrency
+
+        estimate = SeedsEstimate(
+            calls=calls,
+            total_calls=sum(calls.values()),
+            concurrency=self.builder.concurrency,
+            duration=duration
+        )
+
+        logger.info(f'[{self.scenario}] Seeding plan requires {estimate.total_calls} gateway calls:')
+        for name, count in estimate.calls.items():
+            logger.info(f'[{self.scenario}]   {name}: {count}')
+        if estimate.duration is None:
+            logger.info(f'[{self.scenario}] No measured call times to estimate seeding duration.')
+        else:
+            logger.info(
+                f'[{self.scenario}] Estimated seeding duration with concurrency {estimate.concurrency}: '
+                f'{estimate.duration:.1f}s'
+            )
+
+        return estimate
+
+    def verify(self, result: SeedsResult) -> SeedsResult | None:
+        """
+        Checks that the users of the saved seeding result still exist in the gateway,
+        i.e. haven't been wiped by redeployment of the stand.
+        `SEEDS.VERIFY_FRACTION` of the users are sampled and checked in parallel, the invalid ones are dropped.
+        :param result: Seeding result loaded from the file.
+        :return: SeedsResult without the invalid users
+                 or None if the share of valid users is below `SEEDS.VERIFY_THRESHOLD`.
+        """
+        if not settings.seeds.verify_fraction or not result.users:
+            return result
+
+        sample_size = min(len(result.users), max(1, round(len(result.users) * settings.seeds.verify_fraction)))
+        sample = get_random().sample(result.users, k=sample_size)
+
+        logger.info(f'[{self.scenario}] Verifying {sample_size}/{len(result.users)} seeded users.')
+        invalid_user_ids = self.builder.find_invalid_users(sample)
+        valid_share = 1 - len(invalid_user_ids) / sample_size
+        logger.info(f'[{self.scenario}] {valid_share:.1%} of the verified users are valid.')
+
+        if valid_share < settings.seeds.verify_threshold:
+            logger.warning(f'[{self.scenario}] Too many invalid seeded users, the seeding result is rebuilt.')
+            return None
+
+        return SeedsResult(users=[user for user in result.users if user.user_id not in invalid_user_ids])
+
     def build(self) -> None:
         """
         Generates data based on Seeding plan using the builder and saves result.
+        Generation is skipped if an actual dump for the same plan already exists,
+        unless rebuilding is forced with `SEEDS.FORCE_REBUILD`.
+        With `SEEDS.INCREMENTAL` enabled a dump built for another plan is topped up with the missing data only.
+        If the previous run was interrupted, generation is resumed from the users it has checkpointed.
+        Timing of the gateway calls is saved next to the dump (see `save_seeds_metrics`).
+        With `SEEDS.DRY_RUN` enabled the plan cost is only estimated (see `estimate`).
+        With `SEEDS.VERIFY_FRACTION` set a reused dump is verified first (see `verify`):
+        invalid users are replaced with new ones or the dump is rebuilt from scratch.
         """
+        if settings.seeds.dry_run:
+            self.estimate()
+            return
+
+        meta = None if settings.seeds.force_rebuild else self.load_reusable_meta()
+        is_actual = meta is not None and meta.fingerprint == self.fingerprint
+        if is_actual and not settings.seeds.verify_fraction:
+            logger.info(f'[{self.scenario}] Actual seeding result found, skipping data generation.')
+            return
+
+        existing_result: SeedsResult | None = None
+        if is_actual or (meta is not None and settings.seeds.incremental):
+            if not is_actual:
+                logger.info(f'[{self.scenario}] Seeding result built for another plan found, topping it up.')
+
+            result = load_seeds_result(scenario=self.scenario)
+            existing_result = self.verify(result)
+            if is_actual and existing_result is not None and len(existing_result) == len(result):
+                logger.info(f'[{self.scenario}] Actual seeding result verified, skipping data generation.')
+                return
+
+        # Users of the interrupted run are as stale as the dump if the dump failed verification
+        is_stale = (is_actual or settings.seeds.incremental) and meta is not None and existing_result is None
+        if settings.seeds.force_rebuild or is_stale:
+            remove_seeds_checkpoint(scenario=self.scenario)
+
+        checkpoint_result = self.load_checkpoint()
+        if checkpoint_result is not None:
+            logger.info(f'[{self.scenario}] Resuming interrupted seeding from {len(checkpoint_result)} users.')
+            # Checkpointed users are the most complete versions of the users of the previous dump
+            checkpoint_user_ids = {user.user_id for user in checkpoint_result.users}
+            existing_users = existing_result.users if existing_result else []
+            existing_result = SeedsResult(users=[
+                *checkpoint_result.users,
+                *(user for user in existing_users if user.user_id not in checkpoint_user_ids)
+            ])
+
         # Convert Seeding plan into JSON for logging (without default values)
         plan_json = self.plan.model_dump_json(indent=2, exclude_defaults=True)
         logger.info(f'[{self.scenario}] Starting seeding data generation for plan: {plan_json}')
-        result = self.builder.build(self.plan)
+        self.save_users(self.builder.iter_build(self.plan, result=existing_result))
+        save_seeds_metrics(report=self.builder.report, scenario=self.scenario)
         logger.info(f'[{self.scenario}] Seeding data generation completed.')
-        self.save(result)
@@ -0,0 +1,43 @@
+from seeds.scenario import SeedsScenario
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan, SeedOperationsPlan
+
+
+class VolumeSweepCohortSeedsScenario(SeedsScenario):
+    """
+    Seeding scenario for a cohort of the data-volume sweep of the list endpoints.
+    Creates users with the given number of debit accounts, each with the given number of top-up operations.
+    """
+
+    def __init__(self, users: int, accounts: int, operations: int):
+        """
+        :param users: Number of users in the cohort.
+        :param accounts: Number of debit accounts per user.
+        :param operations: Number of operations per account.
+        """
+        self.users = users
+        self.accounts = accounts
+        self.operations = operations
+        super().__init__()
+
+    @property
+    def plan(self) -> SeedsPlan:
+        """
+        Seeding plan describing how many users to create and what data to generate for them.
+        Top-up operations are used, since their count is exactly the number of operations per account.
+        """
+        return SeedsPlan(
+            users=SeedUsersPlan(
+                count=self.users,
+                debit_card_accounts=SeedAccountsPlan(
+                    count=self.accounts,
+                    top_up_operations=SeedOperationsPlan(count=self.operations)
+                )
+            )
+        )
+
+    @property
+    def scenario(self) -> str:
+        """
+        Seeding scenario name used to save data.
+        """
+        return f'volume_sweep_{self.accounts}_accounts_{self.operations}_operations'
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class SeedsMeta(BaseModel):
+    """
+    Metadata stored next to the seeding result dump.
+
+    Attributes:
+        fingerprint (str): Hash of the seeding plan and the target gateway the data was generated for.
+        target (str): Address of the gateway the data was generated in.
+        created_at (datetime): Moment the seeding result was saved.
+    """
+    fingerprint: str
+    target: str
+    created_at: datetime
@@ -0,0 +1,64 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class SeedRPCMetrics(BaseModel):
+    """
+    Timing of the gateway calls of one type (i.e. `create_user`) made during seeding.
+
+    Attributes:
+        count (int): Number of calls including retried attempts.
+        failures (int): Number of failed attempts.
+        mean (float): Mean call time in milliseconds.
+        min (float): Minimal call time in milliseconds.
+        max (float): Maximal call time in milliseconds.
+        percentiles (dict[str, float]): Call time percentiles in milliseconds, i.e. {'p95': 12.5}.
+        histogram (dict[str, int]): Number of calls per upper bound of the call time (in milliseconds).
+    """
+    count: int
+    failures: int
+    mean: float
+    min: float
+    max: float
+    percentiles: dict[str, float] = Field(default_factory=dict)
+    histogram: dict[str, int] = Field(default_factory=dict)
+
+
+class SeedsMetricsReport(BaseModel):
+    """
+    Seeding run summary saved next to the seeding result dump.
+
+    Attributes:
+        started_at (datetime): Moment the seeding was started.
+        elapsed (float): Seeding duration in seconds.
+        concurrency (int): Max number of users built at the same time.
+        users (int): Number of built users.
+        entities (int): Number of created entities (users, accounts, cards, operations).
+        entities_per_second (float): Achieved seeding throughput.
+        rpcs (dict[str, SeedRPCMetrics]): Timing of the gateway calls by the client method name.
+    """
+    started_at: datetime
+    elapsed: float
+    concurrency: int
+    users: int
+    entities: int
+    entities_per_second: float
+    rpcs: dict[str, SeedRPCMetrics] = Field(default_factory=dict)
+
+
+class SeedsEstimate(BaseModel):
+    """
+    Cost of a seeding plan calculated without calling the gateway.
+
+    Attributes:
+        calls (dict[str, int]): Number of gateway calls by the client method name.
+        total_calls (int): Total number of gateway calls.
+        concurrency (int): Max number of users built at the same time.
+        duration (float | None): Estimated seeding duration in seconds
+                                 or None if there are no measured call times for some of the methods.
+    """
+    calls: dict[str, int] = Field(default_factory=dict)
+    total_calls: int
+    concurrency: int
+    duration: float | None = None
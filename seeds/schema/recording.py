@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+
+
+class SeedsRecord(BaseModel):
+    """
+    An entity created by a load test scenario and recorded to be reused as seeding data.
+
+    Attributes:
+        field (str): Field of the seeding result the entity belongs to,
+                     i.e. 'users', 'debit_card_accounts', 'physical_cards' or 'top_up_operations'.
+        parent_id (str | None): ID of the user the account belongs to or of the account the card
+                                or the operation belongs to. None for users.
+        entity_id (str): Unique ID of the created entity.
+    """
+    field: str
+    parent_id: str | None = None
+    entity_id: str
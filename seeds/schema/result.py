@@ -1,7 +1,7 @@
-import random
-
 from pydantic import BaseModel, Field
 
+from tools.rng import get_random
+
 
 class SeedCardResult(BaseModel):
     """
@@ -44,6 +44,22 @@ class SeedAccountResult(BaseModel):
     transfer_operations: list[SeedOperationResult] = Field(default_factory=list)
     cash_withdrawal_operations: list[SeedOperationResult] = Field(default_factory=list)
 
+    @property
+    def entities_count(self) -> int:
+        """
+        Number of entities created for the account: the account itself, its cards and operations.
+        """
+        return 1 + sum(
+            len(entities) for entities in (
+                self.physical_cards,
+                self.virtual_cards,
+                self.top_up_operations,
+                self.purchase_operations,
+                self.transfer_operations,
+                self.cash_withdrawal_operations
+            )
+        )
+
 
 class SeedUserResult(BaseModel):
     """
@@ -62,6 +78,25 @@ class SeedUserResult(BaseModel):
     debit_card_accounts: list[SeedAccountResult] = Field(default_factory=list)
     credit_card_accounts: list[SeedAccountResult] = Field(default_factory=list)
 
+    @property
+    def accounts(self) -> list[SeedAccountResult]:
+        """
+        All the user accounts regardless of their type.
+        """
+        return [
+            *self.deposit_accounts,
+            *self.savings_accounts,
+            *self.debit_card_accounts,
+            *self.credit_card_accounts
+        ]
+
+    @property
+    def entities_count(self) -> int:
+        """
+        Number of entities created for the user: the user itself and all the nested accounts' entities.
+        """
+        return 1 + sum(account.entities_count for account in self.accounts)
+
 
 class SeedsResult(BaseModel):
     """
@@ -73,6 +108,21 @@ class SeedsResult(BaseModel):
 
     users: list[SeedUserResult] = Field(default_factory=list)
 
+    def __len__(self) -> int:
+        return len(self.users)
+
+    def get_user(self, index: int) -> SeedUserResult:
+        """
+        Returns the user by its index without deleting it.
+
+        Args:
+            index: Index of the user.
+
+        Returns:
+            SeedUserResult: The user.
+        """
+        return self.users[index]
+
     def get_next_user(self) -> SeedUserResult:
         """
         Returns and deletes the first user from the list.
@@ -93,4 +143,4 @@ class SeedsResult(BaseModel):
         Returns:
             SeedUserResult: A random user.
         """
-        return random.choice(self.users)
+        return get_random().choice(self.users)
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class VolumeSweepPoint(BaseModel):
+    """
+    Latency of a list endpoint measured against a cohort of the data-volume sweep.
+
+    Attributes:
+        accounts (int): Number of accounts per user in the cohort.
+        operations (int): Number of operations per account in the cohort.
+        requests (int): Number of requests.
+        failures (int): Number of failed requests.
+        avg (float): Mean response time in milliseconds.
+        median (float): Median response time in milliseconds.
+        p95 (float): 95th percentile of the response time in milliseconds.
+        p99 (float): 99th percentile of the response time in milliseconds.
+        avg_bytes (float): Mean response size in bytes.
+        scaling_exponent (float | None): How the mean response time grows with the response size compared
+                                         to the previous point with a smaller response size:
+                                         1 — linearly, above 1 — faster than linearly.
+                                         None for the points of the smallest response size.
+    """
+    accounts: int
+    operations: int
+    requests: int
+    failures: int
+    avg: float
+    median: float
+    p95: float
+    p99: float
+    avg_bytes: float
+    scaling_exponent: float | None = None
+
+
+class VolumeSweepReport(BaseModel):
+    """
+    Latency-vs-result-size curves of the list endpoints built by the data-volume sweep.
+
+    Attributes:
+        created_at (datetime): Moment the report was built.
+        curves (dict[str, list[VolumeSweepPoint]]): Points of every endpoint (by the request name)
+                                                    ordered by the response size.
+    """
+    created_at: datetime
+    curves: dict[str, list[VolumeSweepPoint]] = Field(default_factory=dict)
@@ -0,0 +1,201 @@
+import heapq
+from array import array
+from bisect import bisect_left
+from itertools import count
+from typing import NamedTuple
+
+from locust.env import Environment
+
+from config import settings
+from seeds.compact import SeedUserView
+from seeds.pool import SeedUsersSource
+from seeds.schema.result import SeedUserResult
+from tools.config.seeds import SeedUsersSelection
+from tools.logger import get_logger
+from tools.rng import get_random
+
+logger = get_logger('SEEDS_SELECTOR')
+
+
+class SeedUsersSkew(NamedTuple):
+    """
+    Effective skew of the seed users picked during the test.
+
+    Attributes:
+        picks: Number of picked users.
+        distinct: Number of distinct users picked at least once.
+        top_1_share: Share of the picks which went to the top 1% most picked users.
+        top_10_share: Share of the picks which went to the top 10% most picked users.
+        max_share: Share of the picks which went to the most picked user.
+    """
+    picks: int
+    distinct: int
+    top_1_share: float
+    top_10_share: float
+    max_share: float
+
+
+class SeedUsersSelectorEmptyError(Exception):
+    pass
+
+
+class SeedUsersSelector:
+    """
+    Picks seed users for virtual users according to the selection distribution:
+    - UNIFORM — every user is equally likely to be picked;
+    - ZIPF — user of rank k (its index in the seeding result plus one) is picked
+      with probability proportional to 1 / k^zipf_exponent;
+    - HOT_SET — hot_share of the picks go to the first hot_fraction of the users, the rest go to the others;
+    - SEQUENTIAL — users are picked one after another in round-robin order.
+
+    Exposes the same `get_random_user` API as the seeding result, so can be used by scenarios as is.
+    Picks are counted per user and the effective skew is logged when the test stops,
+    so cache behaviour of the backend can be related to the access pattern.
+    """
+
+    def __init__(
+            self,
+            users: SeedUsersSource,
+            selection: SeedUsersSelection = SeedUsersSelection.UNIFORM,
+            zipf_exponent: float = 1.0,
+            hot_fraction: float = 0.01,
+            hot_share: float = 0.9,
+            environment: Environment | None = None
+    ):
+        """
+        :param users: Seeding result to pick users from.
+        :param selection: Selection distribution.
+        :param zipf_exponent: Exponent of the ZIPF distribution.
+        :param hot_fraction: Share of the users in the hot set of the HOT_SET distribution.
+        :param hot_share: Share of the picks going to the hot set of the HOT_SET distribution.
+        :param environment: Locust environment to log the skew on test stop.
+        """
+        self.selection = selection
+        self.zipf_exponent = zipf_exponent
+        self.hot_fraction = hot_fraction
+        self.hot_share = hot_share
+        self.replace(users)
+
+        if environment is not None:
+            environment.events.test_stop.add_listener(self.on_test_stop)
+
+    def replace(self, users: SeedUsersSource) -> None:
+        """
+        Replaces the users to pick from in place (i.e. with a new shard received on a test restart),
+        so the listener registered by the selector is kept. Picks counted so far are reset.
+
+        :param users: Seeding result to pick users from.
+        """
+        self.users = users
+        self.size = len(users)
+        self.hot_count = min(self.size, max(1, round(self.size * self.hot_fraction)))
+        self.cursor = count()
+        self.picks = array('L', [0]) * self.size
+
+        # Cumulative weights of the ZIPF distribution, a pick is a binary search in them
+        self.zipf_cdf = array('d')
+        if self.selection == SeedUsersSelection.ZIPF:
+            total = 0.0
+            for rank in range(1, self.size + 1):
+                total += 1 / rank ** self.zipf_exponent
+                self.zipf_cdf.append(total)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def next_index(self) -> int:
+        """
+        :return: Index of the next user to pick according to the selection distribution.
+        :raises SeedUsersSelectorEmptyError: If there are no users to pick from.
+        """
+        if not self.size:
+            raise SeedUsersSelectorEmptyError('No seed users to pick from, i.e. there are more workers than seed users')
+
+        random = get_random()
+
+        if self.selection == SeedUsersSelection.ZIPF:
+            return min(self.size - 1, bisect_left(self.zipf_cdf, random.random() * self.zipf_cdf[-1]))
+
+        if self.selection == SeedUsersSelection.HOT_SET:
+            if self.hot_count == self.size or random.random() < self.hot_share:
+                return random.randrange(self.hot_count)
+            return random.randrange(self.hot_count, self.size)
+
+        if self.selection == SeedUsersSelection.SEQUENTIAL:
+            return next(self.cursor) % self.size
+
+        return random.randrange(self.size)
+
+    def get_random_user(self) -> SeedUserResult | SeedUserView:
+        """
+        Picks a user according to the selection distribution without removing it.
+
+        :return: Picked user.
+        """
+        index = self.next_index()
+        self.picks[index] += 1
+        return self.users.get_user(index)
+
+    def skew(self) -> SeedUsersSkew:
+        """
+        :return: Effective skew of the users picked so far.
+        """
+        picks = sum(self.picks)
+        if not picks:
+            return SeedUsersSkew(picks=0, distinct=0, top_1_share=0.0, top_10_share=0.0, max_share=0.0)
+
+        top_10 = heapq.nlargest(max(1, self.size // 10), self.picks)
+        return SeedUsersSkew(
+            picks=picks,
+            distinct=sum(1 for user_picks in self.picks if user_picks),
+            top_1_share=sum(top_10[:max(1, self.size // 100)]) / picks,
+            top_10_share=sum(top_10) / picks,
+            max_share=top_10[0] / picks
+        )
+
+    def log_skew(self) -> None:
+        skew = self.skew()
+        logger.info(
+            f'Seed users selection ({self.selection}): {skew.picks} picks of {skew.distinct}/{self.size} users, '
+            f'top 1% users got {skew.top_1_share:.1%}, top 10% got {skew.top_10_share:.1%}, '
+            f'the hottest user got {skew.max_share:.1%}'
+        )
+
+    def on_test_stop(self, **kwargs) -> None:
+        self.log_skew()
+
+
+def build_seed_users_selector(
+        users: SeedUsersSource,
+        environment: Environment,
+        selection: SeedUsersSelection | None = None,
+        name: str = 'default'
+) -> SeedUsersSelector:
+    """
+    Creates seed users selector configured with `SEEDS.SELECTION*` settings.
+    Selectors are kept in `environment.seed_users_selectors` by name,
+    later calls with the same name replace the users of the same selector.
+
+    :param users: Seeding result to pick users from.
+    :param environment: Locust environment to log the skew on test stop.
+    :param selection: Selection distribution of the scenario, `SEEDS.SELECTION` by default.
+    :param name: Name of the selector, i.e. the sweep cohort tag, if the scenario picks users from several results.
+    :return: Ready-to-use SeedUsersSelector.
+    """
+    registry: dict[str, SeedUsersSelector] | None = getattr(environment, 'seed_users_selectors', None)
+    if registry is None:
+        registry = environment.seed_users_selectors = {}
+
+    if name in registry:
+        registry[name].replace(users)
+        return registry[name]
+
+    selector = registry[name] = SeedUsersSelector(
+        users=users,
+        selection=selection or settings.seeds.selection,
+        zipf_exponent=settings.seeds.selection_zipf_exponent,
+        hot_fraction=settings.seeds.selection_hot_fraction,
+        hot_share=settings.seeds.selection_hot_share,
+        environment=environment
+    )
+    return selector
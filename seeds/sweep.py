@@ -0,0 +1,137 @@
+import math
+from datetime import datetime
+from typing import Callable, NamedTuple
+
+from locust.env import Environment
+from locust.runners import WorkerRunner
+from locust.stats import RequestStats
+
+from config import settings
+from seeds.compact import CompactSeedsResult
+from seeds.dumps import SeedsDumpReader, save_volume_sweep_report
+from seeds.locust import setup_seeds
+from seeds.scenarios.volume_sweep import VolumeSweepCohortSeedsScenario
+from seeds.schema.result import SeedsResult
+from seeds.schema.sweep import VolumeSweepPoint, VolumeSweepReport
+from tools.logger import get_logger
+
+logger = get_logger('SEEDS_SWEEP')
+
+
+class VolumeSweepCohort(NamedTuple):
+    """
+    Cohort of the data-volume sweep.
+
+    Attributes:
+        seeds_scenario: Seeding scenario building the cohort users.
+        tag: Stats tag of the requests made against the cohort, i.e. '1 accounts x 100 operations'.
+    """
+    seeds_scenario: VolumeSweepCohortSeedsScenario
+    tag: str
+
+
+def build_volume_sweep_cohorts() -> list[VolumeSweepCohort]:
+    """
+    Creates a cohort for every combination of `SWEEP.ACCOUNTS` and `SWEEP.OPERATIONS`,
+    each with `SWEEP.USERS` users.
+
+    :return: Cohorts ordered by the data volume.
+    """
+    return [
+        VolumeSweepCohort(
+            seeds_scenario=VolumeSweepCohortSeedsScenario(
+                users=settings.sweep.users,
+                accounts=accounts,
+                operations=operations
+            ),
+            tag=f'{accounts} accounts x {operations} operations'
+        )
+        for accounts in sorted(settings.sweep.accounts)
+        for operations in sorted(settings.sweep.operations)
+    ]
+
+
+def build_volume_sweep_report(stats: RequestStats, cohorts: list[VolumeSweepCohort]) -> VolumeSweepReport:
+    """
+    Builds latency-vs-result-size curves from the Locust stats of the requests tagged with the cohort tags.
+
+    :param stats: Locust request statistics.
+    :param cohorts: Sweep cohorts.
+    :return: VolumeSweepReport with a curve for every requested endpoint.
+    """
+    curves: dict[str, list[VolumeSweepPoint]] = {}
+    for cohort in cohorts:
+        suffix = f' [{cohort.tag}]'
+        for entry in stats.entries.values():
+            if not entry.name.endswith(suffix) or not entry.num_requests:
+                continue
+
+            curves.setdefault(entry.name.removesuffix(suffix), []).append(VolumeSweepPoint(
+                accounts=cohort.seeds_scenario.accounts,
+                operations=cohort.seeds_scenario.operations,
+                requests=entry.num_requests,
+                failures=entry.num_failures,
+                avg=round(entry.avg_response_time, 3),
+                median=entry.median_response_time,
+                p95=entry.get_response_time_percentile(0.95),
+                p99=entry.get_response_time_percentile(0.99),
+                avg_bytes=round(entry.avg_content_length, 1)
+            ))
+
+    for points in curves.values():
+        points.sort(key=lambda point: (point.avg_bytes, point.accounts, point.operations))
+
+        # Points of the same response size (i.e. get_operations of cohorts differing in accounts only)
+        # are compared to the last point of the previous response size
+        smaller: VolumeSweepPoint | None = None
+        for previous, point in zip(points, points[1:]):
+            if point.avg_bytes != previous.avg_bytes:
+                smaller = previous
+            if smaller is not None and smaller.avg_bytes and smaller.avg and point.avg:
+                point.scaling_exponent = round(
+                    math.log(point.avg / smaller.avg) / math.log(point.avg_bytes / smaller.avg_bytes), 3
+                )
+
+    return VolumeSweepReport(created_at=datetime.now(), curves=curves)
+
+
+def log_volume_sweep_report(report: VolumeSweepReport) -> None:
+    for name, points in report.curves.items():
+        logger.info(f'{name}:')
+        for point in points:
+            scaling = '' if point.scaling_exponent is None else f', scaling exponent {point.scaling_exponent}'
+            logger.info(
+                f'  {point.accounts} accounts x {point.operations} operations: {point.avg_bytes:.0f} bytes, '
+                f'avg {point.avg:.1f}ms, p95 {point.p95:.0f}ms, {point.failures}/{point.requests} failed{scaling}'
+            )
+
+
+def setup_volume_sweep(
+        environment: Environment,
+        cohorts: list[VolumeSweepCohort],
+        scenario: str,
+        on_load: Callable[[VolumeSweepCohort, SeedsResult | CompactSeedsResult | SeedsDumpReader], None]
+) -> None:
+    """
+    Prepares seeding data of every sweep cohort (see `setup_seeds`)
+    and saves the latency-vs-result-size curves when Locust quits (on master in distributed runs).
+
+    Requests made against a cohort have to be tagged with the cohort tag (see `tools.locust.tags.stats_tag`).
+
+    :param environment: Locust environment.
+    :param cohorts: Sweep cohorts.
+    :param scenario: Load test scenario name the report is saved for.
+    :param on_load: Callback receiving the cohort and its seeding result to be used by virtual users.
+    """
+    for cohort in cohorts:
+        setup_seeds(environment, cohort.seeds_scenario, lambda result, cohort=cohort: on_load(cohort, result))
+
+    if isinstance(environment.runner, WorkerRunner):
+        return
+
+    def on_quitting(**kwargs) -> None:
+        report = build_volume_sweep_report(environment.stats, cohorts)
+        log_volume_sweep_report(report)
+        save_volume_sweep_report(report, scenario=scenario)
+
+    environment.events.quitting.add_listener(on_quitting)
@@ -0,0 +1,40 @@
+import importlib
+import inspect
+from pathlib import Path
+
+import pytest
+
+from clients.grpc.gateway.locust import GatewayGRPCSequentialTaskSet, GatewayGRPCTaskSet
+from clients.http.gateway.locust import GatewayHTTPSequentialTaskSet, GatewayHTTPTaskSet
+from tools.locust.user import LocustBaseUser
+
+SCENARIOS_DIR = Path(__file__).parents[2] / 'scenarios'
+
+# Base TaskSets picking tasks from the virtual user random stream (or in a fixed order) and building the clients
+GATEWAY_TASK_SETS = {
+    'http': (GatewayHTTPTaskSet, GatewayHTTPSequentialTaskSet),
+    'grpc': (GatewayGRPCTaskSet, GatewayGRPCSequentialTaskSet),
+}
+
+
+def iter_scenario_modules():
+    for path in sorted(SCENARIOS_DIR.glob('*/gateway/*/scenario.py')):
+        yield '.'.join(path.relative_to(SCENARIOS_DIR.parent).with_suffix('').parts)
+
+
+@pytest.mark.parametrize('module_name', list(iter_scenario_modules()))
+def test_scenario_task_sets_extend_gateway_task_sets(module_name: str):
+    module = importlib.import_module(module_name)
+    protocol = module_name.split('.')[1]
+
+    users = [
+        value for value in vars(module).values()
+        if inspect.isclass(value) and issubclass(value, LocustBaseUser) and value.__module__ == module_name
+    ]
+    assert users
+
+    for user in users:
+        for task_set in user.tasks:
+            assert issubclass(task_set, GATEWAY_TASK_SETS[protocol]), (
+                f'{module_name}.{task_set.__name__} has to extend one of {GATEWAY_TASK_SETS[protocol]}'
+            )
@@ -0,0 +1,126 @@
+from itertools import count
+from types import SimpleNamespace
+
+import pytest
+
+from contracts.services.operations.operation_pb2 import OperationType
+from seeds.internal_builder import InternalSeedsBuilder, SeedsBalanceError
+from seeds.scenario import SeedsScenario
+from seeds.scenarios.existing_user_get_documents import ExistingUserGetDocumentsSeedsScenario
+from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
+from seeds.scenarios.existing_user_issue_virtual_card import ExistingUserIssueVirtualCardSeedsScenario
+from seeds.scenarios.existing_user_make_purchase_operation import ExistingUserMakePurchaseOperationSeedsScenario
+from seeds.scenarios.volume_sweep import VolumeSweepCohortSeedsScenario
+from seeds.schema.plan import SeedAccountsPlan, SeedOperationsPlan, SeedsPlan, SeedUsersPlan
+
+INCOMING_OPERATION_TYPES = {OperationType.OPERATION_TYPE_TOP_UP}
+
+
+class FakeServices:
+    """
+    In-memory internal services keeping the running balance of every account from the created operations.
+    """
+
+    def __init__(self):
+        self.ids = count()
+        self.balances: dict[str, float] = {}
+        self.running_balances: dict[str, float] = {}
+        self.operations: list[str] = []
+
+    def next_id(self, prefix: str) -> str:
+        return f'{prefix}-{next(self.ids)}'
+
+    def create_user(self):
+        return SimpleNamespace(user=SimpleNamespace(id=self.next_id('user')))
+
+    def create_card(self, account_id: str, card_type):
+        return SimpleNamespace(card=SimpleNamespace(id=self.next_id('card')))
+
+    def get_cards(self, account_id: str):
+        return SimpleNamespace(cards=[SimpleNamespace(id=self.next_id('card'))])
+
+    def create_account(self, user_id: str, account_type):
+        account_id = self.next_id('account')
+        self.balances[account_id] = 0.0
+        self.running_balances[account_id] = 0.0
+        return SimpleNamespace(account=SimpleNamespace(id=account_id))
+
+    def get_account(self, account_id: str):
+        return SimpleNamespace(account=SimpleNamespace(id=account_id, balance=self.balances[account_id]))
+
+    def update_account_balance(self, account_id: str, balance: float):
+        self.balances[account_id] = balance
+        return self.get_account(account_id=account_id)
+
+    def create_operation(self, card_id: str, account_id: str, operation_type, amount: float):
+        assert amount > 0
+        sign = 1 if operation_type in INCOMING_OPERATION_TYPES else -1
+        self.running_balances[account_id] = round(self.running_balances[account_id] + sign * amount, 2)
+        self.operations.append(account_id)
+        return SimpleNamespace(operation=SimpleNamespace(id=self.next_id('operation')))
+
+
+def build_builder(services: FakeServices) -> InternalSeedsBuilder:
+    return InternalSeedsBuilder(
+        users_service_client=services,
+        cards_service_client=services,
+        accounts_service_client=services,
+        operations_service_client=services
+    )
+
+
+def build_plan(scenario: type[SeedsScenario], **options) -> SeedsPlan:
+    # Scenario is created without its builder, only the plan is needed
+    seeds_scenario = object.__new__(scenario)
+    seeds_scenario.__dict__.update(options)
+    return seeds_scenario.plan
+
+
+@pytest.mark.parametrize(
+    ('scenario', 'options'),
+    [
+        (ExistingUserGetDocumentsSeedsScenario, {}),
+        (ExistingUserGetOperationsSeedsScenario, {}),
+        (ExistingUserIssueVirtualCardSeedsScenario, {}),
+        (ExistingUserMakePurchaseOperationSeedsScenario, {}),
+        (VolumeSweepCohortSeedsScenario, {'users': 5, 'accounts': 2, 'operations': 10}),
+    ]
+)
+def test_bundled_plans_keep_balances_non_negative(scenario: type[SeedsScenario], options: dict):
+    services = FakeServices()
+    plan = build_plan(scenario, **options)
+
+    build_builder(services).build(plan)
+    assert all(balance >= 0 for balance in services.balances.values())
+    assert all(balance >= 0 for balance in services.running_balances.values())
+    assert services.balances == services.running_balances
+
+
+def test_incremental_run_keeps_balance():
+    services = FakeServices()
+    builder = build_builder(services)
+    plan = build_plan(ExistingUserGetOperationsSeedsScenario)
+    result = builder.build(plan)
+
+    accounts = plan.users.credit_card_accounts.model_copy(update={
+        'top_up_operations': SeedOperationsPlan(count=2),
+        'purchase_operations': SeedOperationsPlan(count=10)
+    })
+    builder.build(
+        plan.model_copy(update={'users': plan.users.model_copy(update={'credit_card_accounts': accounts})}),
+        result=result
+    )
+    assert all(balance >= 0 for balance in services.balances.values())
+    assert services.balances == services.running_balances
+
+
+def test_plan_without_top_ups_is_rejected_before_operations_are_created():
+    services = FakeServices()
+    plan = SeedsPlan(users=SeedUsersPlan(
+        count=1,
+        debit_card_accounts=SeedAccountsPlan(count=1, purchase_operations=SeedOperationsPlan(count=1))
+    ))
+
+    with pytest.raises(SeedsBalanceError):
+        build_builder(services).build(plan)
+    assert services.operations == []
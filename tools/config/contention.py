@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class ContentionConfig(BaseModel):
+    # Share of the writes routed to the hot accounts (0 — every virtual user writes to its own seed user accounts)
+    hot_fraction: float = 0.0
+
+    # Number of the hot accounts every worker routes the writes to
+    hot_accounts: int = 1
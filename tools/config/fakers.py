@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class FakerConfig(BaseModel):
+    # How many values of every field are pregenerated to draw fake data from (0 — generate every value with Faker)
+    pool_size: int = 0
+
+    # Directory the pregenerated values are memory-mapped from, pools missing there are generated and saved;
+    # None — pools are generated in memory on every start
+    pools_dir: str | None = None
@@ -1,10 +1,70 @@
-from pydantic import BaseModel, HttpUrl
+from enum import StrEnum
+
+from pydantic import BaseModel, Field, HttpUrl
+
+
+class HTTPClientBackend(StrEnum):
+    HTTPX = 'httpx'  # httpx.Client, supports HTTP/2 and all the settings
+    GEVENT = 'gevent'  # geventhttpclient, several times less CPU per request, HTTP/1.1 only
+
+
+class HTTPClientLimitsConfig(BaseModel):
+    # Max number of connections of a connection pool (None — unlimited)
+    max_connections: int | None = 100
+
+    # Max number of idle connections kept alive in a pool (None — unlimited)
+    # and how long (in seconds) an idle connection is kept alive
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+
+
+class HTTPClientTimeoutsConfig(BaseModel):
+    # Timeouts (in seconds) of establishing a connection, of reading and writing a chunk of data
+    # and of waiting for a free connection in the pool; None — the common `timeout` is used
+    connect: float | None = None
+    read: float | None = None
+    write: float | None = None
+    pool: float | None = None
+
+
+class HTTPClientSocketConfig(BaseModel):
+    # Local IP address the connections are made from, i.e. to spread the load over several interfaces
+    local_address: str | None = None
+
+    # Enable TCP keep-alive probes of idle connections (TCP_NODELAY is always enabled by httpcore)
+    keepalive: bool = False
+
+    # Socket receive and send buffer sizes in bytes (None — OS defaults)
+    receive_buffer_size: int | None = None
+    send_buffer_size: int | None = None
 
 
 class HTTPClientConfig(BaseModel):
     url: HttpUrl
     timeout: float = 100.0
 
+    # Library the requests are sent with. With GEVENT max_connections is the pool size (None — 1000),
+    # idle connections are kept until the server closes them and the pool timeout isn't supported
+    backend: HTTPClientBackend = HTTPClientBackend.HTTPX
+
+    # Connection pool limits, timeouts of the request phases and options of the connection sockets
+    limits: HTTPClientLimitsConfig = Field(default_factory=HTTPClientLimitsConfig)
+    timeouts: HTTPClientTimeoutsConfig = Field(default_factory=HTTPClientTimeoutsConfig)
+    socket: HTTPClientSocketConfig = Field(default_factory=HTTPClientSocketConfig)
+
+    # Speak HTTP/2 to the gateway (requires `h2` package, i.e. `pip install httpx[http2]`):
+    # over TLS it is negotiated with a fallback to HTTP/1.1, over plain TCP it is used with prior knowledge.
+    # Streams of the users sharing a pool (see `users_per_pool`) are multiplexed over its connections
+    http2: bool = False
+
+    # Report phases of every request (connect, TLS, write, time to first byte, download)
+    # as 'http_phases' custom statistics, apart from the requests; pool wait is always reported as 'http_pool'
+    phases: bool = False
+
+    # How many virtual users of a worker share one connection pool (0 — a single pool for all the users),
+    # all the service clients of a user always share its pool
+    users_per_pool: int = 1
+
     @property
     def client_url(self) -> str:
         """
@@ -12,4 +72,3 @@ class HTTPClientConfig(BaseModel):
         httpx.Client requires base_url as a string.
         """
         return str(self.url)
-
@@ -0,0 +1,105 @@
+from enum import StrEnum
+
+from pydantic import BaseModel
+
+
+class SeedsBackend(StrEnum):
+    GRPC = 'grpc'  # gRPC gateway clients, users are built in parallel greenlets
+    HTTP = 'http'  # HTTP gateway clients, users are built in parallel greenlets
+    INTERNAL_GRPC = 'internal_grpc'  # gRPC clients of the internal services, the gateway is bypassed
+
+
+class SeedsDumpFormat(StrEnum):
+    JSON = 'json'  # The whole SeedsResult as a single JSON document
+    JSONL = 'jsonl'  # One SeedUserResult per line, written and read in a streaming manner
+
+
+class SeedsDumpCompression(StrEnum):
+    NONE = 'none'
+    GZIP = 'gzip'
+    ZSTD = 'zstd'  # Requires optional `zstandard` package
+
+
+class SeedUsersPoolPolicy(StrEnum):
+    BLOCK = 'block'  # Wait until another virtual user releases its seed user
+    RECYCLE = 'recycle'  # Share already leased seed users in round-robin order
+    FAIL_FAST = 'fail_fast'  # Raise SeedUsersPoolExhaustedError immediately
+
+
+class SeedUsersSelection(StrEnum):
+    UNIFORM = 'uniform'  # Every seed user is equally likely to be picked
+    ZIPF = 'zipf'  # Seed user of rank k is picked with probability proportional to 1 / k^exponent
+    HOT_SET = 'hot_set'  # A share of picks goes to a small hot set of seed users, the rest to the tail
+    SEQUENTIAL = 'sequential'  # Seed users are picked one after another in round-robin order
+
+
+class SeedsConfig(BaseModel):
+    # Clients the seeding data is generated with
+    backend: SeedsBackend = SeedsBackend.GRPC
+
+    # How many users are seeded in parallel (1 — strictly sequential seeding)
+    concurrency: int = 1
+
+    # How many times a failed gateway call is retried (0 — no retries) and the delay (in seconds)
+    # before the first retry, every next retry waits twice as long. Calls creating entities are retried
+    # only on connection errors, so a request already processed by the gateway doesn't create a duplicate
+    retries: int = 0
+    retry_backoff: float = 0.5
+
+    # Only log the number of gateway calls the seeding plan needs and its estimated duration, call nothing
+    dry_run: bool = False
+
+    # Regenerate seeding data even if a dump built for the same plan already exists
+    force_rebuild: bool = False
+
+    # Top up an existing dump built in the same gateway instead of regenerating it from scratch
+    incremental: bool = False
+
+    # Share of the users of a reused dump checked to still exist in the gateway (0 — no checks, 1 — all the users)
+    # and the min share of valid users to keep the dump, otherwise it is rebuilt from scratch
+    verify_fraction: float = 0.0
+    verify_threshold: float = 0.9
+
+    # How long (in seconds) an existing dump may be reused; None — no expiration
+    ttl: float | None = None
+
+    # Seeding result dump file format and compression
+    dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON
+    dump_compression: SeedsDumpCompression = SeedsDumpCompression.NONE
+
+    # Load seeding result into memory-efficient columnar structure instead of pydantic models
+    compact: bool = False
+
+    # Read seed users from the dump on demand instead of loading them into memory,
+    # requires uncompressed JSONL dumps
+    lazy: bool = False
+
+    # What to do when all the seed users are leased by virtual users and how long to wait for a free one
+    pool_policy: SeedUsersPoolPolicy = SeedUsersPoolPolicy.BLOCK
+    pool_timeout: float | None = None
+
+    # How virtual users pick seed users, i.e. to reproduce realistic cache hit rates
+    selection: SeedUsersSelection = SeedUsersSelection.UNIFORM
+
+    # Zipf distribution exponent: the larger it is, the more picks go to the first seed users
+    selection_zipf_exponent: float = 1.0
+
+    # Share of the seed users in the hot set and share of the picks going to them
+    selection_hot_fraction: float = 0.01
+    selection_hot_share: float = 0.9
+
+    # Create users and accounts of new user scenarios in the background instead of the measured journey
+    replenish: bool = False
+
+    # How many entities per second are created in the background (None — no limit)
+    # and how many ready-made entities are kept
+    replenish_rate: float | None = None
+    replenish_capacity: int = 100
+
+    # Seeding scenario dump the entities created by new user scenarios are merged into (None — nothing is recorded),
+    # i.e. 'existing_user_get_operations' to reuse them with SEEDS.INCREMENTAL enabled
+    record_scenario: str | None = None
+
+    # Max number of users kept in the recorded dump, every recording run adds its users to it,
+    # the oldest users are dropped first (None — no limit)
+    record_max_users: int | None = None
@@ -0,0 +1,10 @@
+from pydantic import BaseModel, Field
+
+
+class SweepConfig(BaseModel):
+    # How many seed users every cohort of the data-volume sweep has
+    users: int = 10
+
+    # Accounts per user and operations per account of the sweep cohorts, every combination is a cohort
+    accounts: list[int] = Field(default_factory=lambda: [1])
+    operations: list[int] = Field(default_factory=lambda: [1, 10, 100, 1000])
@@ -1,20 +1,207 @@
+import itertools
+import mmap
+import os
 import time
+import uuid
+from array import array
+from typing import Callable, Generic, TypeVar
 
 from faker import Faker
 from faker.providers.python import TEnum
 from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
+from locust import events
+from locust.env import Environment
+
+from config import settings
+from tools.logger import get_logger
+from tools.rng import build_random, current_random, get_random
+
+T = TypeVar('T')
+
+logger = get_logger('FAKERS')
+
+# Purchase categories, i.e. spending purposes of the user transactions
+FAKE_CATEGORIES = (
+    'gas',
+    'taxi',
+    'tolls',
+    'water',
+    'beauty',
+    'mobile',
+    'travel',
+    'parking',
+    'catalog',
+    'internet',
+    'satellite',
+    'education',
+    'government',
+    'healthcare',
+    'restaurants',
+    'electricity',
+    'supermarkets',
+)
+
+
+class FakePool(Generic[T]):
+    """
+    Pregenerated values of a single fake data field.
+    Values are drawn in a round-robin order, so drawing a value costs an index into a list.
+    With the run seed set values are drawn from the random stream of the virtual user instead,
+    so that every user draws the same values on every run.
+    """
+
+    def __init__(self, values: list[T]):
+        """
+        :param values: Pregenerated values, i.e. last names.
+        """
+        self.values = values
+        self.size = len(values)
+        self.counter = itertools.count()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def next_index(self) -> int:
+        if settings.seed is not None:
+            return get_random().randrange(self.size)
+
+        return next(self.counter) % self.size
+
+    def __call__(self) -> T:
+        return self.values[self.next_index()]
+
+    def save(self, path: str) -> None:
+        """
+        Saves the values to a file, one value per line, to be memory-mapped by MappedFakePool later.
+        The file is written next to the target and then moved in place, so other Locust processes
+        of the machine never see a partially written pool.
+
+        :param path: Path to the file.
+        """
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.writelines(f'{value}\n' for value in self.values)
+        os.replace(temp_path, path)
+
+
+class MappedFakePool(FakePool[T]):
+    """
+    Pregenerated values of a single fake data field memory-mapped from a file saved by FakePool.
+    Only line offsets are kept in memory, the values are decoded on draw.
+    Memory pages of the file are shared by all the Locust worker processes of the machine.
+    """
+
+    def __init__(self, path: str, convert: Callable[[str], T] = str):
+        """
+        :param path: Path to the file with one value per line.
+        :param convert: Converts a line into the value, i.e. float for amounts.
+        """
+        with open(path, 'rb') as file:
+            self.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.convert = convert
+        self.offsets = array('Q', [0])
+        position = self.mapping.find(b'\n')
+        while position != -1:
+            self.offsets.append(position + 1)
+            position = self.mapping.find(b'\n', position + 1)
+
+        super().__init__(values=[])
+        self.size = len(self.offsets) - 1
+
+    def __call__(self) -> T:
+        index = self.next_index()
+        line = self.mapping[self.offsets[index]:self.offsets[index + 1] - 1]
+        return self.convert(line.decode('utf-8'))
 
 
 class Fake:
     """
     Class to generate random test data with Faker lib.
+
+    Generating a value with Faker is expensive CPU-wise, so the most frequently generated fields
+    can be drawn from pools of pregenerated values instead (see `use_pools`).
     """
 
+    # Pooled fields: how to generate a value with Faker and how to convert it back from a pool file
+    POOLED_FIELDS: dict[str, tuple[Callable[[Faker], object], Callable[[str], object]]] = {
+        'email': (lambda faker: faker.email(), str),
+        'last_name': (lambda faker: faker.last_name(), str),
+        'first_name': (lambda faker: faker.first_name(), str),
+        'middle_name': (lambda faker: faker.first_name(), str),
+        'phone_number': (lambda faker: faker.phone_number(), str),
+        'category': (lambda faker: faker.random_element(FAKE_CATEGORIES), str),
+        'amount': (lambda faker: faker.pyfloat(min_value=1, max_value=1000, right_digits=2), float),
+    }
+
     def __init__(self, faker: Faker):
         """
         :param faker: Faker instance used to generate data.
         """
-        self.faker = faker
+        self._faker = faker
+        self.pools: dict[str, FakePool] = {}
+
+        # Pooled emails repeat, so they are made unique with a process-wide prefix and a counter
+        self.email_prefix = uuid.uuid4().hex[:8]
+        self.email_counter = itertools.count()
+
+    @property
+    def faker(self) -> Faker:
+        """
+        Faker instance drawing from the random stream of the current virtual user if the run seed is set
+        (see `tools.rng`), so every user generates the same data on every run.
+        """
+        if settings.seed is not None:
+            self._faker.random = get_random()
+
+        return self._faker
+
+    def use_pools(self, size: int, pools_dir: str | None = None) -> None:
+        """
+        Switches pooled fields to drawing values from pregenerated pools.
+        Pools are memory-mapped from `pools_dir` if they are saved there,
+        otherwise they are generated in bulk (and saved to `pools_dir` if it is passed).
+
+        With the run seed set pools are generated from the seed and saved separately for every seed.
+
+        :param size: Number of pregenerated values of every field.
+        :param pools_dir: Directory to load the pools from and save them to.
+        """
+        started = time.perf_counter()
+        for name, (generate, convert) in self.POOLED_FIELDS.items():
+            filename = f'{name}.txt' if settings.seed is None else f'{name}.{settings.seed}.txt'
+            path = os.path.join(pools_dir, filename) if pools_dir else None
+
+            if path and os.path.exists(path):
+                pool = MappedFakePool(path, convert=convert)
+                if len(pool) >= size:
+                    # Pools are always drawn within the same size, so a larger saved pool draws the same values
+                    pool.size = size
+                    self.pools[name] = pool
+                    continue
+
+            token = current_random.set(build_random('fakers', name))
+            try:
+                pool = FakePool([generate(self.faker) for _ in range(size)])
+            finally:
+                current_random.reset(token)
+            if path:
+                pool.save(path)
+            self.pools[name] = pool
+
+        logger.info(f'Fake data pools of {size} values are ready in {time.perf_counter() - started:.2f}s')
+
+    def pooled(self, name: str, generate: Callable[[], T]) -> T:
+        """
+        Draws a value of the field from its pool or generates it if the field isn't pooled.
+
+        :param name: Name of the field, i.e. 'last_name'.
+        :param generate: Generates a value with Faker.
+        :return: Value of the field.
+        """
+        pool = self.pools.get(name)
+        return pool() if pool else generate()
 
     def enum(self, value: type[TEnum]) -> TEnum:
         """
@@ -36,9 +223,13 @@ class Fake:
 
     def email(self) -> str:
         """
-        Generates random email.
+        Generates random unique email.
         :return: Random email.
         """
+        pool = self.pools.get('email')
+        if pool:
+            return f'{self.email_prefix}.{next(self.email_counter)}.{pool()}'
+
         return f'{time.time()}.{self.faker.email()}'
 
     def category(self) -> str:
@@ -50,25 +241,7 @@ class Fake:
 
         :return: Random category (i.e., 'gas', 'taxi', 'supermarkets' and ).
         """
-        return self.faker.random_element([
-            'gas',
-            'taxi',
-            'tolls',
-            'water',
-            'beauty',
-            'mobile',
-            'travel',
-            'parking',
-            'catalog',
-            'internet',
-            'satellite',
-            'education',
-            'government',
-            'healthcare',
-            'restaurants',
-            'electricity',
-            'supermarkets',
-        ])
+        return self.pooled('category', lambda: self.faker.random_element(FAKE_CATEGORIES))
 
     def last_name(self) -> str:
         """
@@ -76,7 +249,7 @@ class Fake:
 
         :return: Random last name.
         """
-        return self.faker.last_name()
+        return self.pooled('last_name', self.faker.last_name)
 
     def first_name(self) -> str:
         """
@@ -84,7 +257,7 @@ class Fake:
 
         :return: Random first name.
         """
-        return self.faker.first_name()
+        return self.pooled('first_name', self.faker.first_name)
 
     def middle_name(self) -> str:
         """
@@ -92,7 +265,7 @@ class Fake:
 
         :return: Random middle name.
         """
-        return self.faker.first_name()
+        return self.pooled('middle_name', self.faker.first_name)
 
     def phone_number(self) -> str:
         """
@@ -100,7 +273,56 @@ class Fake:
 
         :return: Random phone number.
         """
-        return self.faker.phone_number()
+        return self.pooled('phone_number', self.faker.phone_number)
+
+    def full_name(self) -> str:
+        """
+        Generates random full name, i.e. to be printed on a card.
+
+        :return: Random full name.
+        """
+        return self.faker.name()
+
+    def card_number(self) -> str:
+        """
+        Generates random card number.
+
+        :return: Random card number.
+        """
+        return self.faker.credit_card_number()
+
+    def card_expiry_date(self) -> str:
+        """
+        Generates random card expiry date.
+
+        :return: Random expiry date in MM/YY format.
+        """
+        return self.faker.credit_card_expire()
+
+    def cvv(self) -> str:
+        """
+        Generates random card security code.
+
+        :return: Random 3-digit code.
+        """
+        return self.faker.numerify('###')
+
+    def pin(self) -> str:
+        """
+        Generates random card PIN.
+
+        :return: Random 4-digit PIN.
+        """
+        return self.faker.numerify('####')
+
+    def past_date_time(self, start: str = '-1y') -> str:
+        """
+        Generates random moment in the past, i.e. to backdate historical operations.
+
+        :param start: Earliest moment relative to now in Faker notation, i.e. '-1y' or '-30d'.
+        :return: Random moment in ISO 8601 format.
+        """
+        return self.faker.date_time_between(start_date=start).isoformat()
 
     def float(self, start: int = 1, end: int = 100) -> float:
         """
@@ -118,7 +340,17 @@ class Fake:
 
         :return: Any amount from 1 to 1000.
         """
-        return self.float(1, 1000)
+        return self.pooled('amount', lambda: self.float(1, 1000))
 
 
 fake = Fake(faker=Faker())
+
+
+@events.init.add_listener
+def init_fake_pools(environment: Environment, **kwargs) -> None:
+    """
+    Prepares fake data pools configured with `FAKERS.POOL_SIZE` and `FAKERS.POOLS_DIR`
+    when Locust starts, rather than when the module is imported.
+    """
+    if settings.fakers.pool_size:
+        fake.use_pools(size=settings.fakers.pool_size, pools_dir=settings.fakers.pools_dir)
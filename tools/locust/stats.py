@@ -0,0 +1,164 @@
+import csv
+from types import SimpleNamespace
+from typing import Any, Callable
+
+from locust import events
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+from locust.stats import (
+    PERCENTILES_TO_REPORT,
+    RequestStats,
+    StatsCSV,
+    StatsEntry,
+    get_percentile_stats_summary,
+    get_stats_summary
+)
+
+from tools.logger import get_logger
+
+logger = get_logger('CUSTOM_STATS')
+
+CUSTOM_STATS_REPORT_KEY = 'custom_stats.'
+
+
+class CustomStats:
+    """
+    Statistics reported next to Locust request statistics without being counted as requests,
+    so they don't change request counts, RPS and the aggregated percentiles of the test.
+
+    Timings are kept in a separate RequestStats table (i.e. HTTP request phases by route), gauges are
+    current values computed on demand by the registered providers (i.e. seed users pool occupancy).
+    In distributed runs workers send both with their regular reports and master merges them
+    (see `init_custom_stats`).
+    The table is logged when Locust quits and saved to `<csv prefix>_<name>.csv` if Locust is run with `--csv`.
+    """
+
+    def __init__(self, name: str, environment: Environment):
+        """
+        :param name: Name of the statistics in the logs, reports and CSV file names, i.e. 'http_phases'.
+        :param environment: Locust environment.
+        """
+        self.name = name
+        self.environment = environment
+        self.stats = RequestStats(use_response_times_cache=False)
+        self.gauge_providers: list[Callable[[], dict[str, float]]] = []
+        self.worker_gauges: dict[str, dict[str, float]] = {}
+
+        environment.events.test_start.add_listener(self.on_test_start)
+        if isinstance(environment.runner, WorkerRunner):
+            environment.events.report_to_master.add_listener(self.on_report_to_master)
+        else:
+            environment.events.quitting.add_listener(self.on_quitting)
+
+    def log(self, method: str, name: str, value: float, error: Exception | str | None = None) -> None:
+        """
+        Adds a timing to the table.
+
+        :param method: Type of the timing, i.e. 'HTTP_CONNECT'.
+        :param name: Name of the timing, i.e. the request route.
+        :param value: Time in milliseconds.
+        :param error: Error the timed action failed with, if any.
+        """
+        self.stats.log_request(method, name, value, 0)
+        if error is not None:
+            self.stats.log_error(method, name, error)
+
+    def add_gauges(self, provider: Callable[[], dict[str, float]]) -> None:
+        """
+        :param provider: Returns current gauge values by name, values of the workers are summed up on master.
+        """
+        self.gauge_providers.append(provider)
+
+    def get_gauges(self) -> dict[str, float]:
+        gauges: dict[str, float] = {}
+        for values in [*self.worker_gauges.values(), *(provider() for provider in self.gauge_providers)]:
+            for name, value in values.items():
+                gauges[name] = gauges.get(name, 0) + value
+
+        return gauges
+
+    def log_summary(self) -> None:
+        if self.stats.total.num_requests:
+            for line in get_stats_summary(self.stats, current=False) + get_percentile_stats_summary(self.stats):
+                logger.info(f'{self.name}: {line}')
+
+        gauges = self.get_gauges()
+        if gauges:
+            logger.info(f'{self.name}: ' + ', '.join(f'{name} {value:g}' for name, value in gauges.items()))
+
+    def save_csv(self, path: str) -> None:
+        with open(path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            StatsCSV(SimpleNamespace(stats=self.stats), PERCENTILES_TO_REPORT).requests_csv(writer)
+            for name, value in self.get_gauges().items():
+                writer.writerow(['GAUGE', name, value])
+
+    def on_test_start(self, **kwargs) -> None:
+        self.stats.reset_all()
+
+    def on_report_to_master(self, client_id: str, data: dict[str, Any]) -> None:
+        data[CUSTOM_STATS_REPORT_KEY + self.name] = {
+            'stats': self.stats.serialize_stats(),
+            'stats_total': self.stats.total.get_stripped_report(),
+            'gauges': self.get_gauges()
+        }
+        self.stats.errors = {}
+
+    def merge(self, client_id: str, report: dict[str, Any]) -> None:
+        """
+        Merges the statistics reported by a worker.
+
+        :param client_id: ID of the worker.
+        :param report: Statistics the worker sent with its report (see `on_report_to_master`).
+        """
+        for entry_data in report['stats']:
+            entry = StatsEntry.unserialize(entry_data)
+            key = (entry.name, entry.method)
+            if key not in self.stats.entries:
+                self.stats.entries[key] = StatsEntry(self.stats, entry.name, entry.method)
+            self.stats.entries[key].extend(entry)
+
+        self.stats.total.extend(StatsEntry.unserialize(report['stats_total']))
+        self.worker_gauges[client_id] = report['gauges']
+
+    def on_quitting(self, **kwargs) -> None:
+        self.log_summary()
+
+        csv_prefix = getattr(self.environment.parsed_options, 'csv_prefix', None)
+        if csv_prefix:
+            self.save_csv(f'{csv_prefix}_{self.name}.csv')
+
+
+def get_custom_stats(environment: Environment, name: str) -> CustomStats:
+    """
+    Returns custom statistics of the given name, creating them on the first call.
+    Statistics are kept in `environment.custom_stats`, so every client and pool of the process shares them.
+
+    :param environment: Locust environment.
+    :param name: Name of the statistics, i.e. 'http_phases'.
+    :return: CustomStats instance.
+    """
+    registry: dict[str, CustomStats] | None = getattr(environment, 'custom_stats', None)
+    if registry is None:
+        registry = environment.custom_stats = {}
+
+    if name not in registry:
+        registry[name] = CustomStats(name, environment)
+
+    return registry[name]
+
+
+@events.init.add_listener
+def init_custom_stats(environment: Environment, **kwargs) -> None:
+    """
+    Master runs no virtual users, so it creates the custom statistics as the workers report them.
+    """
+    if not isinstance(environment.runner, MasterRunner):
+        return
+
+    def on_worker_report(client_id: str, data: dict[str, Any], **kwargs) -> None:
+        for key, report in data.items():
+            if key.startswith(CUSTOM_STATS_REPORT_KEY):
+                get_custom_stats(environment, key.removeprefix(CUSTOM_STATS_REPORT_KEY)).merge(client_id, report)
+
+    environment.events.worker_report.add_listener(on_worker_report)
@@ -0,0 +1,30 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+# Tag of the requests made by the current virtual user, i.e. 'hot' or 'cold' (see `stats_tag`)
+current_stats_tag: ContextVar[str | None] = ContextVar('current_stats_tag', default=None)
+
+
+@contextmanager
+def stats_tag(tag: str | None) -> Iterator[None]:
+    """
+    Tags Locust statistics of the requests made within the block, so they are reported separately,
+    i.e. 'POST /api/v1/operations/make-purchase-operation [hot]'. None — requests aren't tagged.
+
+    :param tag: Tag appended to the request names.
+    """
+    token = current_stats_tag.set(tag)
+    try:
+        yield
+    finally:
+        current_stats_tag.reset(token)
+
+
+def get_stats_name(name: str) -> str:
+    """
+    :param name: Request name, i.e. 'GET /api/v1/accounts'.
+    :return: Request name with the tag of the current block, if any.
+    """
+    tag = current_stats_tag.get()
+    return f'{name} [{tag}]' if tag else name
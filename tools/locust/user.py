@@ -1,16 +1,53 @@
-from locust import User, between
+import itertools
+from contextvars import ContextVar
+
+from locust import User, events
 
 from config import settings
+from tools.rng import build_random, current_random, get_random
+
+# Number of the virtual user within the process, users are spawned in the same order on every run,
+# numbering starts over on every test start (see `reset_user_indexes`)
+USER_INDEXES = itertools.count()
+
+# Index of the virtual user running in the current greenlet, None outside virtual users
+current_user_index: ContextVar[int | None] = ContextVar('current_user_index', default=None)
+
+
+@events.test_start.add_listener
+def reset_user_indexes(**kwargs) -> None:
+    """
+    Virtual users of a restarted test (i.e. from the web UI) get the same indexes, and so the same
+    random streams and shared HTTP clients, as the users of the first test.
+    """
+    global USER_INDEXES
+    USER_INDEXES = itertools.count()
 
 
 class LocustBaseUser(User):
     """
     Base virtual Locust User inherited by all the load tests scenarios.
     Holds common settings which can be overridden if necessary.
+
+    Every virtual user draws fake data, tasks, wait times and seed users from its own random stream
+    derived from the run seed, the worker index and the user index (see `tools.rng`),
+    so users don't affect each other's streams however their requests interleave.
     """
     host: str = 'localhost'  # Fiction host to conform to Locust API
     abstract = True  # Flags that the class shouldn't be used directly
-    wait_time = between(
-        min_wait=settings.locust_user.wait_time_min,
-        max_wait=settings.locust_user.wait_time_max
-    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.user_index = next(USER_INDEXES)
+
+    def on_start(self) -> None:
+        """
+        The method is called in the user greenlet before the tasks, so the user random stream is used
+        by everything the user does.
+        """
+        current_user_index.set(self.user_index)
+        worker_index = getattr(self.environment.runner, 'worker_index', 0)
+        current_random.set(build_random('user', worker_index, self.user_index))
+
+    def wait_time(self) -> float:
+        return get_random().uniform(settings.locust_user.wait_time_min, settings.locust_user.wait_time_max)
@@ -0,0 +1,47 @@
+import hashlib
+import random
+from contextvars import ContextVar
+
+from config import settings
+
+
+def derive_seed(*parts: object) -> int:
+    """
+    Derives a sub-seed from the run seed (`SEED`), i.e. for a worker or a virtual user.
+    The same run seed and parts always give the same sub-seed.
+
+    :param parts: Parts identifying the random stream, i.e. ('user', worker_index, user_index).
+    :return: 64-bit sub-seed.
+    """
+    payload = ':'.join(str(part) for part in (settings.seed, *parts))
+    return int.from_bytes(hashlib.sha256(payload.encode('utf-8')).digest()[:8], 'big')
+
+
+def build_random(*parts: object) -> random.Random:
+    """
+    Creates a random stream seeded with the sub-seed derived from the passed parts (see `derive_seed`).
+    Without the run seed the stream is seeded from the system entropy as usual.
+
+    :param parts: Parts identifying the random stream.
+    :return: Random instance.
+    """
+    if settings.seed is None:
+        return random.Random()
+
+    return random.Random(derive_seed(*parts))
+
+
+# Random stream of the current greenlet: every virtual user gets its own one (see LocustBaseUser),
+# everything else shares the process stream
+current_random: ContextVar[random.Random] = ContextVar('current_random', default=build_random('process'))
+
+
+def get_random() -> random.Random:
+    """
+    Returns the random stream of the current greenlet.
+    Everything random in test data generation and user behaviour has to be drawn from it,
+    so that a run with the same seed is reproducible.
+
+    :return: Random instance.
+    """
+    return current_random.get()